@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for turning synthesized audio into 20 ms LiveKit frames.
+
+Compares chunk_audio (list of sliced bytes per payload) with the streaming
+AudioChunker (memoryview slices, partial chunks carried across payloads).
+Both paths end in rtc.AudioFrame construction, as in _handle_audio_chunk.
+
+Usage:
+    python benchmarks/bench_chunking.py [--seconds N] [--payload-bytes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.plugins.azure.realtime import utils
+
+SAMPLE_RATE = 24000
+CHUNK_MS = 20
+
+
+def _legacy(payloads: list) -> int:
+    frames = 0
+    for payload in payloads:
+        for chunk in utils.chunk_audio(payload, chunk_duration_ms=CHUNK_MS, sample_rate=SAMPLE_RATE):
+            if not chunk:
+                continue
+            rtc.AudioFrame(chunk, SAMPLE_RATE, 1, len(chunk) // 2)
+            frames += 1
+    return frames
+
+
+def _streaming(payloads: list) -> int:
+    frames = 0
+    chunker = utils.AudioChunker(chunk_duration_ms=CHUNK_MS, sample_rate=SAMPLE_RATE)
+    for payload in payloads:
+        for chunk in chunker.push(payload):
+            rtc.AudioFrame(chunk.tobytes(), SAMPLE_RATE, 1, len(chunk) // 2)
+            frames += 1
+    tail = chunker.flush()
+    if tail is not None:
+        rtc.AudioFrame(tail.tobytes(), SAMPLE_RATE, 1, len(tail) // 2)
+        frames += 1
+    return frames
+
+
+def _run(fn, payloads: list) -> tuple:
+    start = time.perf_counter()
+    frames = fn(payloads)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(payloads)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, frames, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=30.0, help="utterance length")
+    parser.add_argument("--payload-bytes", type=int, default=4802, help="bytes per synthesizing event (even)")
+    parser.add_argument("--languages", type=int, default=8, help="utterances per run")
+    args = parser.parse_args()
+
+    audio = os.urandom(int(SAMPLE_RATE * args.seconds) * 2)
+    payloads = [
+        audio[i : i + args.payload_bytes] for i in range(0, len(audio), args.payload_bytes)
+    ] * args.languages
+
+    print(
+        f"{args.languages} x {args.seconds:.0f} s at {SAMPLE_RATE} Hz, "
+        f"{args.payload_bytes}-byte payloads"
+    )
+    for name, fn in (("chunk_audio", _legacy), ("AudioChunker", _streaming)):
+        elapsed, frames, peak = _run(fn, payloads)
+        print(
+            f"  {name:<13} {elapsed * 1e3:8.1f} ms  {frames:6d} frames  "
+            f"{elapsed / frames * 1e6:6.2f} us/frame  peak alloc {peak / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
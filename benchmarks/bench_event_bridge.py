@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for handing Speech SDK events to the event loop.
+
+Each simulated session has its own callback thread (as SDK recognizers do)
+posting synthesizing-sized events at a steady rate, while the loop runs other
+agent work in slices of --busy-ms. Compares one loop.call_soon_threadsafe per
+event with the shared LoopBridge, reporting loop wakeups and CPU time spent by
+the loop thread.
+
+Usage:
+    python benchmarks/bench_event_bridge.py [--sessions N] [--seconds N] [--interval-ms N] [--busy-ms N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.bridge import LoopBridge
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.handled = 0
+
+    def handle(self, payload: bytes) -> None:
+        self.handled += 1
+
+
+async def _busy(stop: threading.Event, busy: float) -> None:
+    # stands in for audio processing and other sessions' work on the same loop
+    while not stop.is_set():
+        end = time.perf_counter() + busy
+        while time.perf_counter() < end:
+            pass
+        await asyncio.sleep(0)
+
+
+async def _run(mode: str, sessions: int, seconds: float, interval: float, busy: float) -> tuple:
+    loop = asyncio.get_running_loop()
+    counter = _Counter()
+    bridge = LoopBridge(loop)
+    wakeups = [0]
+    payload = bytes(4800)
+    stop = threading.Event()
+
+    posted = [0] * sessions
+
+    def sdk_thread(index: int) -> None:
+        next_at = time.monotonic()
+        while not stop.is_set():
+            posted[index] += 1
+            if mode == "bridge":
+                bridge.post(counter.handle, payload)
+            else:
+                wakeups[0] += 1  # not exact across threads, good enough for a count
+                loop.call_soon_threadsafe(counter.handle, payload)
+            next_at += interval
+            time.sleep(max(0.0, next_at - time.monotonic()))
+
+    threads = [threading.Thread(target=sdk_thread, args=(i,), daemon=True) for i in range(sessions)]
+    cpu_start = time.thread_time()
+    for thread in threads:
+        thread.start()
+    load = asyncio.create_task(_busy(stop, busy)) if busy > 0 else None
+    await asyncio.sleep(seconds)
+    stop.set()
+    if load is not None:
+        await load
+    for thread in threads:
+        await asyncio.to_thread(thread.join)
+    await asyncio.sleep(0.1)
+    cpu = time.thread_time() - cpu_start
+
+    if mode == "bridge":
+        wakeups[0] = bridge.stats().wakeups
+    assert counter.handled == sum(posted), "events were lost"
+    return counter.handled, wakeups[0], cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="concurrent sessions")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration per mode")
+    parser.add_argument("--interval-ms", type=float, default=20.0, help="time between events per session")
+    parser.add_argument("--busy-ms", type=float, default=0.0, help="loop work per slice (0: idle loop)")
+    args = parser.parse_args()
+
+    print(
+        f"{args.sessions} sessions, one event every {args.interval_ms:.0f} ms each, "
+        f"{args.seconds:.0f} s per mode, loop busy slices {args.busy_ms:.1f} ms"
+    )
+    for mode in ("call_soon_threadsafe", "bridge"):
+        events, wakeups, cpu = asyncio.run(
+            _run(mode, args.sessions, args.seconds, args.interval_ms / 1000.0, args.busy_ms / 1000.0)
+        )
+        print(
+            f"  {mode:<21} {events:8d} events  {wakeups:8d} wakeups  "
+            f"{events / max(wakeups, 1):6.1f} events/wakeup  loop cpu {cpu * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
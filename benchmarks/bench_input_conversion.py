@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmark for the input conversion path of LiveInterpreterSession.
+
+Compares the per-frame CPU cost of the original tobytes() + audioop.tomono +
+AudioFrame rebuild path against InputConverter for 48 kHz mono and stereo
+input. Output is written to a real Speech SDK PushAudioInputStream, so the
+cost of handing each buffer to the native library is included.
+
+Usage:
+    python benchmarks/bench_input_conversion.py [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+import azure.cognitiveservices.speech as speechsdk
+from livekit import rtc
+from livekit.plugins.azure.realtime.ingest import InputConverter
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+
+def _stream(sample_rate: int) -> speechsdk.audio.PushAudioInputStream:
+    audio_format = speechsdk.audio.AudioStreamFormat(
+        samples_per_second=sample_rate, bits_per_sample=16, channels=1
+    )
+    return speechsdk.audio.PushAudioInputStream(audio_format)
+
+
+def _make_frames(count: int, sample_rate: int, channels: int, frame_ms: int = 10) -> list:
+    samples_per_channel = sample_rate * frame_ms // 1000
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        data = rng.integers(-20000, 20000, samples_per_channel * channels, dtype=np.int16)
+        frames.append(rtc.AudioFrame(data.tobytes(), sample_rate, channels, samples_per_channel))
+    return frames
+
+
+def _legacy(frames: list, output_rate: int, stream) -> None:
+    resampler = None
+    for frame in frames:
+        data = frame.data.tobytes()
+        channels = frame.num_channels
+        if channels > 1:
+            data = audioop.tomono(data, 2, 0.5, 0.5)
+            channels = 1
+        samples_per_channel = len(data) // (2 * channels)
+        if frame.sample_rate != output_rate:
+            if resampler is None:
+                resampler = rtc.AudioResampler(
+                    input_rate=frame.sample_rate, output_rate=output_rate, num_channels=channels
+                )
+            input_frame = rtc.AudioFrame(data, frame.sample_rate, channels, samples_per_channel)
+            for resampled in resampler.push(input_frame):
+                stream.write(resampled.data.tobytes())
+        else:
+            stream.write(data)
+
+
+def _converter(frames: list, output_rate: int, stream) -> None:
+    converter = InputConverter(output_rate=output_rate)
+    for frame in frames:
+        for buf in converter.convert(frame):
+            stream.write(buf)
+
+
+def _measure(fn, frames: list, output_rate: int, repeat: int = 5) -> float:
+    fn(frames[:50], output_rate, _stream(output_rate))  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        stream = _stream(output_rate)
+        start = time.perf_counter()
+        fn(frames, output_rate, stream)
+        best = min(best, time.perf_counter() - start)
+        stream.close()
+    return best / len(frames) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000, help="number of frames per run")
+    args = parser.parse_args()
+
+    for channels, layout in ((1, "mono"), (2, "stereo")):
+        print(f"48 kHz {layout} input (us/frame)")
+        for frame_ms in (10, 20, 100):
+            frames = _make_frames(args.frames, 48000, channels, frame_ms)
+            for output_rate in (48000, 16000):
+                new = _measure(_converter, frames, output_rate)
+                label = f"  {frame_ms:>3} ms -> {output_rate:>5} Hz"
+                if audioop is not None:
+                    old = _measure(_legacy, frames, output_rate)
+                    print(f"{label}  legacy {old:8.2f}  converter {new:8.2f}  ({old / new:4.2f}x)")
+                else:
+                    print(f"{label}  converter {new:8.2f}  (audioop unavailable)")
+
+
+if __name__ == "__main__":
+    main()
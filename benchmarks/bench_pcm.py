@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput benchmark for livekit.plugins.azure.realtime.pcm.
+
+Reports how many seconds of 48 kHz stereo audio each implementation processes
+per second of CPU time, next to audioop where the interpreter still ships it.
+
+Usage:
+    python benchmarks/bench_pcm.py [--seconds N] [--chunk-ms N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime import pcm
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+SAMPLE_RATE = 48000
+
+
+def _throughput(fn, chunks: list, audio_seconds: float) -> float:
+    start = time.process_time()
+    for chunk in chunks:
+        fn(chunk)
+    elapsed = time.process_time() - start
+    return audio_seconds / elapsed if elapsed > 0 else float("inf")
+
+
+def _resample(impl: str):
+    resampler = pcm.DownmixResampler(SAMPLE_RATE, 16000, num_channels=2)
+    return resampler._push_np if impl == "numpy" else resampler._push_py
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0, help="seconds of audio per run")
+    parser.add_argument("--chunk-ms", type=int, default=20, help="chunk size in milliseconds")
+    args = parser.parse_args()
+
+    samples_per_chunk = SAMPLE_RATE * args.chunk_ms // 1000
+    num_chunks = int(args.seconds * 1000 / args.chunk_ms)
+    rng = np.random.default_rng(0)
+    stereo = [
+        rng.integers(-20000, 20000, samples_per_chunk * 2, dtype=np.int16).tobytes()
+        for _ in range(num_chunks)
+    ]
+    mono = [chunk[: len(chunk) // 2] for chunk in stereo]
+
+    cases = {
+        "downmix": {
+            "numpy": lambda c: pcm._downmix_np(c, 2),
+            "python": lambda c: pcm._downmix_py(c, 2),
+            "audioop": audioop and (lambda c: audioop.tomono(c, 2, 0.5, 0.5)),
+        },
+        "gain x0.8": {
+            "numpy": lambda c: pcm._apply_gain_np(c, 0.8),
+            "python": lambda c: pcm._apply_gain_py(c, 0.8),
+            "audioop": audioop and (lambda c: audioop.mul(c, 2, 0.8)),
+        },
+        "resample+downmix 48k->16k": {
+            "numpy": _resample("numpy"),
+            "python": _resample("python"),
+            "audioop": audioop
+            and (lambda c: audioop.ratecv(audioop.tomono(c, 2, 0.5, 0.5), 2, 1, SAMPLE_RATE, 16000, None)),
+        },
+    }
+
+    print(f"{args.chunk_ms} ms chunks of 48 kHz 16-bit audio (x realtime, higher is better)")
+    for name, impls in cases.items():
+        inputs = mono if name.startswith("gain") else stereo
+        row = []
+        for impl, fn in impls.items():
+            if not fn:
+                row.append(f"{impl} {'n/a':>8}")
+                continue
+            row.append(f"{impl} {_throughput(fn, inputs, args.seconds):8.0f}")
+        print(f"  {name:<26} " + "  ".join(row))
+
+
+if __name__ == "__main__":
+    main()
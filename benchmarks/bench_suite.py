@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Regression benchmarks for the session hot paths, checked against baselines.
+
+Runs offline: sessions use the scripted FakeSpeechBackend, so no credentials
+or network are needed. Cases:
+
+  push_audio/<rate>-<layout>-<n>ms  _push_audio_async per n ms input frame
+  synthesis/<n>s                   _handle_audio_chunk (decode, chunk, frames) per n s clip
+  bridge/<n>-sessions              SDK thread to loop handoff per event, n posting threads
+  finalize/ctx-<n>                 _finalize_generation with n chat context items
+
+Each case reports the median of --repeat runs. Every run is also divided by a
+fixed pure-Python calibration workload timed just before it, and baselines
+are compared in those units, so they hold across machines and load. A case
+fails when it is more than --tolerance slower than its baseline.
+
+Usage:
+    python benchmarks/bench_suite.py [--only PREFIX] [--repeat N] [--tolerance F]
+    python benchmarks/bench_suite.py --update      # record new baselines
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Awaitable, Callable
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.agents import llm
+from livekit.plugins.azure import realtime
+from livekit.plugins.azure.realtime.bridge import LoopBridge
+from livekit.plugins.azure.realtime.fake import FakeScript, FakeSpeechBackend, FakeUtterance
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+PUSH_RATES = (16000, 24000, 48000)
+PUSH_FRAME_MS = (10, 20)
+CLIP_SECONDS = (1, 5, 10, 30)
+BRIDGE_SESSIONS = (1, 50, 200)
+CHAT_CTX_SIZES = (0, 1000, 10000)
+
+# per synthesizing event: 100 ms at 24 kHz, the service's usual payload
+_PAYLOAD_BYTES = 4800
+
+
+def _model(**kwargs):
+    # one utterance longer than any run, so the fake service stays silent
+    script = FakeScript(utterances=[FakeUtterance(text="-", duration_ms=10**9)], loop=False)
+    return realtime.LiveInterpreterModel(
+        subscription_key="offline",
+        region="offline",
+        target_languages=["fr"],
+        backend=FakeSpeechBackend(script, connect_latency=0.0),
+        **kwargs,
+    )
+
+
+def _calibrate() -> float:
+    """Seconds for a fixed mix of bytecode, allocation and buffer copies."""
+    start = time.perf_counter()
+    total = 0
+    items = []
+    for i in range(200_000):
+        total += i * i % 7
+        items.append((i, total))
+    data = bytes(4096)
+    for _ in range(20_000):
+        memoryview(data)[:2048].tobytes()
+    return time.perf_counter() - start
+
+
+async def _push_audio(sample_rate: int, channels: int, frame_ms: int, frames: int) -> float:
+    samples = sample_rate * frame_ms // 1000
+    rng = np.random.default_rng(0)
+    audio = [
+        rtc.AudioFrame(
+            rng.integers(-3000, 3000, samples * channels, dtype=np.int16).tobytes(),
+            sample_rate,
+            channels,
+            samples,
+        )
+        for _ in range(64)
+    ]
+    session = _model(use_personal_voice=False).session()
+    await session._ensure_started()
+
+    start = time.perf_counter()
+    for i in range(frames):
+        await session._push_audio_async(audio[i % len(audio)])
+    elapsed = time.perf_counter() - start
+
+    await session.aclose()
+    return elapsed / frames
+
+
+async def _synthesis(seconds: int, clips: int) -> float:
+    session = _model(use_personal_voice=True).session()
+    audio = os.urandom(24000 * 2 * seconds)
+    payloads = [audio[i : i + _PAYLOAD_BYTES] for i in range(0, len(audio), _PAYLOAD_BYTES)]
+
+    elapsed = 0.0
+    for _ in range(clips):
+        generation = session._ensure_generation()
+        start = time.perf_counter()
+        for payload in payloads:
+            session._handle_audio_chunk(payload)
+        session._handle_audio_chunk(b"")
+        elapsed += time.perf_counter() - start
+        session._finalize_generation(False, generation)
+
+    await session.aclose()
+    return elapsed / clips
+
+
+async def _bridge(sessions: int, events: int) -> float:
+    bridge = LoopBridge(asyncio.get_running_loop())
+    handled = [0]
+    total = sessions * events
+    done = asyncio.Event()
+    payload = bytes(_PAYLOAD_BYTES)
+
+    def handle(data: bytes) -> None:
+        handled[0] += 1
+        if handled[0] == total:
+            done.set()
+
+    def sdk_thread() -> None:
+        for _ in range(events):
+            bridge.post(handle, payload)
+
+    threads = [threading.Thread(target=sdk_thread, daemon=True) for _ in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    for thread in threads:
+        thread.join()
+    return elapsed / total
+
+
+async def _finalize(ctx_size: int, generations: int) -> float:
+    session = _model(use_personal_voice=False).session()
+    chat_ctx = llm.ChatContext.empty()
+    for i in range(ctx_size):
+        chat_ctx.add_message(role="assistant", content=f"earlier translation {i}")
+    await session.update_chat_ctx(chat_ctx)
+
+    elapsed = 0.0
+    for _ in range(generations):
+        generation = session._ensure_generation()
+        generation.output_text.append("[fr] bonjour")
+        start = time.perf_counter()
+        session._finalize_generation(False, generation)
+        elapsed += time.perf_counter() - start
+
+    await session.aclose()
+    return elapsed / generations
+
+
+def cases(scale: float = 1.0) -> dict[str, Callable[[], Awaitable[float]]]:
+    """Benchmark cases by name; ``scale`` shrinks the work for smoke runs."""
+    n = lambda count: max(1, int(count * scale))  # noqa: E731
+    found: dict[str, Callable[[], Awaitable[float]]] = {}
+    for rate in PUSH_RATES:
+        for channels, layout in ((1, "mono"), (2, "stereo")):
+            for frame_ms in PUSH_FRAME_MS:
+                found[f"push_audio/{rate // 1000}k-{layout}-{frame_ms}ms"] = (
+                    lambda r=rate, c=channels, f=frame_ms: _push_audio(r, c, f, n(3000))
+                )
+    for seconds in CLIP_SECONDS:
+        # about a minute of audio per run, whatever the clip length
+        found[f"synthesis/{seconds}s"] = lambda s=seconds: _synthesis(s, n(60) // s + 1)
+    for sessions in BRIDGE_SESSIONS:
+        found[f"bridge/{sessions}-sessions"] = (
+            lambda s=sessions: _bridge(s, n(20000) // s + 1)
+        )
+    for size in CHAT_CTX_SIZES:
+        found[f"finalize/ctx-{size}"] = lambda s=size: _finalize(s, n(300))
+    return found
+
+
+def _load_baselines() -> dict:
+    if not os.path.exists(BASELINES):
+        return {}
+    with open(BASELINES, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--only", default="", help="run cases whose name starts with this")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the median is kept")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown (0.5: 50%%)")
+    parser.add_argument("--update", action="store_true", help="write results as the new baselines")
+    args = parser.parse_args()
+
+    baselines = _load_baselines().get("cases", {})
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+
+    for name, case in cases().items():
+        if not name.startswith(args.only):
+            continue
+        # calibrated next to each run, so clock and load drift during the suite cancel out
+        runs = []
+        for _ in range(args.repeat):
+            calibration = _calibrate()
+            runs.append((asyncio.run(case()), calibration))
+        value = statistics.median(seconds for seconds, _ in runs)
+        units = value / statistics.median(calibration for _, calibration in runs)
+        results[name] = {"seconds": value, "units": units}
+
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"  {name:<28} {value * 1e6:12.2f} us  (no baseline)")
+            continue
+        ratio = units / baseline["units"]
+        status = "ok"
+        if ratio > 1 + args.tolerance:
+            status = "REGRESSION"
+            regressions.append(name)
+        print(
+            f"  {name:<28} {value * 1e6:12.2f} us  baseline {baseline['seconds'] * 1e6:12.2f} us  "
+            f"{(ratio - 1) * 100:+6.1f}%  {status}"
+        )
+
+    if args.update:
+        with open(BASELINES, "w", encoding="utf-8") as f:
+            json.dump({"cases": {**baselines, **results}}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"wrote {len(results)} baselines to {BASELINES}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
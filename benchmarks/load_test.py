@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Load test: how many Live Interpreter sessions one worker process sustains.
+
+For each step in --sessions, a fresh process opens N sessions configured as in
+examples/multi_language_meeting.py (8 target languages, personal voice, 16 kHz),
+backed by the scripted FakeSpeechBackend. Each session is fed 48 kHz mono
+10 ms frames paced in real time, as a room track delivers them, and its text
+and audio output is drained like AgentSession does. Reported per step:
+
+  cpu/session   process CPU (all threads) per session, in % of one core
+  rss/session   RSS growth from before the sessions opened, per session
+  loop lag      how late a 10 ms timer fires on the event loop, p50/p99/max
+  late feeds    frames pushed more than one frame period behind schedule
+  dropped       frames dropped by the sessions' input queues
+
+A step passes when p99 loop lag stays under --max-lag-ms and nothing was
+dropped; the largest passing N is reported as the capacity. The fake service
+costs far less CPU than the Speech SDK's native threads, so treat the result
+as an upper bound of what the plugin itself allows.
+
+Usage:
+    python benchmarks/load_test.py [--sessions 1,10,25,50,100] [--seconds N] [--max-lag-ms N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.plugins.azure import realtime
+from livekit.plugins.azure.realtime.fake import FakeScript, FakeSpeechBackend, FakeUtterance
+
+TARGET_LANGUAGES = ["fr", "es", "de", "zh-Hans", "ja", "ko", "ar", "ru"]
+
+INPUT_SAMPLE_RATE = 48000
+FRAME_MS = 10
+
+
+def _script() -> FakeScript:
+    # a speaker alternating 3 s sentences with pauses, voiced for about 2.5 s each
+    return FakeScript(
+        utterances=[
+            FakeUtterance(
+                text=f"this is sentence number {i} of the meeting",
+                translations={lang: f"[{lang}] sentence {i}" for lang in TARGET_LANGUAGES},
+                duration_ms=3000 + 500 * (i % 3),
+                synthesis_ms=2500,
+            )
+            for i in range(6)
+        ]
+    )
+
+
+def _model(args) -> realtime.LiveInterpreterModel:
+    return realtime.LiveInterpreterModel(
+        subscription_key="offline",
+        region="offline",
+        target_languages=TARGET_LANGUAGES,
+        use_personal_voice=True,
+        sample_rate=16000,
+        enable_word_level_timestamps=True,
+        profanity_option="masked",
+        backend=FakeSpeechBackend(
+            _script(),
+            connect_latency=args.connect_latency,
+            recognition_latency=args.recognition_latency,
+            synthesis_latency=args.synthesis_latency,
+        ),
+    )
+
+
+async def _feed(session, frames: list, seconds: float, offset: float, late: list) -> None:
+    loop = asyncio.get_running_loop()
+    period = FRAME_MS / 1000.0
+    await asyncio.sleep(offset)
+    next_at = loop.time()
+    for i in range(int(seconds / period)):
+        now = loop.time()
+        if now - next_at > period:
+            late[0] += 1
+        session.push_audio(frames[i % len(frames)])
+        next_at += period
+        await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+
+async def _drain_generation(event) -> None:
+    async for message in event.message_stream:
+
+        async def text() -> None:
+            async for _ in message.text_stream:
+                pass
+
+        async def audio() -> None:
+            async for _ in message.audio_stream:
+                pass
+
+        await asyncio.gather(text(), audio())
+
+
+async def _watch_lag(lags: list, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    period = FRAME_MS / 1000.0
+    while not stop.is_set():
+        expected = loop.time() + period
+        await asyncio.sleep(period)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def _run_step(sessions: int, args) -> dict:
+    process = psutil.Process()
+    rng = np.random.default_rng(0)
+    samples = INPUT_SAMPLE_RATE * FRAME_MS // 1000
+    frames = [
+        rtc.AudioFrame(
+            rng.integers(-3000, 3000, samples, dtype=np.int16).tobytes(), INPUT_SAMPLE_RATE, 1, samples
+        )
+        for _ in range(100)
+    ]
+
+    rss_before = process.memory_info().rss
+    model = _model(args)
+    opened = [model.session() for _ in range(sessions)]
+    drains: list[asyncio.Task] = []
+    for session in opened:
+        session.on(
+            "generation_created", lambda event: drains.append(asyncio.create_task(_drain_generation(event)))
+        )
+
+    late = [0]
+    lags: list[float] = []
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(_watch_lag(lags, stop))
+    feeders = [
+        asyncio.create_task(
+            _feed(session, frames, args.warmup + args.seconds, i * FRAME_MS / 1000.0 / sessions, late)
+        )
+        for i, session in enumerate(opened)
+    ]
+
+    # measure once every session connected and its first utterances went through
+    await asyncio.sleep(args.warmup)
+    lags.clear()
+    late[0] = 0
+    dropped_before = sum(session.input_stats.dropped_frames for session in opened)
+    cpu_start = process.cpu_times()
+    wall_start = time.monotonic()
+    await asyncio.gather(*feeders)
+    wall = time.monotonic() - wall_start
+    cpu_end = process.cpu_times()
+    rss_after = process.memory_info().rss
+    stop.set()
+    await watcher
+
+    dropped = sum(session.input_stats.dropped_frames for session in opened) - dropped_before
+    # summaries are None until a session finished a generation
+    summaries = [s.latency_stats.end_to_end for s in opened if s.latency_stats.end_to_end is not None]
+    generations = sum(summary.count for summary in summaries)
+    end_to_end = [summary.p50 for summary in summaries]
+    await asyncio.gather(*(session.aclose() for session in opened))
+    await model.aclose()
+    for task in drains:
+        task.cancel()
+
+    cpu = (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system)
+    lags.sort()
+    return {
+        "sessions": sessions,
+        "cpu_per_session": cpu / wall / sessions,
+        "cpu_total": cpu / wall,
+        "rss_per_session": (rss_after - rss_before) / sessions,
+        "lag_p50": lags[len(lags) // 2] if lags else 0.0,
+        "lag_p99": lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0,
+        "lag_max": lags[-1] if lags else 0.0,
+        "late_feeds": late[0],
+        "dropped_frames": dropped,
+        "generations": generations,
+        "end_to_end_p50": statistics.median(end_to_end) if end_to_end else None,
+    }
+
+
+def _step_in_subprocess(sessions: int, argv: list) -> dict:
+    # a fresh interpreter per step, so RSS and CPU are not carried over
+    out = subprocess.run(
+        [sys.executable, __file__, "--step", str(sessions), *argv],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sessions", default="1,10,25,50,100", help="comma-separated session counts")
+    parser.add_argument("--seconds", type=float, default=20.0, help="measured duration per step")
+    parser.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds before each step")
+    parser.add_argument("--max-lag-ms", type=float, default=20.0, help="p99 loop lag a step may reach")
+    parser.add_argument("--connect-latency", type=float, default=0.3, help="fake recognizer start, s")
+    parser.add_argument("--recognition-latency", type=float, default=0.4, help="end of speech to final result, s")
+    parser.add_argument("--synthesis-latency", type=float, default=0.2, help="final result to first audio, s")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per step")
+    parser.add_argument("--step", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.step is not None:
+        print(json.dumps(asyncio.run(_run_step(args.step, args))))
+        return
+
+    argv = [
+        f"--seconds={args.seconds}",
+        f"--warmup={args.warmup}",
+        f"--connect-latency={args.connect_latency}",
+        f"--recognition-latency={args.recognition_latency}",
+        f"--synthesis-latency={args.synthesis_latency}",
+    ]
+    if not args.json:
+        print(
+            f"{len(TARGET_LANGUAGES)} target languages, {INPUT_SAMPLE_RATE // 1000} kHz input, "
+            f"{args.seconds:.0f} s per step after {args.warmup:.0f} s warmup"
+        )
+        print(
+            f"  {'sessions':>8} {'cpu/session':>12} {'cpu total':>10} {'rss/session':>12} "
+            f"{'lag p50/p99/max ms':>20} {'late':>6} {'dropped':>8} {'e2e p50':>8}"
+        )
+
+    capacity = 0
+    for sessions in (int(n) for n in args.sessions.split(",")):
+        result = _step_in_subprocess(sessions, argv)
+        passed = result["lag_p99"] * 1e3 < args.max_lag_ms and result["dropped_frames"] == 0
+        if passed:
+            capacity = sessions
+        if args.json:
+            print(json.dumps({**result, "passed": passed}))
+            continue
+
+        lag = f"{result['lag_p50'] * 1e3:.1f}/{result['lag_p99'] * 1e3:.1f}/{result['lag_max'] * 1e3:.0f}"
+        e2e = f"{result['end_to_end_p50']:.2f}s" if result["end_to_end_p50"] is not None else "-"
+        print(
+            f"  {sessions:>8} {result['cpu_per_session'] * 100:>11.2f}% {result['cpu_total'] * 100:>9.1f}% "
+            f"{result['rss_per_session'] / 2**20:>9.2f} MiB {lag:>20} {result['late_feeds']:>6} "
+            f"{result['dropped_frames']:>8} {e2e:>8}{'' if passed else '  over limit'}"
+        )
+
+    if not args.json:
+        print(f"capacity: {capacity} sessions (p99 loop lag < {args.max_lag_ms:.0f} ms, no dropped frames)")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,113 @@ class TranslationResult:
     """Timestamp of the result"""
 
 
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Service settings trading end-of-utterance latency against segmentation quality"""
+
+    segmentation_silence_timeout_ms: Optional[int] = None
+    """Silence that ends an utterance; None keeps the service default"""
+
+    initial_silence_timeout_ms: Optional[int] = None
+    """Leading silence after which the service gives up on an utterance"""
+
+    stable_partial_threshold: Optional[int] = None
+    """Partials a word must survive before it is reported as stable"""
+
+
+# Named presets for the latency_profile option. Shorter segmentation silence
+# finalizes sooner but splits sentences at hesitations.
+LATENCY_PROFILES = {
+    "default": LatencyProfile(),
+    "low-latency": LatencyProfile(
+        segmentation_silence_timeout_ms=300,
+        initial_silence_timeout_ms=5000,
+        stable_partial_threshold=2,
+    ),
+    "conference": LatencyProfile(
+        segmentation_silence_timeout_ms=600,
+        initial_silence_timeout_ms=15000,
+        stable_partial_threshold=3,
+    ),
+    "dictation": LatencyProfile(
+        segmentation_silence_timeout_ms=1200,
+        initial_silence_timeout_ms=30000,
+        stable_partial_threshold=5,
+    ),
+}
+
+LanguageIdMode = Literal["at_start", "continuous"]
+"""When the service identifies the source language: once per session, or for every utterance"""
+
+# most candidate languages the service accepts per language ID mode
+MAX_SOURCE_LANGUAGE_CANDIDATES = {"at_start": 4, "continuous": 10}
+
+
+@dataclass
+class InterpreterMetrics:
+    """Per-utterance metrics of a Live Interpreter session"""
+
+    timestamp: float
+    """Time the utterance's final result was handled"""
+
+    source_language: str
+    """Source language of the utterance, detected or fixed"""
+
+    language_id_mode: Literal["fixed", "auto", "at_start", "continuous"]
+    """How the source language was determined; ``"auto"`` is open-range identification
+    in the service's default mode"""
+
+    latency_profile: str = "default"
+    """Name of the latency profile in effect"""
+
+    language_detection_latency: Optional[float] = None
+    """Seconds of streamed audio between the utterance start and the first result
+    naming its language; None with a fixed source language"""
+
+
+@dataclass
+class GenerationMetrics:
+    """Latency and audio accounting of one generation, emitted after ``metrics_collected``
+
+    Latencies are measured on a monotonic clock from the time the input samples
+    that produced the generation were pushed, located by the service's result
+    offsets (or word timestamps, when requested)."""
+
+    request_id: str
+    """Matches ``request_id`` of the generation's ``RealtimeModelMetrics``"""
+
+    timestamp: float
+    """Wall-clock time the generation was created"""
+
+    target_languages: int
+    """Number of target languages translated"""
+
+    input_audio_duration: float = 0.0
+    """Seconds of speech recognized for the generation"""
+
+    output_audio_duration: float = 0.0
+    """Seconds of synthesized audio produced"""
+
+    speech_end_to_final_text: Optional[float] = None
+    """Seconds from the end of speech to the final translation"""
+
+    speech_end_to_first_audio: Optional[float] = None
+    """Seconds from the end of speech to the first synthesized audio frame"""
+
+    end_to_end_latency: Optional[float] = None
+    """Seconds from the end of speech to the first output the listener gets: the
+    synthesized voice, or the final text without audio output"""
+
+    lag_behind_live: Optional[float] = None
+    """Seconds from the start of speech to that first output"""
+
+    decode_time: float = 0.0
+    """Seconds spent decoding synthesized audio"""
+
+    chunk_time: float = 0.0
+    """Seconds spent chunking synthesized audio into frames"""
+
+
 @dataclass
 class LiveInterpreterConfig:
     """Configuration for Live Interpreter"""
@@ -75,6 +182,28 @@ class LiveInterpreterConfig:
     profanity_option: Literal["masked", "removed", "raw"] = "masked"
     """How to handle profanity in transcriptions"""
 
+    synthesis_sample_rate: Optional[int] = 24000
+    """Raw PCM rate of synthesized audio, or None for the service's default WAV output"""
+
+    latency_profile: str = "default"
+    """Key of ``LATENCY_PROFILES``"""
+
+    source_language: Optional[str] = None
+    """Fixed spoken language; skips language identification when set"""
+
+    source_languages: Optional[list[str]] = None
+    """Candidate spoken languages for identification, or None for all supported"""
+
+    language_id_mode: Optional[LanguageIdMode] = None
+    """When the spoken language is identified among ``source_languages``; continuous if None"""
+
+
+# Raw PCM synthesis output formats (16-bit mono) keyed by sample rate
+SYNTHESIS_OUTPUT_FORMATS = {
+    16000: "Raw16Khz16BitMonoPcm",
+    24000: "Raw24Khz16BitMonoPcm",
+    48000: "Raw48Khz16BitMonoPcm",
+}
 
 # Azure Speech Service V2 endpoint template
 V2_ENDPOINT_TEMPLATE = "wss://{region}.stt.speech.microsoft.com/speech/universal/v2"
@@ -14,11 +14,12 @@
 
 """Azure Live Interpreter realtime model for LiveKit Agents"""
 
-from .realtime_model import LiveInterpreterModel, LiveInterpreterSession
+from .realtime_model import LiveInterpreterModel, LiveInterpreterSession, prewarm
 
 __all__ = [
     "LiveInterpreterModel",
     "LiveInterpreterSession",
+    "prewarm",
 ]
 
 # Hide non-exported symbols from documentation
@@ -0,0 +1,130 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Recognizer backends: what a session connects its audio to"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Protocol
+
+import azure.cognitiveservices.speech as speechsdk
+
+from .. import models
+
+_LANGUAGE_ID_MODES = {"at_start": "AtStart", "continuous": "Continuous"}
+
+
+class RecognizerBackend(Protocol):
+    """
+    Creates recognizers for a session.
+
+    The returned recognizer must look like a Speech SDK
+    ``TranslationRecognizer``: ``recognizing``, ``recognized``,
+    ``synthesizing``, ``canceled``, ``session_started`` and
+    ``session_stopped`` signals with ``connect``/``disconnect_all``, and
+    blocking ``start_continuous_recognition``/``stop_continuous_recognition``.
+    The stream must accept ``write(buffer)`` and ``close()``. Events are
+    delivered on the backend's own threads, like the SDK does.
+    """
+
+    def create(self, config: models.LiveInterpreterConfig) -> tuple[Any, Any]:
+        """Return a new, not yet started recognizer and the stream feeding it."""
+        ...
+
+
+class AzureSpeechBackend:
+    """The Azure Speech Service, through the Speech SDK."""
+
+    def create(
+        self, config: models.LiveInterpreterConfig
+    ) -> tuple[speechsdk.translation.TranslationRecognizer, speechsdk.audio.PushAudioInputStream]:
+        endpoint = models.V2_ENDPOINT_TEMPLATE.format(region=config.region)
+
+        translation_config = speechsdk.translation.SpeechTranslationConfig(
+            endpoint=endpoint,
+            subscription=config.subscription_key,
+        )
+
+        for lang in config.target_languages:
+            translation_config.add_target_language(lang)
+
+        if config.use_personal_voice:
+            translation_config.voice_name = "personal-voice"
+            if config.speaker_profile_id:
+                translation_config.set_property(
+                    speechsdk.PropertyId.SpeechServiceResponse_RequestSpeakerProfileId,
+                    config.speaker_profile_id,
+                )
+            if config.synthesis_sample_rate is not None:
+                # raw PCM: chunks need neither container parsing nor rate detection
+                output_format = models.SYNTHESIS_OUTPUT_FORMATS[config.synthesis_sample_rate]
+                translation_config.set_speech_synthesis_output_format(
+                    getattr(speechsdk.SpeechSynthesisOutputFormat, output_format)
+                )
+
+        translation_config.set_profanity(
+            getattr(speechsdk.ProfanityOption, config.profanity_option.capitalize())
+        )
+
+        if config.enable_word_level_timestamps:
+            translation_config.request_word_level_timestamps()
+
+        profile = models.LATENCY_PROFILES[config.latency_profile]
+        for property_id, value in (
+            (
+                speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
+                profile.segmentation_silence_timeout_ms,
+            ),
+            (
+                speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs,
+                profile.initial_silence_timeout_ms,
+            ),
+            (
+                speechsdk.PropertyId.SpeechServiceResponse_StablePartialResultThreshold,
+                profile.stable_partial_threshold,
+            ),
+        ):
+            if value is not None:
+                translation_config.set_property(property_id, str(value))
+
+        auto_detect_config: Optional[speechsdk.AutoDetectSourceLanguageConfig] = None
+        if config.source_language is not None:
+            translation_config.speech_recognition_language = config.source_language
+        elif config.source_languages is not None:
+            # candidates spare the service open-ended identification on every utterance
+            translation_config.set_property(
+                speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
+                _LANGUAGE_ID_MODES[config.language_id_mode or "continuous"],
+            )
+            auto_detect_config = speechsdk.AutoDetectSourceLanguageConfig(
+                languages=config.source_languages
+            )
+        else:
+            # open range: the service's own identification mode, as before candidates existed
+            auto_detect_config = speechsdk.AutoDetectSourceLanguageConfig()
+
+        audio_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=config.sample_rate,
+            bits_per_sample=16,
+            channels=1,
+        )
+        audio_stream = speechsdk.audio.PushAudioInputStream(audio_format)
+        audio_config = speechsdk.audio.AudioConfig(stream=audio_stream)
+
+        recognizer = speechsdk.translation.TranslationRecognizer(
+            translation_config=translation_config,
+            auto_detect_source_language_config=auto_detect_config,
+            audio_config=audio_config,
+        )
+        return recognizer, audio_stream
@@ -0,0 +1,115 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalescing hand-off of Speech SDK events to the asyncio loop"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ..log import logger
+from . import telemetry
+
+
+@dataclass(frozen=True)
+class BridgeStats:
+    """Counters of an event bridge"""
+
+    delivered: int
+    """Events handed over from SDK threads and run on the loop"""
+
+    wakeups: int
+    """Times the loop was woken up to run them"""
+
+
+class LoopBridge:
+    """
+    Delivers calls from SDK threads to an event loop in batches.
+
+    ``loop.call_soon_threadsafe`` writes to the loop's self-pipe on every call.
+    The bridge queues calls in a deque instead and schedules a single drain
+    while one is not already pending, so a burst of events from any number of
+    sessions costs one wakeup. Calls run in the order they were posted.
+
+    Use ``for_loop`` to share one bridge between all sessions on a loop.
+    """
+
+    _bridges: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopBridge] = (
+        weakref.WeakKeyDictionary()
+    )
+    _bridges_lock = threading.Lock()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._pending: deque[tuple[Callable[..., Any], tuple[Any, ...]]] = deque()
+        self._schedule_lock = threading.Lock()
+        self._scheduled = False
+        self._scheduled_at = 0.0
+        self._delivered = 0
+        self._wakeups = 0
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop) -> LoopBridge:
+        with cls._bridges_lock:
+            bridge = cls._bridges.get(loop)
+            if bridge is None:
+                bridge = cls._bridges[loop] = cls(loop)
+            return bridge
+
+    def stats(self) -> BridgeStats:
+        return BridgeStats(delivered=self._delivered, wakeups=self._wakeups)
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule ``callback(*args)`` on the loop. Safe to call from any thread."""
+        # deque.append is atomic; the lock is only taken when a wakeup may be needed
+        self._pending.append((callback, args))
+        if self._scheduled:
+            return
+
+        with self._schedule_lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+            self._scheduled_at = time.monotonic()
+            self._wakeups += 1
+
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # loop closed: nothing will process the events any more
+            self._pending.clear()
+
+    def _drain(self) -> None:
+        # cleared before popping: an event appended after this point is either
+        # popped below or schedules the next drain
+        self._scheduled = False
+
+        instruments = telemetry.get()
+        if instruments is not None:
+            # wait of the batch's first event; later ones waited less
+            instruments.callback_latency.record(time.monotonic() - self._scheduled_at)
+
+        for _ in range(len(self._pending)):
+            callback, args = self._pending.popleft()
+            self._delivered += 1
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("error handling Live Interpreter event")
@@ -0,0 +1,148 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental decoder for synthesized audio delivered across SDK events"""
+
+from __future__ import annotations
+
+import struct
+from typing import Optional
+
+from ..log import logger
+
+# Sample rate assumed when the service sends headerless audio without a configured format
+FALLBACK_SAMPLE_RATE = 16000
+
+_RIFF_HEADER_SIZE = 12
+_CHUNK_HEADER_SIZE = 8
+_PCM_FORMAT_TAGS = (1, 0xFFFE)  # WAVE_FORMAT_PCM, WAVE_FORMAT_EXTENSIBLE
+_UNBOUNDED_SIZES = (0, 0xFFFFFFFF)  # streaming writers leave the data size unset
+
+
+class AudioStreamDecoder:
+    """
+    Stateful decoder turning a sequence of synthesis payloads into 16-bit PCM.
+
+    One decoder is used per generation. A RIFF header is parsed once, even when
+    it is split across payloads, and bytes that do not complete a sample frame
+    are kept for the next payload, so every returned view is sample-aligned.
+    A payload starting a fresh RIFF container on a frame boundary resets the
+    header state, which covers services sending one WAV file per event.
+
+    Args:
+        sample_rate: Rate of raw PCM input. When None, a WAV container is
+            expected; headerless input falls back to ``FALLBACK_SAMPLE_RATE``.
+        num_channels: Channel count of raw PCM input
+    """
+
+    def __init__(self, sample_rate: Optional[int] = None, num_channels: int = 1) -> None:
+        self._raw = sample_rate is not None
+        self._sample_rate = sample_rate or FALLBACK_SAMPLE_RATE
+        self._num_channels = num_channels
+        self._pending = b""
+        self._in_header = not self._raw
+        self._remaining: Optional[int] = None
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes held back until more data arrives."""
+        return len(self._pending)
+
+    def push(self, data: bytes) -> memoryview:
+        """
+        Feed the next payload and return the complete sample frames it unlocks.
+
+        Raises:
+            ValueError: If the WAV header describes something other than 16-bit PCM
+        """
+        if not self._raw and not self._in_header and not self._pending and data[:4] == b"RIFF":
+            self._in_header = True
+            self._remaining = None
+
+        buf = self._pending + data if self._pending else data
+        self._pending = b""
+        view = memoryview(buf)
+
+        if self._in_header:
+            offset = self._parse_header(view)
+            if offset is None:
+                self._pending = bytes(buf)
+                return memoryview(b"")
+            view = view[offset:]
+
+        if self._remaining is not None and len(view) > self._remaining:
+            # bytes after the data chunk (e.g. LIST metadata) are not audio
+            view = view[: self._remaining]
+
+        block_align = 2 * self._num_channels
+        aligned = len(view) - len(view) % block_align
+        if aligned != len(view):
+            self._pending = view[aligned:].tobytes()
+        if self._remaining is not None:
+            self._remaining -= aligned
+        return view[:aligned]
+
+    def _parse_header(self, view: memoryview) -> Optional[int]:
+        """Return the offset of the first PCM byte, or None if more data is needed."""
+        if len(view) < 4:
+            return None
+
+        if view[:4] != b"RIFF":
+            logger.debug(
+                "synthesized audio has no RIFF header, assuming %d Hz mono PCM", self._sample_rate
+            )
+            self._in_header = False
+            return 0
+
+        if len(view) < _RIFF_HEADER_SIZE:
+            return None
+
+        offset = _RIFF_HEADER_SIZE
+        while True:
+            if len(view) < offset + _CHUNK_HEADER_SIZE:
+                return None
+
+            chunk_id = view[offset : offset + 4].tobytes()
+            (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+            body = offset + _CHUNK_HEADER_SIZE
+
+            if chunk_id == b"data":
+                self._in_header = False
+                self._remaining = None if chunk_size in _UNBOUNDED_SIZES else chunk_size
+                return body
+
+            if len(view) < body + chunk_size:
+                return None
+
+            if chunk_id == b"fmt ":
+                format_tag, channels, sample_rate = struct.unpack_from("<HHI", view, body)
+                (bits_per_sample,) = struct.unpack_from("<H", view, body + 14)
+                if format_tag not in _PCM_FORMAT_TAGS or bits_per_sample != 16:
+                    raise ValueError(
+                        f"unsupported synthesized audio format (tag={format_tag}, "
+                        f"bits={bits_per_sample}); expected 16-bit PCM"
+                    )
+                self._sample_rate = sample_rate
+                self._num_channels = channels
+
+            # chunks are word aligned
+            offset = body + chunk_size + (chunk_size & 1)
@@ -0,0 +1,155 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded thread pool for blocking Speech SDK calls"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Snapshot of the SDK executor"""
+
+    max_workers: int
+    """Threads available for SDK calls"""
+
+    running: int
+    """Calls currently executing"""
+
+    queued: int
+    """Calls waiting for a free thread"""
+
+    max_queued: int
+    """Largest value ``queued`` reached"""
+
+    completed: int
+    """Calls that finished, successfully or not"""
+
+    timeouts: int
+    """Calls abandoned because they exceeded their timeout"""
+
+    last_wait: float
+    """Seconds the most recent call waited for a thread"""
+
+    max_wait: float
+    """Longest time a call waited for a thread"""
+
+
+class SDKExecutor:
+    """
+    Runs blocking Speech SDK calls on a dedicated, size-bounded thread pool.
+
+    ``start_continuous_recognition`` and friends block for a network round
+    trip. On the loop's default executor, a burst of sessions starting together
+    queues behind (and starves) unrelated work; a separate pool keeps such
+    bursts contained, and its counters show how deep they get.
+
+    A timed-out call is abandoned, not interrupted: its thread stays busy until
+    the SDK returns.
+    """
+
+    def __init__(self, max_workers: int = 4, call_timeout: Optional[float] = 10.0) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        self._max_workers = max_workers
+        self._call_timeout = call_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="azure-li-sdk")
+
+        # updated from worker threads
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._timeouts = 0
+        self._last_wait = 0.0
+        self._max_wait = 0.0
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                running=self._running,
+                queued=self._queued,
+                max_queued=self._max_queued,
+                completed=self._completed,
+                timeouts=self._timeouts,
+                last_wait=self._last_wait,
+                max_wait=self._max_wait,
+            )
+
+    async def run(
+        self,
+        fn: Callable[[], T],
+        *,
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        Run ``fn`` on the pool and wait for its result.
+
+        Raises:
+            asyncio.TimeoutError: If the call (queueing included) takes longer
+                than ``timeout``, or the executor's ``call_timeout`` by default
+        """
+        timeout = self._call_timeout if timeout is None else timeout
+        future = self.submit(fn)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise
+
+    def submit(self, fn: Callable[[], T]) -> Future[T]:
+        """Queue ``fn`` without waiting for it, e.g. for best-effort cleanup."""
+        submitted_at = time.monotonic()
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+        future = self._pool.submit(self._call, fn, submitted_at)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            # cancelled while queued (timeout or shutdown), so _call never ran
+            with self._lock:
+                self._queued -= 1
+
+    def _call(self, fn: Callable[[], T], submitted_at: float) -> T:
+        wait = time.monotonic() - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._last_wait = wait
+            self._max_wait = max(self._max_wait, wait)
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
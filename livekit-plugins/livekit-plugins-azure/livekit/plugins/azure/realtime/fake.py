@@ -0,0 +1,433 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local stand-in for the Speech Service, for offline tests and load generation.
+
+``FakeSpeechBackend`` creates recognizers that consume pushed PCM and play a
+script: once an utterance's worth of audio has been written, they emit partial
+and final results, synthesized audio and cancellations on their own dispatcher
+thread, after configurable service latencies::
+
+    script = FakeScript.from_file("conversation.json")
+    model = LiveInterpreterModel(..., backend=FakeSpeechBackend(script))
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+import azure.cognitiveservices.speech as speechsdk
+
+from .. import models
+from .decoder import FALLBACK_SAMPLE_RATE
+
+_TICKS_PER_SECOND = 10_000_000
+
+
+@dataclass(frozen=True)
+class FakeUtterance:
+    """One scripted utterance"""
+
+    text: str
+    """Recognized source text"""
+
+    translations: dict[str, str] = field(default_factory=dict)
+    """Translated text by target language; targets not listed get the source text"""
+
+    source_language: str = "en-US"
+    duration_ms: int = 1500
+    """Input audio the utterance spans; its final result follows once this much was pushed"""
+
+    partials: int = 2
+    """Partial results emitted while the utterance's audio arrives"""
+
+    synthesis_ms: int = 1000
+    """Synthesized audio produced for it, when the session requests audio"""
+
+    cancel: Optional[str] = None
+    """``CancellationReason`` name (e.g. ``"Error"``) to cancel with instead of a result"""
+
+    error_code: str = "ConnectionFailure"
+    """``CancellationErrorCode`` name reported with ``cancel``"""
+
+
+@dataclass(frozen=True)
+class FakeScript:
+    """Utterances played in order, from the start again when ``loop`` is set"""
+
+    utterances: list[FakeUtterance]
+    loop: bool = True
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike[str]]) -> FakeScript:
+        """Load a script from JSON: ``{"loop": true, "utterances": [{"text": ...}, ...]}``."""
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        return cls(
+            utterances=[FakeUtterance(**utterance) for utterance in payload["utterances"]],
+            loop=payload.get("loop", True),
+        )
+
+
+class FakeSpeechBackend:
+    """
+    Recognizer backend playing a script instead of calling the service.
+
+    Args:
+        script: What the fake service "hears"
+        connect_latency: Seconds ``start_continuous_recognition`` blocks
+        recognition_latency: Seconds from the end of an utterance's audio to its final result
+        synthesis_latency: Seconds from the final result to the first synthesized audio
+        synthesis_chunk_ms: Duration of each synthesized audio event
+    """
+
+    def __init__(
+        self,
+        script: FakeScript,
+        *,
+        connect_latency: float = 0.05,
+        recognition_latency: float = 0.3,
+        synthesis_latency: float = 0.2,
+        synthesis_chunk_ms: int = 100,
+    ) -> None:
+        if not script.utterances:
+            raise ValueError("script needs at least one utterance")
+
+        self._script = script
+        self._connect_latency = connect_latency
+        self._recognition_latency = recognition_latency
+        self._synthesis_latency = synthesis_latency
+        self._synthesis_chunk_ms = synthesis_chunk_ms
+
+    def create(
+        self, config: models.LiveInterpreterConfig
+    ) -> tuple[FakeRecognizer, FakeAudioStream]:
+        recognizer = FakeRecognizer(
+            self._script,
+            sample_rate=config.sample_rate,
+            target_languages=list(config.target_languages),
+            synthesis_sample_rate=(
+                (config.synthesis_sample_rate or FALLBACK_SAMPLE_RATE)
+                if config.use_personal_voice
+                else None
+            ),
+            connect_latency=self._connect_latency,
+            recognition_latency=self._recognition_latency,
+            synthesis_latency=self._synthesis_latency,
+            synthesis_chunk_ms=self._synthesis_chunk_ms,
+        )
+        return recognizer, recognizer.stream
+
+
+class FakeSignal:
+    """Mimics an SDK ``EventSignal``."""
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[Any], None]] = []
+
+    def connect(self, callback: Callable[[Any], None]) -> None:
+        self._callbacks.append(callback)
+
+    def disconnect_all(self) -> None:
+        self._callbacks = []
+
+    def fire(self, evt: Any) -> None:
+        for callback in list(self._callbacks):
+            callback(evt)
+
+
+@dataclass
+class _Result:
+    reason: speechsdk.ResultReason
+    text: str = ""
+    translations: dict[str, str] = field(default_factory=dict)
+    properties: dict[Any, str] = field(default_factory=dict)
+    offset: int = 0
+    duration: int = 0
+    json: str = ""
+    audio: bytes = b""
+
+
+@dataclass
+class _Event:
+    result: Optional[_Result] = None
+    session_id: str = ""
+    reason: Optional[speechsdk.CancellationReason] = None
+    error_code: Optional[speechsdk.CancellationErrorCode] = None
+    error_details: str = ""
+
+
+class FakeAudioStream:
+    """Mimics a ``PushAudioInputStream`` feeding a ``FakeRecognizer``."""
+
+    def __init__(self, recognizer: FakeRecognizer) -> None:
+        self._recognizer = recognizer
+
+    def write(self, data: Any) -> None:
+        self._recognizer._on_audio(memoryview(data).nbytes)
+
+    def close(self) -> None:
+        self._recognizer._on_end_of_stream()
+
+
+class FakeRecognizer:
+    """Mimics a ``TranslationRecognizer``; events fire on a dispatcher thread."""
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        script: FakeScript,
+        *,
+        sample_rate: int,
+        target_languages: list[str],
+        synthesis_sample_rate: Optional[int],
+        connect_latency: float,
+        recognition_latency: float,
+        synthesis_latency: float,
+        synthesis_chunk_ms: int,
+    ) -> None:
+        self.recognizing = FakeSignal()
+        self.recognized = FakeSignal()
+        self.synthesizing = FakeSignal()
+        self.canceled = FakeSignal()
+        self.session_started = FakeSignal()
+        self.session_stopped = FakeSignal()
+        self.stream = FakeAudioStream(self)
+
+        self._script = script
+        self._bytes_per_second = sample_rate * 2
+        self._target_languages = target_languages
+        self._synthesis_sample_rate = synthesis_sample_rate
+        self._connect_latency = connect_latency
+        self._recognition_latency = recognition_latency
+        self._synthesis_latency = synthesis_latency
+        self._synthesis_chunk_ms = synthesis_chunk_ms
+        self._session_id = f"fake-{next(self._ids)}"
+
+        self._cond = threading.Condition()
+        self._events: list[tuple[float, int, FakeSignal, _Event]] = []
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._stopped = False
+
+        # script position, guarded by _cond
+        self._position = 0  # bytes of input consumed
+        self._utterance_index = 0
+        self._utterance_start = 0
+        self._partials_sent = 0
+        self._last_due = 0.0
+
+    def start_continuous_recognition(self) -> None:
+        time.sleep(self._connect_latency)
+        with self._cond:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._dispatch, name=f"fake-speech-{self._session_id}", daemon=True
+            )
+            self._thread.start()
+            self._schedule(0.0, self.session_started, _Event(session_id=self._session_id))
+
+    def stop_continuous_recognition(self) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._stop()
+
+    # ------------------------------------------------------------------
+    # script playback, driven by writes on the caller's thread
+    # ------------------------------------------------------------------
+    def _on_audio(self, nbytes: int) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            self._position += nbytes
+            while self._advance():
+                pass
+
+    def _on_end_of_stream(self) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            # after whatever the service is still working on, like the SDK
+            self._schedule(
+                0.0,
+                self.canceled,
+                _Event(
+                    session_id=self._session_id,
+                    reason=speechsdk.CancellationReason.EndOfStream,
+                    error_code=speechsdk.CancellationErrorCode.NoError,
+                ),
+            )
+            self._schedule(0.0, self.session_stopped, _Event(session_id=self._session_id))
+
+    def _current(self) -> Optional[FakeUtterance]:
+        utterances = self._script.utterances
+        if self._utterance_index >= len(utterances) and not self._script.loop:
+            return None
+        return utterances[self._utterance_index % len(utterances)]
+
+    def _advance(self) -> bool:
+        """Emit what the consumed input unlocks; True if an utterance ended."""
+        utterance = self._current()
+        if utterance is None:
+            return False
+
+        length = utterance.duration_ms * self._bytes_per_second // 1000
+        heard = self._position - self._utterance_start
+        while self._partials_sent < utterance.partials:
+            boundary = length * (self._partials_sent + 1) // (utterance.partials + 1)
+            if heard < boundary:
+                return False
+            self._partials_sent += 1
+            words = utterance.text.split()
+            cut = max(1, len(words) * self._partials_sent // (utterance.partials + 1))
+            self._schedule(
+                0.0,
+                self.recognizing,
+                _Event(
+                    result=self._result(utterance, boundary, " ".join(words[:cut]), partial=True)
+                ),
+            )
+
+        if heard < length:
+            return False
+
+        if utterance.cancel is not None:
+            self._schedule(
+                self._recognition_latency,
+                self.canceled,
+                _Event(
+                    session_id=self._session_id,
+                    reason=getattr(speechsdk.CancellationReason, utterance.cancel),
+                    error_code=getattr(speechsdk.CancellationErrorCode, utterance.error_code),
+                    error_details="scripted cancellation",
+                ),
+            )
+        else:
+            self._schedule(
+                self._recognition_latency,
+                self.recognized,
+                _Event(result=self._result(utterance, length, utterance.text, partial=False)),
+            )
+            self._schedule_synthesis(utterance)
+
+        self._utterance_index += 1
+        self._utterance_start += length
+        self._partials_sent = 0
+        return True
+
+    def _result(self, utterance: FakeUtterance, heard: int, text: str, *, partial: bool) -> _Result:
+        translations = {
+            lang: utterance.translations.get(lang, utterance.text)
+            for lang in self._target_languages
+        }
+        if partial:
+            # partial translations grow with the source, word by word
+            ratio = len(text) / max(1, len(utterance.text))
+            translations = {
+                lang: t[: max(1, int(len(t) * ratio))] for lang, t in translations.items()
+            }
+        return _Result(
+            reason=(
+                speechsdk.ResultReason.TranslatingSpeech
+                if partial
+                else speechsdk.ResultReason.TranslatedSpeech
+            ),
+            text=text,
+            translations=translations,
+            properties={
+                speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult: (
+                    utterance.source_language
+                )
+            },
+            offset=self._utterance_start * _TICKS_PER_SECOND // self._bytes_per_second,
+            duration=heard * _TICKS_PER_SECOND // self._bytes_per_second,
+        )
+
+    def _schedule_synthesis(self, utterance: FakeUtterance) -> None:
+        if self._synthesis_sample_rate is None or utterance.synthesis_ms <= 0:
+            return
+
+        delay = self._recognition_latency + self._synthesis_latency
+        remaining = utterance.synthesis_ms
+        while remaining > 0:
+            chunk_ms = min(self._synthesis_chunk_ms, remaining)
+            audio = bytes(self._synthesis_sample_rate * 2 * chunk_ms // 1000)
+            self._schedule(
+                delay,
+                self.synthesizing,
+                _Event(
+                    result=_Result(reason=speechsdk.ResultReason.SynthesizingAudio, audio=audio)
+                ),
+            )
+            remaining -= chunk_ms
+        # an empty payload ends the utterance's audio
+        self._schedule(
+            delay,
+            self.synthesizing,
+            _Event(result=_Result(reason=speechsdk.ResultReason.SynthesizingAudioCompleted)),
+        )
+
+    # ------------------------------------------------------------------
+    # dispatcher thread
+    # ------------------------------------------------------------------
+    def _schedule(self, delay: float, signal: FakeSignal, evt: _Event) -> None:
+        # never earlier than an event already queued, so events keep their order
+        due = max(time.monotonic() + delay, self._last_due)
+        self._last_due = due
+        heapq.heappush(self._events, (due, next(self._seq), signal, evt))
+        self._cond.notify()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    if self._events:
+                        wait = self._events[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if not self._running:
+                    return
+                _, _, signal, evt = heapq.heappop(self._events)
+
+            signal.fire(evt)
+            if signal is self.session_stopped:
+                with self._cond:
+                    self._running = False
+                    self._stopped = True
+                return
+
+    def _stop(self) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            self._stopped = True
+        self.session_stopped.fire(_Event(session_id=self._session_id))
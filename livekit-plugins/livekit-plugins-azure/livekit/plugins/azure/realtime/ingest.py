@@ -0,0 +1,207 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Input audio ingest queue for the Live Interpreter session"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal, Optional, Union
+
+from livekit import rtc
+
+from ..log import logger
+from . import pcm
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+OVERFLOW_POLICIES: tuple[OverflowPolicy, ...] = ("block", "drop_oldest", "drop_newest")
+
+# with "block", how many times maxsize may wait in the backlog before frames are dropped
+BLOCK_BACKLOG_FACTOR = 30
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """Snapshot of the input queue counters"""
+
+    queued_frames: int
+    """Total number of frames accepted into the queue"""
+
+    dropped_frames: int
+    """Total number of frames discarded because the queue was full"""
+
+    pending_frames: int
+    """Number of frames currently waiting to be written to the service"""
+
+
+class AudioIngestQueue:
+    """
+    Bounded FIFO of input frames drained by a single consumer task.
+
+    ``push_audio`` is synchronous, so a full queue cannot suspend the producer.
+    The overflow policy decides what happens instead:
+
+    - ``drop_oldest``: discard the oldest pending frame to make room
+    - ``drop_newest``: discard the incoming frame
+    - ``block``: frames above ``maxsize`` wait in an overflow backlog and are
+      moved into the queue as the consumer frees space; only once the backlog
+      holds ``max_backlog`` frames are incoming frames discarded
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: OverflowPolicy = "drop_oldest",
+        *,
+        max_backlog: Optional[int] = None,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive number of frames")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        if max_backlog is None:
+            max_backlog = maxsize * BLOCK_BACKLOG_FACTOR
+        if max_backlog < 0:
+            raise ValueError("max_backlog must not be negative")
+
+        self._queue: asyncio.Queue[rtc.AudioFrame] = asyncio.Queue(maxsize)
+        self._backlog: deque[rtc.AudioFrame] = deque()
+        self._max_backlog = max_backlog
+        self._overflow = overflow
+        self._queued_frames = 0
+        self._dropped_frames = 0
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        return self._overflow
+
+    @property
+    def queued_frames(self) -> int:
+        return self._queued_frames
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    def qsize(self) -> int:
+        return self._queue.qsize() + len(self._backlog)
+
+    def stats(self) -> IngestStats:
+        return IngestStats(
+            queued_frames=self._queued_frames,
+            dropped_frames=self._dropped_frames,
+            pending_frames=self.qsize(),
+        )
+
+    def put_nowait(self, frame: rtc.AudioFrame) -> bool:
+        """Enqueue a frame, returning False if the frame itself was dropped."""
+        if self._backlog:
+            # keep ordering: once frames are backlogged, new ones queue behind them
+            return self._put_backlog(frame)
+
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            if self._overflow == "drop_newest":
+                self._dropped_frames += 1
+                return False
+
+            if self._overflow == "drop_oldest":
+                self._queue.get_nowait()
+                self._dropped_frames += 1
+                self._queue.put_nowait(frame)
+            else:
+                return self._put_backlog(frame)
+
+        self._queued_frames += 1
+        return True
+
+    def _put_backlog(self, frame: rtc.AudioFrame) -> bool:
+        if len(self._backlog) >= self._max_backlog:
+            # the consumer is stalled: bound memory rather than buffer without limit
+            if not self._dropped_frames:
+                logger.warning(
+                    "input backlog full (%d frames), dropping incoming audio", self._max_backlog
+                )
+            self._dropped_frames += 1
+            return False
+        self._backlog.append(frame)
+        self._queued_frames += 1
+        return True
+
+    async def get(self) -> rtc.AudioFrame:
+        frame = await self._queue.get()
+        if self._backlog:
+            self._queue.put_nowait(self._backlog.popleft())
+        return frame
+
+    def clear(self) -> int:
+        """Discard all pending frames and return how many were removed."""
+        removed = len(self._backlog)
+        self._backlog.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            removed += 1
+        return removed
+
+
+class InputConverter:
+    """
+    Converts incoming frames to mono 16-bit PCM at the service sample rate.
+
+    Frames are handled as views over their own buffers: downmixing writes into
+    a reusable scratch buffer, resampling consumes that buffer directly, and the
+    returned objects can be written to the Speech SDK push stream as-is.
+    """
+
+    def __init__(self, output_rate: int) -> None:
+        self._output_rate = output_rate
+        self._resampler: Optional[rtc.AudioResampler] = None
+        self._resampler_input_rate: Optional[int] = None
+        self._scratch = bytearray()
+
+    def reset(self) -> None:
+        self._resampler = None
+        self._resampler_input_rate = None
+
+    def convert(self, frame: rtc.AudioFrame) -> list[pcm.WriteBuffer]:
+        """Return write-ready buffers for ``frame`` (empty while the resampler primes)."""
+        data: Union[memoryview, bytearray] = frame.data
+        num_channels = frame.num_channels
+        sample_rate = frame.sample_rate
+        if sample_rate == self._output_rate:
+            if num_channels > 1:
+                # written straight to the stream, so a fresh buffer saves the scratch copy
+                data = pcm.downmix(data, num_channels)
+            return [pcm.as_write_buffer(data)]
+
+        if num_channels > 1:
+            nbytes = frame.samples_per_channel * 2
+            if len(self._scratch) != nbytes:
+                self._scratch = bytearray(nbytes)
+            pcm.downmix(data, num_channels, out=self._scratch)
+
+        if self._resampler is None or self._resampler_input_rate != sample_rate:
+            self._resampler = rtc.AudioResampler(
+                input_rate=sample_rate,
+                output_rate=self._output_rate,
+                num_channels=1,
+            )
+            self._resampler_input_rate = sample_rate
+
+        # mono input frames are handed over as-is, downmixed audio as the scratch bytearray
+        source = frame if num_channels == 1 else self._scratch
+        return [pcm.as_write_buffer(out.data) for out in self._resampler.push(source)]
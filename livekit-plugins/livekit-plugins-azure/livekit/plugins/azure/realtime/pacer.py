@@ -0,0 +1,174 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Real-time pacing of synthesized audio frames"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from livekit.agents import utils
+
+from livekit import rtc
+
+from ..log import logger
+
+
+@dataclass(frozen=True)
+class PacerStats:
+    """Snapshot of an output pacer"""
+
+    buffered_duration: float
+    """Seconds of audio held by the pacer, not yet released downstream"""
+
+    max_buffered_duration: float
+    """Largest value ``buffered_duration`` reached"""
+
+    released_duration: float
+    """Seconds of audio released downstream"""
+
+    underruns: int
+    """Times the pacer ran dry while downstream had nothing left to play"""
+
+
+class AudioPacer:
+    """
+    Releases frames into a channel at playout speed.
+
+    Synthesis tends to arrive in bursts of several seconds. Instead of handing
+    the whole burst downstream, the pacer keeps downstream at most
+    ``jitter_buffer_ms`` ahead of the real-time clock and holds the rest. The
+    first ``jitter_buffer_ms`` go out immediately and act as the jitter buffer;
+    after an underrun the clock is re-anchored so the next burst refills it.
+
+    The output channel is closed once input has ended and every frame has been
+    released, after which ``on_done`` is called.
+    """
+
+    def __init__(
+        self,
+        out_ch: utils.aio.Chan[rtc.AudioFrame],
+        *,
+        jitter_buffer_ms: int,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._out_ch = out_ch
+        self._target = jitter_buffer_ms / 1000.0
+        self._on_done = on_done
+
+        self._frames: deque[rtc.AudioFrame] = deque()
+        self._wakeup = asyncio.Event()
+        self._input_ended = False
+        self._done = False
+
+        self._buffered = 0.0
+        self._max_buffered = 0.0
+        self._released = 0.0
+        self._underruns = 0
+
+        self._task = asyncio.create_task(self._run(), name="azure-li-output-pacer")
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def buffered_duration(self) -> float:
+        return self._buffered
+
+    def stats(self) -> PacerStats:
+        return PacerStats(
+            buffered_duration=self._buffered,
+            max_buffered_duration=self._max_buffered,
+            released_duration=self._released,
+            underruns=self._underruns,
+        )
+
+    def push(self, frame: rtc.AudioFrame) -> None:
+        if self._input_ended:
+            logger.debug("dropping audio frame pushed after end of input")
+            return
+
+        self._frames.append(frame)
+        self._buffered += frame.duration
+        self._max_buffered = max(self._max_buffered, self._buffered)
+        self._wakeup.set()
+
+    def end_input(self) -> None:
+        self._input_ended = True
+        self._wakeup.set()
+
+    def clear(self) -> None:
+        """Drop everything still buffered but keep the output open for later frames."""
+        self._frames.clear()
+        self._buffered = 0.0
+
+    def interrupt(self) -> None:
+        """Drop everything still buffered and close the output right away."""
+        self._frames.clear()
+        self._buffered = 0.0
+        self.end_input()
+        if not self._task.done():
+            self._task.cancel()
+        self._finish()
+
+    async def aclose(self) -> None:
+        self.interrupt()
+        await utils.aio.cancel_and_wait(self._task)
+
+    async def _run(self) -> None:
+        clock_start: Optional[float] = None
+        scheduled = 0.0  # audio released since clock_start
+
+        while True:
+            if not self._frames:
+                if self._input_ended:
+                    break
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            if clock_start is None or now - clock_start > scheduled:
+                if clock_start is not None:
+                    self._underruns += 1
+                clock_start = now
+                scheduled = 0.0
+
+            ahead = scheduled - (now - clock_start)
+            if ahead >= self._target:
+                await asyncio.sleep(ahead - self._target)
+                continue
+
+            frame = self._frames.popleft()
+            self._buffered = max(0.0, self._buffered - frame.duration)
+            self._released += frame.duration
+            scheduled += frame.duration
+            self._out_ch.send_nowait(frame)
+
+        self._finish()
+
+    def _finish(self) -> None:
+        if self._done:
+            return
+
+        self._done = True
+        if not self._out_ch.closed:
+            self._out_ch.close()
+        if self._on_done is not None:
+            self._on_done()
@@ -0,0 +1,380 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Small 16-bit PCM DSP toolkit used by the Live Interpreter session.
+
+Replaces the ``audioop`` module (removed in Python 3.13). Every operation has a
+NumPy implementation and a pure-Python fallback with identical output; the
+rounding rules follow ``audioop`` (floor, then saturate to int16) so results
+are bit-exact with the code paths they replace. ``DownmixResampler`` has no
+``audioop`` counterpart; its two implementations agree to within one LSB.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from array import array
+from typing import Iterable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with livekit-rtc
+    np = None  # type: ignore[assignment]
+
+Buffer = Union[bytes, bytearray, memoryview]
+WriteBuffer = bytes
+
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+# windowed-sinc resampler design: taps on each side of an output sample at the
+# lower of the two rates, passband edge as a fraction of the lower Nyquist
+# frequency, and the Kaiser window shape (~80 dB stopband)
+_SINC_HALF_TAPS = 16
+_SINC_ROLLOFF = 0.85
+_KAISER_BETA = 8.6
+
+
+def _int16_view(data: Buffer) -> memoryview:
+    return memoryview(data).cast("B").cast("h")
+
+
+def _output(out: Optional[bytearray], num_samples: int) -> bytearray:
+    if out is None:
+        return bytearray(num_samples * 2)
+    if len(out) < num_samples * 2:
+        raise ValueError("output buffer is too small")
+    return out
+
+
+def _saturate(value: float) -> int:
+    if value > INT16_MAX:
+        return INT16_MAX
+    if value < INT16_MIN:
+        return INT16_MIN
+    return math.floor(value)
+
+
+# ----------------------------------------------------------------------
+# NumPy implementations
+# ----------------------------------------------------------------------
+def _downmix_np(data: Buffer, num_channels: int, out: Optional[bytearray] = None) -> memoryview:
+    frames = np.frombuffer(data, dtype=np.int16).reshape(-1, num_channels)
+    out = _output(out, frames.shape[0])
+
+    mono = np.frombuffer(out, dtype=np.int16, count=frames.shape[0])
+    if num_channels == 2:
+        acc = np.add(frames[:, 0], frames[:, 1], dtype=np.int32)
+        np.right_shift(acc, 1, out=acc)
+    else:
+        acc = frames.sum(axis=1, dtype=np.int32)
+        np.floor_divide(acc, num_channels, out=acc)
+    np.copyto(mono, acc, casting="unsafe")
+    return memoryview(out)[: frames.shape[0] * 2]
+
+
+def _to_int16_np(
+    values: Iterable[float], scale: float = 1.0, out: Optional[bytearray] = None
+) -> memoryview:
+    arr = np.asarray(values, dtype=np.float64)
+    if scale != 1.0:
+        arr = arr * scale
+    out = _output(out, arr.shape[0])
+
+    np.clip(arr, INT16_MIN, INT16_MAX, out=arr)
+    np.floor(arr, out=arr)
+    np.copyto(np.frombuffer(out, dtype=np.int16, count=arr.shape[0]), arr, casting="unsafe")
+    return memoryview(out)[: arr.shape[0] * 2]
+
+
+def _apply_gain_np(data: Buffer, gain: float, out: Optional[bytearray] = None) -> memoryview:
+    return _to_int16_np(np.frombuffer(data, dtype=np.int16), gain, out)
+
+
+def _rms_np(data: Buffer) -> int:
+    samples = np.frombuffer(data, dtype=np.int16).astype(np.float64)
+    if samples.shape[0] == 0:
+        return 0
+    return int(math.sqrt(float(np.dot(samples, samples)) / samples.shape[0]))
+
+
+# ----------------------------------------------------------------------
+# Pure-Python fallbacks
+# ----------------------------------------------------------------------
+def _downmix_py(data: Buffer, num_channels: int, out: Optional[bytearray] = None) -> memoryview:
+    src = _int16_view(data)
+    num_samples = len(src) // num_channels
+    out = _output(out, num_samples)
+
+    channels = [src[c::num_channels] for c in range(num_channels)]
+    if num_channels == 2:
+        mixed = [(a + b) >> 1 for a, b in zip(*channels)]
+    else:
+        mixed = [sum(frame) // num_channels for frame in zip(*channels)]
+    _int16_view(out)[:num_samples] = array("h", mixed)
+    return memoryview(out)[: num_samples * 2]
+
+
+def _to_int16_py(
+    values: Iterable[float], scale: float = 1.0, out: Optional[bytearray] = None
+) -> memoryview:
+    converted = [_saturate(v * scale) for v in values]
+    out = _output(out, len(converted))
+    _int16_view(out)[: len(converted)] = array("h", converted)
+    return memoryview(out)[: len(converted) * 2]
+
+
+def _apply_gain_py(data: Buffer, gain: float, out: Optional[bytearray] = None) -> memoryview:
+    return _to_int16_py(_int16_view(data), gain, out)
+
+
+def _rms_py(data: Buffer) -> int:
+    samples = _int16_view(data)
+    if len(samples) == 0:
+        return 0
+    return int(math.sqrt(sum(float(v) * v for v in samples) / len(samples)))
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+def downmix(data: Buffer, num_channels: int, out: Optional[bytearray] = None) -> memoryview:
+    """
+    Average interleaved channels into mono in a single pass.
+
+    Rounding matches ``audioop.tomono`` with equal weights: the channel mean is
+    floored, so stereo input yields ``(left + right) >> 1``.
+
+    Args:
+        data: Interleaved 16-bit PCM
+        num_channels: Number of interleaved channels in ``data``
+        out: Optional preallocated buffer receiving the mono samples
+
+    Returns:
+        Byte memoryview over the mono samples (backed by ``out`` when given)
+    """
+    if np is not None:
+        return _downmix_np(data, num_channels, out)
+    return _downmix_py(data, num_channels, out)
+
+
+def apply_gain(data: Buffer, gain: float, out: Optional[bytearray] = None) -> memoryview:
+    """
+    Scale 16-bit samples by ``gain``, saturating at the int16 range.
+
+    Equivalent to ``audioop.mul(data, 2, gain)``.
+
+    Args:
+        data: 16-bit PCM
+        gain: Linear gain factor
+        out: Optional preallocated buffer receiving the scaled samples
+
+    Returns:
+        Byte memoryview over the scaled samples
+    """
+    if np is not None:
+        return _apply_gain_np(data, gain, out)
+    return _apply_gain_py(data, gain, out)
+
+
+def rms(data: Buffer) -> int:
+    """
+    Root mean square of 16-bit samples, truncated like ``audioop.rms(data, 2)``.
+
+    Args:
+        data: 16-bit PCM
+
+    Returns:
+        RMS level in sample units (0 for empty input)
+    """
+    if np is not None:
+        return _rms_np(data)
+    return _rms_py(data)
+
+
+def to_int16(
+    values: Iterable[float],
+    scale: float = 1.0,
+    out: Optional[bytearray] = None,
+) -> memoryview:
+    """
+    Convert samples of any numeric type to 16-bit PCM.
+
+    Values are multiplied by ``scale``, floored and clipped to the int16 range.
+    Use ``scale=32768`` to convert normalized float audio.
+
+    Args:
+        values: Sample values (a NumPy array, array or any iterable of numbers)
+        scale: Factor applied before conversion
+        out: Optional preallocated buffer receiving the converted samples
+
+    Returns:
+        Byte memoryview over the 16-bit samples
+    """
+    if np is not None:
+        return _to_int16_np(values, scale, out)
+    return _to_int16_py(values, scale, out)
+
+
+def _bessel_i0(x: float) -> float:
+    # power series of the zeroth-order modified Bessel function
+    total = term = 1.0
+    k = 0
+    while term > 1e-12 * total:
+        k += 1
+        term *= (x / (2 * k)) ** 2
+        total += term
+    return total
+
+
+@functools.lru_cache(maxsize=8)
+def _sinc_table(up: int, down: int) -> tuple[int, tuple[tuple[float, ...], ...]]:
+    """Kaiser-windowed sinc coefficients for each of the ``up`` output phases."""
+    ratio = min(1.0, up / down)
+    width = math.ceil(_SINC_HALF_TAPS / ratio)
+    cutoff = _SINC_ROLLOFF * ratio
+    norm = _bessel_i0(_KAISER_BETA)
+
+    rows = []
+    for phase in range(up):
+        row = []
+        for k in range(2 * width):
+            # distance from the output instant to input sample ``k - width + 1``
+            x = phase / up + width - 1 - k
+            arg = cutoff * x
+            sinc = 1.0 if arg == 0 else math.sin(math.pi * arg) / (math.pi * arg)
+            window = _bessel_i0(_KAISER_BETA * math.sqrt(max(0.0, 1 - (x / width) ** 2))) / norm
+            row.append(cutoff * sinc * window)
+        gain = sum(row)
+        rows.append(tuple(c / gain for c in row))
+    return width, tuple(rows)
+
+
+class DownmixResampler:
+    """
+    Streaming windowed-sinc resampler with the channel downmix fused in.
+
+    Each call averages the interleaved input to mono and filters it to the
+    output rate in one pass, without an intermediate 16-bit mono buffer. The
+    polyphase low-pass filter cuts off below the lower Nyquist frequency, so
+    decimation (e.g. 48 kHz -> 16 kHz) does not fold high frequencies back
+    into the speech band. Positions are tracked as exact integers, so a stream
+    split into arbitrary chunks produces the same samples as the stream pushed
+    in one call. Output lags input by the filter's half width.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int, num_channels: int = 1) -> None:
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError("sample rates must be positive")
+
+        gcd = math.gcd(input_rate, output_rate)
+        self._up = output_rate // gcd
+        self._down = input_rate // gcd
+        self._num_channels = num_channels
+        self._width, self._rows = _sinc_table(self._up, self._down)
+        self._table = None if np is None else np.array(self._rows, dtype=np.float64)
+        self.reset()
+
+    def reset(self) -> None:
+        # history starts with zeros so the first output has a full filter span
+        self._history: Union[list[float], "np.ndarray"] = [0.0] * (self._width - 1)
+        self._base = 1 - self._width
+        self._next = 0
+
+    def push(self, data: Buffer) -> memoryview:
+        """Resample a chunk of interleaved 16-bit PCM, returning mono output."""
+        if self._up == self._down:
+            if self._num_channels > 1:
+                return downmix(data, self._num_channels)
+            return memoryview(data).cast("B")
+        if np is not None:
+            return self._push_np(data)
+        return self._push_py(data)
+
+    def _advance(self, length: int) -> tuple[int, int]:
+        # outputs whose filter span ends inside the buffered history
+        last = self._base + length - 1 - self._width
+        start = self._next
+        end = 0 if last < 0 else ((last + 1) * self._up - 1) // self._down + 1
+        self._next = max(start, end)
+        return start, self._next - start
+
+    def _discard(self) -> int:
+        # history index of the oldest sample the next output still needs
+        return (self._next * self._down) // self._up - self._width + 1 - self._base
+
+    def _push_np(self, data: Buffer) -> memoryview:
+        frames = np.frombuffer(data, dtype=np.int16).reshape(-1, self._num_channels)
+        mono = frames.sum(axis=1, dtype=np.float64)
+        if self._num_channels > 1:
+            mono /= self._num_channels
+        history = np.concatenate((self._history, mono))
+
+        start, count = self._advance(history.shape[0])
+        windows = np.lib.stride_tricks.sliding_window_view(history, 2 * self._width)
+        values = np.empty(count, dtype=np.float64)
+        # outputs ``up`` apart share a phase and sit ``down`` input samples apart
+        for first in range(min(self._up, count)):
+            index, phase = divmod((start + first) * self._down, self._up)
+            offset = index - self._width + 1 - self._base
+            n = (count - first + self._up - 1) // self._up
+            values[first :: self._up] = windows[offset :: self._down][:n] @ self._table[phase]
+
+        drop = self._discard()
+        self._history = history[drop:]
+        self._base += drop
+        return _to_int16_np(values + 0.5)
+
+    def _push_py(self, data: Buffer) -> memoryview:
+        src = _int16_view(data)
+        channels = self._num_channels
+        history = list(self._history)
+        history.extend(sum(src[i : i + channels]) / channels for i in range(0, len(src), channels))
+
+        start, count = self._advance(len(history))
+        span = 2 * self._width
+        values = []
+        for m in range(start, start + count):
+            index, phase = divmod(m * self._down, self._up)
+            offset = index - self._width + 1 - self._base
+            taps = history[offset : offset + span]
+            values.append(sum(h * c for h, c in zip(taps, self._rows[phase])) + 0.5)
+
+        drop = self._discard()
+        self._history = history[drop:]
+        self._base += drop
+        return _to_int16_py(values)
+
+
+def as_write_buffer(data: Buffer) -> WriteBuffer:
+    """
+    Return ``data`` in a form ``PushAudioInputStream.write`` accepts.
+
+    The Speech SDK passes the argument straight to its native library, which
+    only understands ``bytes`` and ctypes objects, not memoryviews, and copies
+    the audio into its own queue. Wrapping a view in a ctypes array avoids one
+    Python-side copy but costs more than that copy for frames up to ~20 KB, so
+    views are copied into ``bytes``.
+
+    Args:
+        data: 16-bit PCM buffer
+
+    Returns:
+        ``data`` itself if it is already ``bytes``, otherwise a copy
+    """
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
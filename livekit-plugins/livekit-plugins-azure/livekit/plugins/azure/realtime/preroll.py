@@ -0,0 +1,146 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ring buffer of recent input audio, replayed after reconnects"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional, Union
+
+from . import pcm
+
+# granularity and level used to find silence when trimming a replay
+_TRIM_BLOCK_MS = 20
+_SILENCE_RMS = 300
+
+
+class PreRollBuffer:
+    """
+    Fixed-size ring of the mono 16-bit PCM most recently sent to the service.
+
+    Positions are absolute byte counts since the session started, so they stay
+    valid while the ring wraps. Audio the service has produced a final result
+    for is marked with ``release``; everything after that point, as far back
+    as the ring reaches, is what a new recognizer needs to be given again.
+
+    The ring is allocated once. ``write`` copies into it in place and
+    ``pending`` hands out views over it, so steady-state use allocates no
+    audio buffers.
+
+    Args:
+        sample_rate: Rate of the buffered audio
+        duration_ms: How much audio to keep
+        max_bytes: Optional memory cap, taking precedence over ``duration_ms``
+    """
+
+    def __init__(self, sample_rate: int, duration_ms: int, max_bytes: Optional[int] = None) -> None:
+        capacity = sample_rate * 2 * duration_ms // 1000
+        if max_bytes is not None:
+            capacity = min(capacity, max_bytes)
+        capacity -= capacity % 2
+
+        self._sample_rate = sample_rate
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._head = 0
+        self._released = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    @property
+    def head(self) -> int:
+        """Absolute position one past the newest buffered byte."""
+        return self._head
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes written since the release point that are still held by the ring."""
+        return self._head - self._start()
+
+    def write(self, data: Union[pcm.Buffer, pcm.WriteBuffer]) -> None:
+        capacity = len(self._buf)
+        if capacity == 0:
+            # positions still advance, so results can be mapped back to input
+            self._head += memoryview(data).nbytes
+            return
+
+        src = memoryview(data).cast("B")
+        length = len(src)
+        if length > capacity:
+            # only the newest ``capacity`` bytes can be kept
+            self._head += length - capacity
+            src = src[length - capacity :]
+            length = capacity
+
+        offset = self._head % capacity
+        first = min(length, capacity - offset)
+        self._view[offset : offset + first] = src[:first]
+        if first < length:
+            self._view[: length - first] = src[first:]
+        self._head += length
+
+    def release(self, position: int) -> None:
+        """Mark audio before ``position`` as handled by the service."""
+        self._released = max(self._released, min(position, self._head))
+
+    def clear(self) -> None:
+        self._released = self._head
+
+    def pending(self, trim_silence: bool = False) -> Iterator[tuple[int, memoryview]]:
+        """
+        Yield ``(position, view)`` spans of unreleased audio, oldest first.
+
+        With ``trim_silence``, silent stretches are shortened to a single
+        block so a long replay reaches the service faster. Views point into
+        the ring and are only valid until the next ``write``.
+        """
+        start = self._start()
+        for position, view in self._spans(start, self._head):
+            if trim_silence:
+                yield from self._trim(position, view)
+            else:
+                yield position, view
+
+    def _start(self) -> int:
+        return max(self._released, self._head - len(self._buf))
+
+    def _spans(self, start: int, end: int) -> Iterator[tuple[int, memoryview]]:
+        capacity = len(self._buf)
+        while start < end:
+            offset = start % capacity
+            length = min(end - start, capacity - offset)
+            yield start, self._view[offset : offset + length]
+            start += length
+
+    def _trim(self, position: int, view: memoryview) -> Iterator[tuple[int, memoryview]]:
+        block = self._sample_rate * 2 * _TRIM_BLOCK_MS // 1000
+        span_start = 0
+        silent_run = 0
+        for offset in range(0, len(view), block):
+            if pcm.rms(view[offset : offset + block]) >= _SILENCE_RMS:
+                silent_run = 0
+                continue
+
+            silent_run += 1
+            if silent_run == 1:
+                # keep one block so word boundaries survive
+                continue
+            if offset > span_start:
+                yield position + span_start, view[span_start:offset]
+            span_start = min(offset + block, len(view))
+
+        if span_start < len(view):
+            yield position + span_start, view[span_start:]
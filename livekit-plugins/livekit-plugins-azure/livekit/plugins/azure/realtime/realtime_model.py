@@ -1,29 +1,70 @@
 from __future__ import annotations
 
 import asyncio
-import audioop
+import bisect
 import contextlib
-import io
+import functools
 import os
+import socket
 import time
-import wave
 import weakref
 from dataclasses import dataclass, field
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
+from urllib.parse import urlparse
 
 import azure.cognitiveservices.speech as speechsdk
 from livekit import rtc
-from livekit.agents import APIConnectionError, llm, utils
+from livekit.agents import APIConnectionError, JobProcess, llm, utils
 from livekit.agents.types import NOT_GIVEN, NotGivenOr
 from livekit.agents.metrics import RealtimeModelMetrics
 from livekit.agents.metrics.base import Metadata
 
 from .. import models
 from ..log import logger
+from . import pcm, telemetry
 from . import utils as realtime_utils
+from .backend import AzureSpeechBackend, RecognizerBackend
+from .bridge import LoopBridge
+from .decoder import AudioStreamDecoder
+from .executor import ExecutorStats, SDKExecutor
+from .ingest import (
+    OVERFLOW_POLICIES,
+    AudioIngestQueue,
+    IngestStats,
+    InputConverter,
+    OverflowPolicy,
+)
+from .pacer import AudioPacer, PacerStats
+from .preroll import PreRollBuffer
+from .reconnect import BackoffPolicy, CircuitBreaker, ReconnectStats
+from .routing import AudioRouter
+from .timeline import InputClock, LatencyDistribution, LatencyStats
+from .vad import EnergyVAD, VADGate, VADStats, VoiceActivityDetector
 
 
 _AUDIO_CHUNK_MS = 20
+_DEFAULT_INPUT_QUEUE_SIZE = 100
+_DEFAULT_PARTIAL_INTERVAL_MS = 250
+_DEFAULT_REPLAY_BUFFER_MS = 5000
+# longer than the service's default segmentation silence, so utterances still end
+_DEFAULT_VAD_HANGOVER_MS = 600
+_DEFAULT_VAD_PREROLL_MS = 300
+# errors a new connection cannot fix, so reconnecting would only hammer the service
+_FATAL_ERROR_CODES = (
+    speechsdk.CancellationErrorCode.AuthenticationFailure,
+    speechsdk.CancellationErrorCode.BadRequest,
+    speechsdk.CancellationErrorCode.Forbidden,
+)
+# result offsets and durations are reported in 100 ns ticks
+_TICKS_PER_SECOND = 10_000_000
+# how far back input arrival times are kept for mapping results to input
+_INPUT_CLOCK_WINDOW_S = 120
+# upper bound for a replaced recognizer to deliver results for audio it already received
+_DRAIN_TIMEOUT = 10.0
+# how long a replaced recognizer keeps receiving audio to finish the utterance in progress
+_SWAP_OVERLAP_TIMEOUT = 3.0
+# LiveKit publishes agent audio at 24 kHz by default, so frames need no resampling
+_DEFAULT_SYNTHESIS_SAMPLE_RATE = 24000
 
 
 @dataclass
@@ -34,8 +75,48 @@ class _LiveInterpreterOptions:
     use_personal_voice: bool
     speaker_profile_id: Optional[str]
     sample_rate: int
+    synthesis_sample_rate: Optional[int]
     enable_word_level_timestamps: bool
     profanity_option: Literal["masked", "removed", "raw"]
+    input_queue_size: int
+    input_overflow: OverflowPolicy
+    output_jitter_buffer_ms: Optional[int]
+    stream_partial_translations: bool
+    partial_interval_ms: int
+    connect_on_session: bool
+    hot_swap: bool
+    replay_buffer_ms: int
+    replay_buffer_max_bytes: Optional[int]
+    replay_trim_silence: bool
+    reconnect: bool
+    reconnect_backoff: BackoffPolicy
+    circuit_failure_threshold: int
+    circuit_reset_timeout: float
+    text_output: Literal["combined", "primary"]
+    input_vad: Optional[VoiceActivityDetector]
+    vad_hangover_ms: int
+    vad_preroll_ms: int
+    source_language: Optional[str]
+    source_languages: Optional[list[str]]
+    language_id_mode: Optional[models.LanguageIdMode]
+    latency_profile: str
+
+
+@dataclass
+class _RecognizerHandle:
+    recognizer: speechsdk.translation.TranslationRecognizer
+    audio_stream: speechsdk.audio.PushAudioInputStream
+    settings: tuple
+    stopped: asyncio.Event = field(default_factory=asyncio.Event)
+    draining: bool = False
+    # set on the SDK thread between the first partial of an utterance and its final result
+    utterance_open: bool = False
+    utterance_ended: asyncio.Event = field(default_factory=asyncio.Event)
+    # a replacement gets no input until the recognizers it replaces finalized their utterances
+    held: bool = False
+    # (stream position, pre-roll position) where each run of input written to the stream starts
+    timeline: list[tuple[int, int]] = field(default_factory=list)
+    stream_bytes: int = 0
 
 
 @dataclass
@@ -46,13 +127,87 @@ class _GenerationState:
     text_ch: utils.aio.Chan[str]
     audio_ch: utils.aio.Chan[rtc.AudioFrame]
     modalities: asyncio.Future[list[Literal["text", "audio"]]]
+    decoder: AudioStreamDecoder
     created_at: float
-    first_token_at: float | None = None
+    # monotonic clock from here on
+    started_at: float
+    chunker: Optional[realtime_utils.AudioChunker] = None
+    pacer: Optional[AudioPacer] = None
     completed_at: float | None = None
     output_text: list[str] = field(default_factory=list)
     text_done: bool = False
+    partial_text: Optional[str] = None
+    partial_hypothesis: str = ""
+    # when streamed partial text went out; the first may precede the end of speech
+    partial_sent_at: list[float] = field(default_factory=list)
     audio_done: bool = False
     audio_expected: bool = True
+    finalized: bool = False
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+    speech_start_at: Optional[float] = None
+    speech_end_at: Optional[float] = None
+    input_audio_duration: float = 0.0
+    output_audio_duration: float = 0.0
+    first_audio_at: Optional[float] = None
+    decode_time: float = 0.0
+    chunk_time: float = 0.0
+    span: Optional[Any] = None
+
+
+@dataclass(frozen=True)
+class _UtteranceTiming:
+    """Where a final result lies in its recognizer's stream"""
+
+    handle: _RecognizerHandle
+    start_ticks: int
+    end_ticks: int
+    audio_duration: float
+    language_latency: Optional[float] = None
+
+
+def prewarm(proc: JobProcess) -> None:
+    """
+    Worker ``prewarm_fnc`` preparing a process for Live Interpreter sessions.
+
+    Loads the Speech SDK native library and, when ``AZURE_SPEECH_REGION`` is
+    set, resolves the service host, so the first session of each job does not
+    pay for either. Combine with ``connect_on_session=True`` to also open the
+    recognizer connection as soon as the session is created::
+
+        cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
+    """
+    started_at = time.perf_counter()
+
+    # any SDK object forces the native library to load
+    speechsdk.audio.AudioStreamFormat(samples_per_second=16000, bits_per_sample=16, channels=1)
+
+    region = os.environ.get("AZURE_SPEECH_REGION")
+    if region:
+        host = urlparse(models.V2_ENDPOINT_TEMPLATE.format(region=region)).hostname
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            logger.debug("could not resolve %s while prewarming", host, exc_info=True)
+
+    proc.userdata["azure_live_interpreter_prewarmed"] = True
+    logger.debug(
+        "Live Interpreter prewarm done in %.0f ms", (time.perf_counter() - started_at) * 1000
+    )
+
+
+def _check_latency_profile(name: str) -> None:
+    if name not in models.LATENCY_PROFILES:
+        raise ValueError(
+            "Unknown latency_profile: {name}. Available profiles are {names}.".format(
+                name=name, names=sorted(models.LATENCY_PROFILES)
+            )
+        )
+
+
+def _log_start_failure(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        # the next audio frame retries the start
+        logger.warning("Live Interpreter prewarm failed to connect: %s", task.exception())
 
 
 class LiveInterpreterModel(llm.RealtimeModel):
@@ -67,8 +222,34 @@ class LiveInterpreterModel(llm.RealtimeModel):
         use_personal_voice: bool = True,
         speaker_profile_id: Optional[str] = None,
         sample_rate: int = 16000,
+        synthesis_sample_rate: Optional[int] = _DEFAULT_SYNTHESIS_SAMPLE_RATE,
         enable_word_level_timestamps: bool = False,
         profanity_option: Literal["masked", "removed", "raw"] = "masked",
+        input_queue_size: int = _DEFAULT_INPUT_QUEUE_SIZE,
+        input_overflow: OverflowPolicy = "drop_oldest",
+        output_jitter_buffer_ms: Optional[int] = None,
+        stream_partial_translations: bool = False,
+        partial_interval_ms: int = _DEFAULT_PARTIAL_INTERVAL_MS,
+        connect_on_session: bool = False,
+        hot_swap: bool = True,
+        replay_buffer_ms: int = _DEFAULT_REPLAY_BUFFER_MS,
+        replay_buffer_max_bytes: Optional[int] = None,
+        replay_trim_silence: bool = False,
+        reconnect: bool = True,
+        reconnect_backoff: BackoffPolicy = BackoffPolicy(),
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 30.0,
+        sdk_executor_workers: int = 4,
+        sdk_call_timeout: Optional[float] = 10.0,
+        text_output: Literal["combined", "primary"] = "combined",
+        input_vad: Optional[VoiceActivityDetector | Literal["energy"]] = None,
+        vad_hangover_ms: int = _DEFAULT_VAD_HANGOVER_MS,
+        vad_preroll_ms: int = _DEFAULT_VAD_PREROLL_MS,
+        source_language: Optional[str] = None,
+        source_languages: Optional[list[str]] = None,
+        language_id_mode: Optional[models.LanguageIdMode] = None,
+        latency_profile: str = "default",
+        backend: Optional[RecognizerBackend] = None,
     ) -> None:
         subscription_key = subscription_key or os.environ.get("AZURE_SPEECH_KEY")
         region = region or os.environ.get("AZURE_SPEECH_REGION")
@@ -92,6 +273,72 @@ class LiveInterpreterModel(llm.RealtimeModel):
                 "livekit.plugins.azure.models.SUPPORTED_TARGET_LANGUAGES".format(invalid=invalid)
             )
 
+        if (
+            synthesis_sample_rate is not None
+            and synthesis_sample_rate not in models.SYNTHESIS_OUTPUT_FORMATS
+        ):
+            raise ValueError(
+                "Unsupported synthesis_sample_rate: {rate}. Supported values are {rates} "
+                "or None to keep the service default.".format(
+                    rate=synthesis_sample_rate,
+                    rates=sorted(models.SYNTHESIS_OUTPUT_FORMATS),
+                )
+            )
+
+        if input_queue_size <= 0:
+            raise ValueError("input_queue_size must be a positive number of frames")
+
+        if input_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"input_overflow must be one of {OVERFLOW_POLICIES}, got {input_overflow!r}"
+            )
+
+        if output_jitter_buffer_ms is not None and output_jitter_buffer_ms < 0:
+            raise ValueError("output_jitter_buffer_ms must be >= 0 or None to disable pacing")
+
+        if partial_interval_ms < 0:
+            raise ValueError("partial_interval_ms must be >= 0")
+
+        if replay_buffer_ms < 0:
+            raise ValueError("replay_buffer_ms must be >= 0 (0 disables replay)")
+
+        if circuit_failure_threshold <= 0:
+            raise ValueError("circuit_failure_threshold must be positive")
+
+        if text_output not in ("combined", "primary"):
+            raise ValueError("text_output must be 'combined' or 'primary'")
+
+        if sdk_executor_workers <= 0:
+            raise ValueError("sdk_executor_workers must be positive")
+
+        if input_vad == "energy":
+            input_vad = EnergyVAD()
+        elif input_vad is not None and not isinstance(input_vad, VoiceActivityDetector):
+            raise ValueError("input_vad must be 'energy', a VoiceActivityDetector or None")
+
+        if vad_hangover_ms < 0 or vad_preroll_ms < 0:
+            raise ValueError("vad_hangover_ms and vad_preroll_ms must be >= 0")
+
+        if language_id_mode is not None:
+            if language_id_mode not in models.MAX_SOURCE_LANGUAGE_CANDIDATES:
+                raise ValueError("language_id_mode must be 'at_start' or 'continuous'")
+            if source_languages is None:
+                raise ValueError("language_id_mode applies only with source_languages candidates")
+
+        _check_latency_profile(latency_profile)
+
+        if source_language is not None and source_languages is not None:
+            raise ValueError("pass either source_language or source_languages, not both")
+
+        if source_languages is not None:
+            language_id_mode = language_id_mode or "continuous"
+            limit = models.MAX_SOURCE_LANGUAGE_CANDIDATES[language_id_mode]
+            if not 0 < len(source_languages) <= limit:
+                raise ValueError(
+                    "source_languages takes 1 to {limit} candidates with "
+                    "language_id_mode={mode!r}".format(limit=limit, mode=language_id_mode)
+                )
+
         super().__init__(
             capabilities=llm.RealtimeCapabilities(
                 message_truncation=False,
@@ -110,12 +357,40 @@ class LiveInterpreterModel(llm.RealtimeModel):
             use_personal_voice=use_personal_voice,
             speaker_profile_id=speaker_profile_id,
             sample_rate=sample_rate,
+            synthesis_sample_rate=synthesis_sample_rate,
             enable_word_level_timestamps=enable_word_level_timestamps,
             profanity_option=profanity_option,
+            input_queue_size=input_queue_size,
+            input_overflow=input_overflow,
+            output_jitter_buffer_ms=output_jitter_buffer_ms,
+            stream_partial_translations=stream_partial_translations,
+            partial_interval_ms=partial_interval_ms,
+            connect_on_session=connect_on_session,
+            hot_swap=hot_swap,
+            replay_buffer_ms=replay_buffer_ms,
+            replay_buffer_max_bytes=replay_buffer_max_bytes,
+            replay_trim_silence=replay_trim_silence,
+            reconnect=reconnect,
+            reconnect_backoff=reconnect_backoff,
+            circuit_failure_threshold=circuit_failure_threshold,
+            circuit_reset_timeout=circuit_reset_timeout,
+            text_output=text_output,
+            input_vad=input_vad,
+            vad_hangover_ms=vad_hangover_ms,
+            vad_preroll_ms=vad_preroll_ms,
+            source_language=source_language,
+            source_languages=source_languages,
+            language_id_mode=language_id_mode,
+            latency_profile=latency_profile,
         )
 
         self._sessions = weakref.WeakSet[LiveInterpreterSession]()
         self._label = f"azure.live_interpreter.{region}"
+        # shared by all sessions so connect storms stay off the loop's default executor
+        self._executor = SDKExecutor(
+            max_workers=sdk_executor_workers, call_timeout=sdk_call_timeout
+        )
+        self._backend: RecognizerBackend = backend or AzureSpeechBackend()
 
     @property
     def model(self) -> str:
@@ -128,10 +403,20 @@ class LiveInterpreterModel(llm.RealtimeModel):
     def session(self) -> "LiveInterpreterSession":
         sess = LiveInterpreterSession(self)
         self._sessions.add(sess)
+        if self._opts.connect_on_session:
+            sess.prewarm()
         return sess
 
+    @property
+    def executor_stats(self) -> ExecutorStats:
+        """Queue depth and wait times of the thread pool running blocking SDK calls."""
+        return self._executor.stats()
+
     async def aclose(self) -> None:
-        await asyncio.gather(*(sess.aclose() for sess in list(self._sessions)), return_exceptions=True)
+        await asyncio.gather(
+            *(sess.aclose() for sess in list(self._sessions)), return_exceptions=True
+        )
+        self._executor.shutdown()
 
     def update_options(
         self,
@@ -139,6 +424,7 @@ class LiveInterpreterModel(llm.RealtimeModel):
         target_languages: Optional[list[str]] = None,
         use_personal_voice: Optional[bool] = None,
         speaker_profile_id: Optional[str] = None,
+        latency_profile: Optional[str] = None,
     ) -> None:
         if target_languages is not None:
             invalid = [lang for lang in target_languages if lang not in models.SUPPORTED_TARGET_LANGUAGES]
@@ -155,11 +441,16 @@ class LiveInterpreterModel(llm.RealtimeModel):
         if speaker_profile_id is not None:
             self._opts.speaker_profile_id = speaker_profile_id
 
+        if latency_profile is not None:
+            _check_latency_profile(latency_profile)
+            self._opts.latency_profile = latency_profile
+
         for sess in list(self._sessions):
             sess.update_model_options(
                 target_languages=self._opts.target_languages,
                 use_personal_voice=self._opts.use_personal_voice,
                 speaker_profile_id=self._opts.speaker_profile_id,
+                latency_profile=self._opts.latency_profile,
             )
 
 
@@ -168,28 +459,79 @@ class LiveInterpreterSession(llm.RealtimeSession):
         super().__init__(realtime_model)
         self._realtime_model = realtime_model
         self._opts = realtime_model._opts
+        # shared with the model's other sessions
+        self._executor = realtime_model._executor
+        self._backend = realtime_model._backend
 
         try:
             self._loop = asyncio.get_running_loop()
         except RuntimeError:
             self._loop = asyncio.get_event_loop_policy().get_event_loop()
+        # SDK callbacks reach the loop through a bridge shared by all sessions on it
+        self._bridge = LoopBridge.for_loop(self._loop)
 
         self._tools = llm.ToolContext.empty()
         self._chat_ctx = llm.ChatContext.empty()
 
-        self._recognizer: Optional[speechsdk.translation.TranslationRecognizer] = None
-        self._audio_stream: Optional[speechsdk.audio.PushAudioInputStream] = None
-        self._input_resampler: Optional[rtc.AudioResampler] = None
-        self._resampler_input_rate: Optional[int] = None
-        self._resampler_input_channels: Optional[int] = None
+        self._active: Optional[_RecognizerHandle] = None
+        self._drain_tasks: set[asyncio.Task[None]] = set()
+        # replaced recognizers still fed input until they finalize their utterance
+        self._outgoing: list[_RecognizerHandle] = []
+        self._swap_task: Optional[asyncio.Task[None]] = None
+
+        self._reconnect_task: Optional[asyncio.Task[None]] = None
+        self._circuit = CircuitBreaker(
+            failure_threshold=self._opts.circuit_failure_threshold,
+            reset_timeout=self._opts.circuit_reset_timeout,
+        )
+        self._reconnects = 0
+        self._failed_reconnects = 0
+        self._last_reconnect_latency: Optional[float] = None
+        self._input_converter = InputConverter(output_rate=self._opts.sample_rate)
+        self._preroll = PreRollBuffer(
+            sample_rate=self._opts.sample_rate,
+            duration_ms=self._opts.replay_buffer_ms,
+            max_bytes=self._opts.replay_buffer_max_bytes,
+        )
+        self._input_clock = InputClock(
+            window_bytes=self._opts.sample_rate * 2 * _INPUT_CLOCK_WINDOW_S
+        )
+        self._end_to_end = LatencyDistribution()
+        self._lag_behind_live = LatencyDistribution()
+        self._vad_gate: Optional[VADGate] = None
+        if self._opts.input_vad is not None:
+            self._vad_gate = VADGate(
+                self._opts.input_vad,
+                sample_rate=self._opts.sample_rate,
+                hangover_ms=self._opts.vad_hangover_ms,
+                preroll_ms=self._opts.vad_preroll_ms,
+            )
+
+        self._input_queue = AudioIngestQueue(
+            maxsize=self._opts.input_queue_size,
+            overflow=self._opts.input_overflow,
+        )
+        self._ingest_task: Optional[asyncio.Task[None]] = None
 
         self._is_running = False
+        self._start_task: Optional[asyncio.Task[None]] = None
+        self._time_to_ready: Optional[float] = None
         self._session_id: Optional[str] = None
 
         self._current_generation: Optional[_GenerationState] = None
+        # partials of the next utterance that arrived while the current one was still speaking
+        self._deferred_partials: list[tuple[str, str]] = []
+        # partial throttling state, only touched on the SDK callback thread
+        self._last_partial_at = 0.0
+        self._last_partial_text: Optional[str] = None
+        self._language_latency: Optional[float] = None
+        self._active_pacers: set[AudioPacer] = set()
+        self._text_subscribers: dict[str, list[utils.aio.Chan[str]]] = {}
+        self._audio_router = AudioRouter(jitter_buffer_ms=self._opts.output_jitter_buffer_ms)
         self._pending_generation_fut: Optional[asyncio.Future[llm.GenerationCreatedEvent]] = None
 
         self._shutdown = asyncio.Event()
+        telemetry.track_session(self)
 
     # ------------------------------------------------------------------
     # Properties and configuration updates
@@ -202,6 +544,110 @@ class LiveInterpreterSession(llm.RealtimeSession):
     def tools(self) -> llm.ToolContext:
         return self._tools.copy()
 
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        """Seconds the last recognizer start took to connect, None until started."""
+        return self._time_to_ready
+
+    @property
+    def reconnect_stats(self) -> ReconnectStats:
+        """Reconnect counters, latency of the last reconnect and circuit breaker state."""
+        return ReconnectStats(
+            reconnects=self._reconnects,
+            failed_attempts=self._failed_reconnects,
+            last_reconnect_latency=self._last_reconnect_latency,
+            circuit_state=self._circuit.state,
+        )
+
+    @property
+    def input_stats(self) -> IngestStats:
+        """Counters for frames queued, dropped and pending in the input pipeline."""
+        return self._input_queue.stats()
+
+    @property
+    def latency_stats(self) -> LatencyStats:
+        """Distributions of end-of-speech to output and of output lag behind live input."""
+        return LatencyStats(
+            end_to_end=self._end_to_end.summary(),
+            lag_behind_live=self._lag_behind_live.summary(),
+        )
+
+    @property
+    def vad_stats(self) -> Optional[VADStats]:
+        """Share of the input withheld as silence and CPU spent deciding, if gating is enabled."""
+        if self._vad_gate is None:
+            return None
+        return self._vad_gate.stats()
+
+    @property
+    def output_stats(self) -> Optional[PacerStats]:
+        """Buffering of the current generation's paced audio, if pacing is enabled."""
+        generation = self._current_generation
+        if generation is None or generation.pacer is None:
+            return None
+        return generation.pacer.stats()
+
+    def subscribe_text(self, language: str) -> utils.aio.Chan[str]:
+        """
+        Open a stream of final translations in one target language.
+
+        Each item is the plain translated text of one utterance. Streams are
+        closed when the session closes, or earlier with ``unsubscribe_text``.
+        Typed results for all languages at once are emitted as
+        ``translation_result`` events carrying a ``models.TranslationResult``.
+        """
+        if language not in self._opts.target_languages:
+            raise ValueError(
+                f"{language!r} is not a target language of this session "
+                f"({self._opts.target_languages})"
+            )
+
+        ch = utils.aio.Chan[str]()
+        self._text_subscribers.setdefault(language, []).append(ch)
+        return ch
+
+    def unsubscribe_text(self, ch: utils.aio.Chan[str]) -> None:
+        for language, channels in list(self._text_subscribers.items()):
+            if ch in channels:
+                channels.remove(ch)
+                if not channels:
+                    del self._text_subscribers[language]
+        if not ch.closed:
+            ch.close()
+
+    @property
+    def voiced_language(self) -> Optional[str]:
+        """
+        The target language synthesized audio is in.
+
+        The service voices one target language per recognizer, the first of
+        ``target_languages``; the others are translated as text only.
+        """
+        return self._opts.target_languages[0] if self._opts.target_languages else None
+
+    def subscribe_audio(self, language: str) -> utils.aio.Chan[rtc.AudioFrame]:
+        """
+        Open a stream of synthesized audio frames in the voiced language.
+
+        The stream spans utterances, e.g. to publish the translation as its
+        own track, and is paced like the generation audio when
+        ``output_jitter_buffer_ms`` is set. It carries the generation's frames,
+        so subscribing adds no chunking work. If ``update_options`` makes
+        another language the voiced one, the stream stays open without audio.
+
+        Raises:
+            ValueError: If ``language`` is not ``voiced_language``
+        """
+        if language != self.voiced_language:
+            raise ValueError(
+                f"{language!r} is not voiced by this session; synthesized audio is in "
+                f"{self.voiced_language!r}, the first of target_languages"
+            )
+        return self._audio_router.subscribe(language)
+
+    def unsubscribe_audio(self, ch: utils.aio.Chan[rtc.AudioFrame]) -> None:
+        self._audio_router.unsubscribe(ch)
+
     def update_options(
         self,
         *,
@@ -209,26 +655,33 @@ class LiveInterpreterSession(llm.RealtimeSession):
         target_languages: Optional[list[str]] = None,
         use_personal_voice: Optional[bool] = None,
         speaker_profile_id: Optional[str] = None,
+        latency_profile: Optional[str] = None,
     ) -> None:
         if tool_choice is not None:
             logger.warning("Live Interpreter does not support tool choice updates. Ignoring request.")
 
-        needs_restart = False
-
-        if target_languages is not None and target_languages != self._opts.target_languages:
+        if target_languages is not None:
             self._opts.target_languages = target_languages
-            needs_restart = True
 
-        if use_personal_voice is not None and use_personal_voice != self._opts.use_personal_voice:
+        if use_personal_voice is not None:
             self._opts.use_personal_voice = use_personal_voice
-            needs_restart = True
 
-        if speaker_profile_id is not None and speaker_profile_id != self._opts.speaker_profile_id:
+        if speaker_profile_id is not None:
             self._opts.speaker_profile_id = speaker_profile_id
-            needs_restart = True
 
-        if needs_restart:
-            asyncio.create_task(self._restart_recognition())
+        if latency_profile is not None:
+            _check_latency_profile(latency_profile)
+            self._opts.latency_profile = latency_profile
+
+        # compare against the running recognizer: the options object is shared with
+        # the model, which has already applied the values when it forwards an update
+        if self._active is None or self._active.settings == self._recognizer_settings():
+            return
+
+        if self._swap_task is None or self._swap_task.done():
+            self._swap_task = asyncio.create_task(
+                self._replace_recognizer(), name="azure-li-replace-recognizer"
+            )
 
     def update_model_options(
         self,
@@ -236,11 +689,13 @@ class LiveInterpreterSession(llm.RealtimeSession):
         target_languages: list[str],
         use_personal_voice: bool,
         speaker_profile_id: Optional[str],
+        latency_profile: Optional[str] = None,
     ) -> None:
         self.update_options(
             target_languages=target_languages,
             use_personal_voice=use_personal_voice,
             speaker_profile_id=speaker_profile_id,
+            latency_profile=latency_profile,
         )
 
     async def update_instructions(self, instructions: str) -> None:
@@ -257,9 +712,43 @@ class LiveInterpreterSession(llm.RealtimeSession):
     # ------------------------------------------------------------------
     # Session lifecycle
     # ------------------------------------------------------------------
+    def prewarm(self) -> None:
+        """Start connecting to the service now instead of on the first audio frame."""
+        if self._shutdown.is_set() or self._is_running:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("no running event loop, Live Interpreter will connect on first audio")
+            return
+
+        task = self._start_task_or_create()
+        task.add_done_callback(_log_start_failure)
+
     async def aclose(self) -> None:
         self._shutdown.set()
+
+        if self._ingest_task is not None:
+            await utils.aio.cancel_and_wait(self._ingest_task)
+            self._ingest_task = None
+        self._input_queue.clear()
+
+        if self._swap_task is not None:
+            await utils.aio.cancel_and_wait(self._swap_task)
+            self._swap_task = None
+
+        if self._reconnect_task is not None:
+            await utils.aio.cancel_and_wait(self._reconnect_task)
+            self._reconnect_task = None
+
+        if self._start_task is not None and not self._start_task.done():
+            # let an in-flight start settle so the recognizer it creates is stopped below
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._start_task)
+
         await self._stop_recognition()
+        await utils.aio.cancel_and_wait(*self._drain_tasks)
 
         if self._pending_generation_fut and not self._pending_generation_fut.done():
             self._pending_generation_fut.cancel()
@@ -268,163 +757,453 @@ class LiveInterpreterSession(llm.RealtimeSession):
         if self._current_generation:
             self._finalize_generation(interrupted=True)
 
+        for channels in self._text_subscribers.values():
+            for ch in channels:
+                ch.close()
+        self._text_subscribers.clear()
+
+        await asyncio.gather(
+            *(pacer.aclose() for pacer in list(self._active_pacers)),
+            self._audio_router.aclose(),
+            return_exceptions=True,
+        )
+
+    def _recognizer_settings(self) -> tuple:
+        """Options baked into a recognizer when it is created."""
+        return (
+            tuple(self._opts.target_languages),
+            self._opts.use_personal_voice,
+            self._opts.speaker_profile_id,
+            self._opts.latency_profile,
+        )
+
+    def _recognizer_config(self) -> models.LiveInterpreterConfig:
+        """The options a backend creates a recognizer from."""
+        opts = self._opts
+        return models.LiveInterpreterConfig(
+            subscription_key=opts.subscription_key,
+            region=opts.region,
+            target_languages=list(opts.target_languages),
+            use_personal_voice=opts.use_personal_voice,
+            speaker_profile_id=opts.speaker_profile_id,
+            sample_rate=opts.sample_rate,
+            enable_word_level_timestamps=opts.enable_word_level_timestamps,
+            profanity_option=opts.profanity_option,
+            synthesis_sample_rate=opts.synthesis_sample_rate,
+            latency_profile=opts.latency_profile,
+            source_language=opts.source_language,
+            source_languages=opts.source_languages,
+            language_id_mode=opts.language_id_mode,
+        )
+
+    async def _settle_start(self) -> None:
+        if self._start_task is not None and not self._start_task.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._start_task)
+
+    async def _replace_recognizer(self) -> None:
+        await self._settle_start()
+        # options can change again while a replacement connects; repeat until they match
+        while self._active is not None and self._active.settings != self._recognizer_settings():
+            if not self._opts.hot_swap:
+                await self._restart_recognition()
+            elif not await self._swap_recognizer():
+                break
+
     async def _restart_recognition(self) -> None:
+        """Break-before-make replacement: audio pushed meanwhile waits for the new recognizer."""
         await self._stop_recognition()
-        if self._is_running:
-            return
         try:
-            await self._start_recognition()
+            await self._ensure_started()
         except Exception:
             logger.exception("Failed to restart Live Interpreter session")
 
-    async def _start_recognition(self) -> None:
-        if self._is_running:
-            return
+    async def _swap_recognizer(self) -> bool:
+        """
+        Make-before-break replacement of the running recognizer.
+
+        The new recognizer connects while the old one keeps receiving audio.
+        Writes then move to the new stream. If the old recognizer is in the
+        middle of an utterance, it alone is fed until it finalizes it, and the
+        new one is held: the input stays in the pre-roll and is replayed to it
+        from the end of that utterance, so the utterance is recognized once.
+        The old stream is then ended, and the old recognizer is stopped in the
+        background once it has flushed and the generation it feeds completed.
+        """
+        try:
+            new = await self._connect_recognizer()
+        except Exception:
+            logger.exception("Failed to connect replacement recognizer, keeping the current one")
+            return False
 
-        loop = asyncio.get_running_loop()
-        self._loop = loop
+        old, self._active = self._active, new
+        self._is_running = True
 
-        try:
-            endpoint = models.V2_ENDPOINT_TEMPLATE.format(region=self._opts.region)
+        if old is not None and old.utterance_open:
+            # registered before the next frame, so the old stream has no gap
+            self._outgoing.append(old)
+        if self._outgoing:
+            new.held = True
+        else:
+            # no replay: the old recognizer finished the audio it was given
+            new.timeline.append((0, self._preroll.head))
 
-            translation_config = speechsdk.translation.SpeechTranslationConfig(
-                endpoint=endpoint,
-                subscription=self._opts.subscription_key,
+        if old is not None:
+            old.draining = True
+            task = asyncio.create_task(
+                self._drain_recognizer(old), name="azure-li-drain-recognizer"
             )
+            self._drain_tasks.add(task)
+            task.add_done_callback(self._drain_tasks.discard)
+        return True
 
-            for lang in self._opts.target_languages:
-                translation_config.add_target_language(lang)
+    async def _drain_recognizer(self, handle: _RecognizerHandle) -> None:
+        try:
+            if handle in self._outgoing:
+                try:
+                    await asyncio.wait_for(handle.utterance_ended.wait(), _SWAP_OVERLAP_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.debug("replaced recognizer did not finalize its utterance in time")
+                finally:
+                    self._outgoing.remove(handle)
+                    self._resume_input()
 
-            if self._opts.use_personal_voice:
-                translation_config.voice_name = "personal-voice"
-                if self._opts.speaker_profile_id:
-                    translation_config.set_property(
-                        speechsdk.PropertyId.SpeechServiceResponse_RequestSpeakerProfileId,
-                        self._opts.speaker_profile_id,
-                    )
+            with contextlib.suppress(Exception):
+                # end of stream: the recognizer flushes what it has and stops on its own
+                handle.audio_stream.close()
 
-            translation_config.set_profanity(
-                getattr(speechsdk.ProfanityOption, self._opts.profanity_option.capitalize())
+            try:
+                await asyncio.wait_for(handle.stopped.wait(), _DRAIN_TIMEOUT)
+                # results are dispatched before the stop, so this is the generation they fed
+                generation = self._current_generation
+                if generation is not None:
+                    await asyncio.wait_for(generation.finished.wait(), _DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("replaced Live Interpreter recognizer did not drain in time")
+        finally:
+            await self._close_recognizer(handle)
+
+    def _resume_input(self) -> None:
+        """Start feeding a held replacement once no recognizer is finishing an utterance."""
+        handle = self._active
+        if self._outgoing or handle is None or not handle.held:
+            return
+        handle.held = False
+        # the finished utterances released their input, so this starts where they ended
+        self._replay_input(handle)
+
+    def _schedule_reconnect(self) -> None:
+        if self._shutdown.is_set() or not self._opts.reconnect:
+            return
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+        self._reconnect_task = asyncio.create_task(
+            self._reconnect_loop(), name="azure-li-reconnect"
+        )
+
+    async def _reconnect_loop(self) -> None:
+        """
+        Restore the connection after an error, with backoff and circuit breaking.
+
+        Input keeps flowing into the pre-roll ring meanwhile and is replayed by
+        the start that succeeds.
+        """
+        lost_at = time.monotonic()
+        attempt = 0
+        while not self._shutdown.is_set():
+            wait = self._circuit.retry_after()
+            if wait > 0.0:
+                logger.warning(
+                    "Live Interpreter circuit open, next connection attempt in %.1f s", wait
+                )
+                await asyncio.sleep(wait)
+                continue
+
+            await asyncio.sleep(self._opts.reconnect_backoff.delay(attempt))
+            if not self._circuit.allow():
+                continue
+
+            # the failed recognizer is closed by the start that replaces it
+            self._is_running = False
+            try:
+                await self._ensure_started()
+            except Exception:
+                self._circuit.record_failure()
+                self._failed_reconnects += 1
+                attempt += 1
+                continue
+
+            self._circuit.record_success()
+            self._reconnects += 1
+            self._last_reconnect_latency = time.monotonic() - lost_at
+            logger.info(
+                "Live Interpreter reconnected after %d attempt(s) in %.0f ms",
+                attempt + 1,
+                self._last_reconnect_latency * 1000,
             )
+            return
 
-            if self._opts.enable_word_level_timestamps:
-                translation_config.request_word_level_timestamps()
+    def _start_task_or_create(self) -> asyncio.Task[None]:
+        if self._start_task is None or self._start_task.done():
+            self._start_task = asyncio.create_task(
+                self._start_recognition(), name="azure-li-start-recognition"
+            )
+        return self._start_task
+
+    def _start_in_background(self) -> None:
+        if self._start_task is not None and not self._start_task.done():
+            return
+        self._start_task_or_create().add_done_callback(self._on_background_start_done)
+
+    def _on_background_start_done(self, task: asyncio.Task[None]) -> None:
+        if task.cancelled() or task.exception() is None or self._shutdown.is_set():
+            return
+        # retry with backoff instead of on every frame
+        self._circuit.record_failure()
+        self._schedule_reconnect()
+
+    async def _ensure_started(self) -> None:
+        """Wait for the recognizer, sharing a start already in flight (e.g. from prewarm)."""
+        if self._is_running:
+            return
+        # shielded so a cancelled caller does not abort a start other callers wait on
+        await asyncio.shield(self._start_task_or_create())
 
-            auto_detect_config = speechsdk.AutoDetectSourceLanguageConfig()
+    async def _start_recognition(self) -> None:
+        if self._is_running:
+            return
 
-            audio_format = speechsdk.audio.AudioStreamFormat(
-                samples_per_second=self._opts.sample_rate,
-                bits_per_sample=16,
-                channels=1,
+        self._loop = asyncio.get_running_loop()
+        self._bridge = LoopBridge.for_loop(self._loop)
+        with telemetry.span(
+            "azure_li.start_recognition",
+            {"target_languages": list(self._opts.target_languages)},
+        ):
+            handle = await self._connect_recognizer()
+            self._replay_input(handle)
+
+        stale, self._active = self._active, handle
+        self._is_running = True
+        if stale is not None:
+            # the service ended the previous session on its own
+            await self._close_recognizer(stale)
+
+    def _replay_input(self, handle: _RecognizerHandle) -> None:
+        """Write audio no recognizer has finalized yet into a freshly connected stream."""
+        replayed = 0
+        for position, view in self._preroll.pending(trim_silence=self._opts.replay_trim_silence):
+            handle.timeline.append((handle.stream_bytes, position))
+            try:
+                handle.audio_stream.write(pcm.as_write_buffer(view))
+            except Exception:  # pragma: no cover - SDK level exceptions
+                logger.exception("Failed to replay buffered audio to Live Interpreter")
+                break
+            handle.stream_bytes += len(view)
+            replayed += len(view)
+
+        handle.timeline.append((handle.stream_bytes, self._preroll.head))
+        if replayed:
+            logger.debug(
+                "replayed %.0f ms of buffered audio", replayed * 1000 / (self._opts.sample_rate * 2)
             )
-            self._audio_stream = speechsdk.audio.PushAudioInputStream(audio_format)
-            audio_config = speechsdk.audio.AudioConfig(stream=self._audio_stream)
 
-            self._recognizer = speechsdk.translation.TranslationRecognizer(
-                translation_config=translation_config,
-                auto_detect_source_language_config=auto_detect_config,
-                audio_config=audio_config,
+    def _release_input(self, handle: _RecognizerHandle, end_ticks: int) -> None:
+        """Mark input up to the end of a final result as handled."""
+        position = self._input_position(handle, end_ticks)
+        if position is None:
+            return
+        self._preroll.release(position)
+        self._input_clock.forget(position)
+
+    def _input_position(self, handle: _RecognizerHandle, ticks: int) -> Optional[int]:
+        """Map a result offset in a recognizer's stream to a position in the session input."""
+        position = ticks * self._opts.sample_rate // _TICKS_PER_SECOND * 2
+        index = bisect.bisect_right(handle.timeline, (position, float("inf"))) - 1
+        if index < 0:
+            return None
+        stream_start, preroll_start = handle.timeline[index]
+        return preroll_start + position - stream_start
+
+    def _input_time(self, handle: _RecognizerHandle, ticks: int) -> Optional[float]:
+        """Monotonic time the input sample at a result offset was pushed."""
+        position = self._input_position(handle, ticks)
+        if position is None:
+            return None
+        return self._input_clock.time_of(position)
+
+    async def _connect_recognizer(self) -> _RecognizerHandle:
+        """Create a recognizer for the current options and wait until it is started."""
+        executor = self._executor
+        started_at = time.perf_counter()
+
+        try:
+            recognizer, audio_stream = self._backend.create(self._recognizer_config())
+            handle = _RecognizerHandle(
+                recognizer=recognizer,
+                audio_stream=audio_stream,
+                settings=self._recognizer_settings(),
             )
 
-            self._recognizer.recognizing.connect(self._on_recognizing)
-            self._recognizer.recognized.connect(self._on_recognized)
-            self._recognizer.synthesizing.connect(self._on_synthesizing)
-            self._recognizer.canceled.connect(self._on_canceled)
-            self._recognizer.session_started.connect(self._on_session_started)
-            self._recognizer.session_stopped.connect(self._on_session_stopped)
+            recognizer.recognizing.connect(functools.partial(self._on_recognizing, handle))
+            recognizer.recognized.connect(functools.partial(self._on_recognized, handle))
+            recognizer.synthesizing.connect(self._on_synthesizing)
+            recognizer.canceled.connect(functools.partial(self._on_canceled, handle))
+            recognizer.session_started.connect(self._on_session_started)
+            recognizer.session_stopped.connect(functools.partial(self._on_session_stopped, handle))
 
-            await loop.run_in_executor(None, self._recognizer.start_continuous_recognition)
-            self._is_running = True
+            try:
+                await executor.run(recognizer.start_continuous_recognition)
+            except asyncio.TimeoutError:
+                # the start may still complete on its thread; make sure it is undone
+                executor.submit(recognizer.stop_continuous_recognition)
+                raise
+            self._time_to_ready = time.perf_counter() - started_at
+            instruments = telemetry.get()
+            if instruments is not None:
+                instruments.connect_time.record(self._time_to_ready)
             logger.info(
-                "Live Interpreter session started with targets %s",
+                "Live Interpreter session started with targets %s, ready in %.0f ms",
                 self._opts.target_languages,
+                self._time_to_ready * 1000,
             )
+            return handle
         except Exception as exc:  # pragma: no cover - SDK level errors
             logger.exception("Failed to start Live Interpreter session")
             raise APIConnectionError(f"Failed to connect to Azure Speech Service: {exc}")
 
     async def _stop_recognition(self) -> None:
-        if not self._is_running:
-            return
-
         self._is_running = False
 
-        if self._recognizer:
-            try:
-                await asyncio.get_running_loop().run_in_executor(
-                    None, self._recognizer.stop_continuous_recognition
-                )
-            except Exception:  # pragma: no cover - best effort
-                logger.debug("Error stopping Live Interpreter recognizer", exc_info=True)
+        handle, self._active = self._active, None
+        if handle is not None:
+            await self._close_recognizer(handle)
 
-            with contextlib.suppress(Exception):
-                self._recognizer.recognizing.disconnect_all()
-                self._recognizer.recognized.disconnect_all()
-                self._recognizer.synthesizing.disconnect_all()
-                self._recognizer.canceled.disconnect_all()
-                self._recognizer.session_started.disconnect_all()
-                self._recognizer.session_stopped.disconnect_all()
+        self._input_converter.reset()
 
-            self._recognizer = None
+    async def _close_recognizer(self, handle: _RecognizerHandle) -> None:
+        recognizer = handle.recognizer
+        try:
+            await self._executor.run(recognizer.stop_continuous_recognition)
+        except Exception:  # pragma: no cover - best effort
+            logger.debug("Error stopping Live Interpreter recognizer", exc_info=True)
 
-        if self._audio_stream:
-            with contextlib.suppress(Exception):
-                self._audio_stream.close()
-            self._audio_stream = None
+        with contextlib.suppress(Exception):
+            recognizer.recognizing.disconnect_all()
+            recognizer.recognized.disconnect_all()
+            recognizer.synthesizing.disconnect_all()
+            recognizer.canceled.disconnect_all()
+            recognizer.session_started.disconnect_all()
+            recognizer.session_stopped.disconnect_all()
 
-        self._input_resampler = None
-        self._resampler_input_rate = None
-        self._resampler_input_channels = None
+        with contextlib.suppress(Exception):
+            handle.audio_stream.close()
 
     # ------------------------------------------------------------------
     # Required realtime session interface
     # ------------------------------------------------------------------
     def push_audio(self, frame: rtc.AudioFrame) -> None:
-        asyncio.create_task(self._push_audio_async(frame))
+        if self._shutdown.is_set():
+            return
+
+        self._input_queue.put_nowait(frame)
+
+        if self._ingest_task is None:
+            self._ingest_task = asyncio.create_task(
+                self._ingest_loop(), name="azure-li-audio-ingest"
+            )
+
+    async def _ingest_loop(self) -> None:
+        # single consumer keeps frames in order, also while a start without replay is awaited
+        while not self._shutdown.is_set():
+            frame = await self._input_queue.get()
+            try:
+                await self._push_audio_async(frame)
+            except Exception:
+                logger.exception("Failed to ingest audio frame for Live Interpreter")
 
     async def _push_audio_async(self, frame: rtc.AudioFrame) -> None:
         if self._shutdown.is_set():
             return
 
-        if not self._is_running:
-            await self._start_recognition()
+        buffers = self._input_converter.convert(frame)
+        # buffered before any connection attempt, so a failed start loses nothing
+        for buf in buffers:
+            self._preroll.write(buf)
+        self._input_clock.record(self._preroll.head, time.monotonic())
 
-        if not self._audio_stream:
+        if not self._is_running:
+            if self._reconnect_task is not None and not self._reconnect_task.done():
+                # the supervisor owns connecting; the frame waits in the pre-roll
+                return
+            if self._preroll.capacity:
+                # the start replays the pre-roll, which holds this frame; connecting in
+                # the background keeps the ingest queue draining meanwhile
+                self._start_in_background()
+                return
+            try:
+                await self._ensure_started()
+            except Exception:
+                # retry with backoff instead of on every frame
+                self._circuit.record_failure()
+                self._schedule_reconnect()
+                raise
+
+        # read once per frame: a recognizer swap may replace the handle between frames
+        handle = self._active
+        if handle is None:
             logger.warning("Audio stream not initialized for Live Interpreter")
             return
 
+        resumes: list[tuple[int, int]] = []
+        if self._vad_gate is not None:
+            buffers, resumes = self._gate_input(buffers)
+
+        if not handle.held:
+            self._write_input(handle, buffers, resumes)
+        for outgoing in self._outgoing:
+            self._write_input(outgoing, buffers, resumes)
+
+    def _write_input(
+        self,
+        handle: _RecognizerHandle,
+        buffers: list[pcm.WriteBuffer],
+        resumes: list[tuple[int, int]],
+    ) -> None:
+        for offset, position in resumes:
+            handle.timeline.append((handle.stream_bytes + offset, position))
         try:
-            data = frame.data.tobytes()
-            channels = frame.num_channels
-
-            if channels > 1:
-                data = audioop.tomono(data, 2, 0.5, 0.5)
-                channels = 1
-
-            samples_per_channel = len(data) // (2 * channels)
-
-            if frame.sample_rate != self._opts.sample_rate:
-                if (
-                    self._input_resampler is None
-                    or self._resampler_input_rate != frame.sample_rate
-                    or self._resampler_input_channels != channels
-                ):
-                    self._input_resampler = rtc.AudioResampler(
-                        input_rate=frame.sample_rate,
-                        output_rate=self._opts.sample_rate,
-                        num_channels=channels,
-                    )
-                    self._resampler_input_rate = frame.sample_rate
-                    self._resampler_input_channels = channels
-
-                input_frame = rtc.AudioFrame(data, frame.sample_rate, channels, samples_per_channel)
-                for resampled in self._input_resampler.push(input_frame):
-                    self._audio_stream.write(resampled.data.tobytes())
-            else:
-                self._audio_stream.write(data)
+            for buf in buffers:
+                handle.audio_stream.write(buf)
+                handle.stream_bytes += memoryview(buf).nbytes
         except Exception:  # pragma: no cover - SDK level exceptions
             logger.exception("Failed to push audio to Live Interpreter")
 
+    def _gate_input(
+        self, buffers: list[pcm.WriteBuffer]
+    ) -> tuple[list[pcm.WriteBuffer], list[tuple[int, int]]]:
+        """
+        Pass a frame's buffers through the VAD gate.
+
+        Returns the buffers to stream and, for each place the stream resumes
+        after skipped silence, its offset into them and its pre-roll position.
+        """
+        assert self._vad_gate is not None
+        out: list[pcm.WriteBuffer] = []
+        resumes: list[tuple[int, int]] = []
+        # the frame was already written to the pre-roll, ending at its head
+        position = self._preroll.head - sum(memoryview(buf).nbytes for buf in buffers)
+        offset = 0
+        for buf in buffers:
+            position += memoryview(buf).nbytes
+            passed, resumed = self._vad_gate.process(buf)
+            sizes = [memoryview(p).nbytes for p in passed]
+            if resumed:
+                # skipped silence breaks the stream/pre-roll correspondence
+                resumes.append((offset, position - sum(sizes)))
+            offset += sum(sizes)
+            out.extend(passed)
+        return out, resumes
+
     def push_video(self, frame: rtc.VideoFrame) -> None:
         logger.debug("Live Interpreter does not accept video input. Ignoring frame.")
 
@@ -481,43 +1260,131 @@ class LiveInterpreterSession(llm.RealtimeSession):
         self._session_id = evt.session_id
         logger.debug("Live Interpreter session started: %s", self._session_id)
 
-    def _on_session_stopped(self, evt: speechsdk.SessionEventArgs) -> None:
+    def _on_session_stopped(
+        self, handle: _RecognizerHandle, evt: speechsdk.SessionEventArgs
+    ) -> None:
         logger.debug("Live Interpreter session stopped: %s", evt.session_id)
-        self._loop.call_soon_threadsafe(self._handle_session_stopped)
+        self._bridge.post(self._handle_session_stopped, handle)
 
-    def _handle_session_stopped(self) -> None:
-        self._is_running = False
+    def _handle_session_stopped(self, handle: _RecognizerHandle) -> None:
+        handle.stopped.set()
+        if handle is self._active:
+            self._is_running = False
 
-    def _on_recognizing(self, evt: speechsdk.translation.TranslationRecognitionEventArgs) -> None:
-        detected = evt.result.properties.get(
-            speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult,
-            "unknown",
-        )
+    def _on_recognizing(
+        self,
+        handle: _RecognizerHandle,
+        evt: speechsdk.translation.TranslationRecognitionEventArgs,
+    ) -> None:
+        handle.utterance_open = True
+        detected = self._source_language(evt.result)
         logger.debug("Recognizing [%s]: %s", detected, evt.result.text)
+        self._note_language(handle, evt.result, detected)
 
-    def _on_recognized(self, evt: speechsdk.translation.TranslationRecognitionEventArgs) -> None:
-        if evt.result.reason != speechsdk.ResultReason.TranslatedSpeech:
+        if not self._opts.stream_partial_translations or not self._opts.target_languages:
             return
 
-        detected = evt.result.properties.get(
-            speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult,
-            "unknown",
-        )
-        source_text = evt.result.text
-        translations = dict(evt.result.translations)
+        # throttle and de-duplicate here so chatty partials never reach the loop
+        now = time.monotonic()
+        if now - self._last_partial_at < self._opts.partial_interval_ms / 1000.0:
+            return
+
+        language = self._opts.target_languages[0]
+        text = evt.result.translations.get(language)
+        if not text or text == self._last_partial_text:
+            return
+
+        self._last_partial_at = now
+        self._last_partial_text = text
+        self._bridge.post(self._handle_partial_translation, language, text)
+
+    def _on_recognized(
+        self,
+        handle: _RecognizerHandle,
+        evt: speechsdk.translation.TranslationRecognitionEventArgs,
+    ) -> None:
+        detected = self._source_language(evt.result)
+        self._note_language(handle, evt.result, detected)
+        # the next utterance measures its own detection
+        language_latency, self._language_latency = self._language_latency, None
+
+        end_ticks = evt.result.offset + evt.result.duration
+        if evt.result.reason == speechsdk.ResultReason.TranslatedSpeech:
+            source_text = evt.result.text
+            translations = dict(evt.result.translations)
+            self._last_partial_text = None
+
+            start_ticks, speech_end_ticks = evt.result.offset, end_ticks
+            if self._opts.enable_word_level_timestamps:
+                span = realtime_utils.word_span(evt.result.json)
+                if span is not None:
+                    start_ticks, speech_end_ticks = span
+
+            timing = _UtteranceTiming(
+                handle=handle,
+                start_ticks=start_ticks,
+                end_ticks=speech_end_ticks,
+                audio_duration=evt.result.duration / _TICKS_PER_SECOND,
+                language_latency=language_latency,
+            )
+            self._bridge.post(
+                self._handle_final_translation, detected, source_text, translations, timing
+            )
 
-        self._loop.call_soon_threadsafe(
-            self._handle_final_translation, detected, source_text, translations
+        if evt.result.reason in (
+            speechsdk.ResultReason.TranslatedSpeech,
+            speechsdk.ResultReason.NoMatch,
+        ):
+            # finalized audio never needs to be replayed to a new recognizer; posted
+            # after the result, which still needs the arrival times of this input
+            self._bridge.post(self._release_input, handle, end_ticks)
+
+        handle.utterance_open = False
+        if handle.draining:
+            self._bridge.post(handle.utterance_ended.set)
+
+    def _source_language(self, result: speechsdk.translation.TranslationRecognitionResult) -> str:
+        if self._opts.source_language is not None:
+            return self._opts.source_language
+        detected = result.properties.get(
+            speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult
         )
+        # the SDK property map is untyped; anything but a language code counts as unknown
+        return detected if isinstance(detected, str) and detected else "unknown"
+
+    def _note_language(
+        self,
+        handle: _RecognizerHandle,
+        result: speechsdk.translation.TranslationRecognitionResult,
+        detected: str,
+    ) -> None:
+        """Record how much audio the service needed to name the utterance's language."""
+        if self._language_latency is not None or self._opts.source_language is not None:
+            return
+        if detected == "unknown":
+            return
+        # the stream is fed in real time, so streamed audio stands in for wall-clock time
+        streamed = handle.stream_bytes / (self._opts.sample_rate * 2)
+        self._language_latency = max(0.0, streamed - result.offset / _TICKS_PER_SECOND)
 
     def _on_synthesizing(self, evt: speechsdk.translation.TranslationSynthesisEventArgs) -> None:
         audio = evt.result.audio
-        self._loop.call_soon_threadsafe(self._handle_audio_chunk, audio)
+        self._bridge.post(self._handle_audio_chunk, audio)
+
+    def _on_canceled(
+        self,
+        handle: _RecognizerHandle,
+        evt: speechsdk.translation.TranslationRecognitionCanceledEventArgs,
+    ) -> None:
+        if handle.draining:
+            # a replaced recognizer reports the end of its stream; not a session error
+            logger.debug("replaced recognizer canceled: %s (%s)", evt.reason, evt.error_details)
+            return
 
-    def _on_canceled(self, evt: speechsdk.translation.TranslationRecognitionCanceledEventArgs) -> None:
         reason = evt.reason
         details = evt.error_details
-        self._loop.call_soon_threadsafe(self._handle_cancellation, reason, details)
+        retryable = evt.error_code not in _FATAL_ERROR_CODES
+        self._bridge.post(self._handle_cancellation, reason, details, handle, retryable)
 
     # ------------------------------------------------------------------
     # Event handlers running on the asyncio loop
@@ -552,12 +1419,29 @@ class LiveInterpreterSession(llm.RealtimeSession):
             text_ch=text_ch,
             audio_ch=audio_ch,
             modalities=modalities,
+            decoder=AudioStreamDecoder(sample_rate=self._opts.synthesis_sample_rate),
             created_at=time.time(),
+            started_at=time.monotonic(),
             audio_expected=self._realtime_model.capabilities.audio_output,
         )
 
+        if self._opts.output_jitter_buffer_ms is not None and generation.audio_expected:
+            generation.pacer = AudioPacer(
+                audio_ch,
+                jitter_buffer_ms=self._opts.output_jitter_buffer_ms,
+                on_done=lambda: self._on_pacer_done(generation),
+            )
+            self._active_pacers.add(generation.pacer)
+
         self._current_generation = generation
 
+        instruments = telemetry.get()
+        if instruments is not None:
+            # ends when the generation is finalized, not scoped to this call
+            generation.span = instruments.tracer.start_span(
+                "azure_li.generation", attributes={"response_id": response_id}
+            )
+
         generation_event = llm.GenerationCreatedEvent(
             message_stream=message_ch,
             function_stream=generation.function_ch,
@@ -569,6 +1453,10 @@ class LiveInterpreterSession(llm.RealtimeSession):
             self._pending_generation_fut.set_result(generation_event)
         self._pending_generation_fut = None
 
+        deferred, self._deferred_partials = self._deferred_partials, []
+        for language, text in deferred:
+            self._handle_partial_translation(language, text)
+
         return generation
 
     def _handle_audio_chunk(self, audio: bytes) -> None:
@@ -578,74 +1466,231 @@ class LiveInterpreterSession(llm.RealtimeSession):
         generation = self._ensure_generation()
 
         if len(audio) == 0:
+            tail = generation.chunker.flush() if generation.chunker else None
+            if tail is not None:
+                self._send_audio_frame(generation, tail, generation.decoder.sample_rate)
+
             generation.audio_done = True
-            if not generation.audio_ch.closed:
+            if generation.pacer is not None:
+                # the pacer closes audio_ch once everything buffered has been released
+                generation.pacer.end_input()
+            elif not generation.audio_ch.closed:
                 generation.audio_ch.close()
             self._maybe_finalize_generation()
+            if self._deferred_partials:
+                # the next utterance is already streaming text; open its generation now
+                self._ensure_generation()
             return
 
-        sample_rate, num_channels, pcm_bytes = self._decode_audio(audio)
+        decoder = generation.decoder
+        decode_started = time.perf_counter()
+        try:
+            pcm_bytes = decoder.push(audio)
+        except ValueError:
+            logger.exception("Failed to decode synthesized audio from Live Interpreter")
+            return
 
-        if num_channels > 1:
-            pcm_bytes = audioop.tomono(pcm_bytes, 2, 0.5, 0.5)
-            num_channels = 1
+        if not pcm_bytes:
+            generation.decode_time += time.perf_counter() - decode_started
+            return
 
-        chunk_bytes = realtime_utils.chunk_audio(
-            pcm_bytes,
-            chunk_duration_ms=_AUDIO_CHUNK_MS,
-            sample_rate=sample_rate,
-        )
+        sample_rate = decoder.sample_rate
+        if decoder.num_channels > 1:
+            pcm_bytes = pcm.downmix(pcm_bytes, decoder.num_channels)
+        chunk_started = time.perf_counter()
+        generation.decode_time += chunk_started - decode_started
 
-        for chunk in chunk_bytes:
-            if not chunk:
-                continue
-            frame = rtc.AudioFrame(
-                data=chunk,
+        if generation.chunker is None:
+            generation.chunker = realtime_utils.AudioChunker(
+                chunk_duration_ms=_AUDIO_CHUNK_MS,
                 sample_rate=sample_rate,
-                num_channels=num_channels,
-                samples_per_channel=len(chunk) // (2 * num_channels),
             )
+
+        for chunk in generation.chunker.push(pcm_bytes):
+            self._send_audio_frame(generation, chunk, sample_rate)
+        generation.chunk_time += time.perf_counter() - chunk_started
+
+    def _send_audio_frame(
+        self,
+        generation: _GenerationState,
+        chunk: memoryview,
+        sample_rate: int,
+    ) -> None:
+        # AudioFrame materializes sliced views itself; handing it bytes makes
+        # this the one copy a chunk needs, since the frame must own its samples
+        frame = rtc.AudioFrame(
+            data=chunk.tobytes(),
+            sample_rate=sample_rate,
+            num_channels=1,
+            samples_per_channel=len(chunk) // 2,
+        )
+        if generation.pacer is not None:
+            generation.pacer.push(frame)
+        else:
             generation.audio_ch.send_nowait(frame)
+        # synthesis events carry no language; the service voices one target
+        language = self.voiced_language
+        if language is not None:
+            self._audio_router.push(language, frame)
 
-            if generation.first_token_at is None:
-                generation.first_token_at = time.time()
+        generation.output_audio_duration += frame.samples_per_channel / sample_rate
+        if generation.first_audio_at is None:
+            generation.first_audio_at = time.monotonic()
 
     def _handle_final_translation(
         self,
         source_lang: str,
         source_text: str,
         translations: dict[str, str],
+        timing: Optional[_UtteranceTiming] = None,
     ) -> None:
-        generation = self._ensure_generation()
-
-        lines = [f"[{source_lang}] {source_text}"]
+        now = time.time()
+        self.emit(
+            "translation_result",
+            models.TranslationResult(
+                source_language=source_lang,
+                source_text=source_text,
+                translations=translations,
+                timestamp=now,
+            ),
+        )
+        self.emit(
+            "interpreter_metrics_collected",
+            models.InterpreterMetrics(
+                timestamp=now,
+                source_language=source_lang,
+                language_id_mode=(
+                    "fixed"
+                    if self._opts.source_language is not None
+                    else self._opts.language_id_mode or "auto"
+                ),
+                latency_profile=self._opts.latency_profile,
+                language_detection_latency=timing.language_latency if timing else None,
+            ),
+        )
         for lang, text in translations.items():
-            lines.append(f"[{lang}] {text}")
+            for ch in self._text_subscribers.get(lang, ()):
+                ch.send_nowait(text)
+
+        instruments = telemetry.get()
+        if instruments is not None:
+            instruments.utterances.add(1, {"source_language": source_lang})
+
+        generation = self._ensure_generation()
+        if timing is not None:
+            generation.speech_start_at = self._input_time(timing.handle, timing.start_ticks)
+            # the time of the last speech sample, not of the one after it
+            generation.speech_end_at = self._input_time(timing.handle, max(0, timing.end_ticks - 1))
+            generation.input_audio_duration += timing.audio_duration
+
+        if self._opts.text_output == "primary":
+            final_text = translations.get(self._opts.target_languages[0], "")
+        else:
+            lines = [f"[{source_lang}] {source_text}"]
+            for lang, text in translations.items():
+                lines.append(f"[{lang}] {text}")
+            final_text = "\n".join(lines)
 
-        final_text = "\n".join(lines)
         generation.output_text.append(final_text)
-        generation.text_ch.send_nowait(final_text)
+        generation.text_ch.send_nowait(
+            self._reconcile_partial(generation, source_lang, source_text, translations)
+            if generation.partial_text is not None
+            else final_text
+        )
         generation.text_ch.close()
         generation.text_done = True
-        generation.completed_at = time.time()
+        generation.completed_at = time.monotonic()
 
         self._maybe_finalize_generation()
 
+    def _handle_partial_translation(self, language: str, text: str) -> None:
+        current = self._current_generation
+        if current is not None and current.text_done and not current.audio_done:
+            # this partial starts the next utterance; it is replayed once that generation exists
+            self._deferred_partials.append((language, text))
+            return
+
+        generation = self._ensure_generation()
+        if generation.text_done:
+            return
+
+        stable = realtime_utils.stable_prefix(generation.partial_hypothesis, text)
+        generation.partial_hypothesis = text
+
+        streamed = generation.partial_text or ""
+        if len(stable) <= len(streamed) or not stable.startswith(streamed):
+            return
+
+        delta = stable[len(streamed) :]
+        if generation.partial_text is None and self._opts.text_output == "combined":
+            delta = f"[{language}] {delta}"
+        generation.partial_text = stable
+        generation.text_ch.send_nowait(delta)
+        generation.partial_sent_at.append(time.monotonic())
+
+    def _reconcile_partial(
+        self,
+        generation: _GenerationState,
+        source_lang: str,
+        source_text: str,
+        translations: dict[str, str],
+    ) -> str:
+        """Build the text completing a streamed partial into the final result."""
+        streamed = generation.partial_text or ""
+        language = self._opts.target_languages[0]
+        final = translations.get(language, "")
+
+        primary = self._opts.text_output == "primary"
+        if final.startswith(streamed):
+            tail = final[len(streamed) :]
+        else:
+            # the service revised text that was already streamed; restate the line
+            tail = f"\n{final}" if primary else f"\n[{language}] {final}"
+
+        if primary:
+            return tail
+
+        lines = [tail, f"[{source_lang}] {source_text}"]
+        for lang, text in translations.items():
+            if lang != language:
+                lines.append(f"[{lang}] {text}")
+        return "\n".join(lines)
+
     def _handle_cancellation(
         self,
         reason: speechsdk.CancellationReason,
         details: str | None,
+        handle: Optional[_RecognizerHandle] = None,
+        retryable: bool = True,
     ) -> None:
         logger.error("Live Interpreter canceled: %s (%s)", reason, details)
+        instruments = telemetry.get()
+        if instruments is not None:
+            instruments.cancellations.add(
+                1, {"reason": getattr(reason, "name", str(reason)), "retryable": retryable}
+            )
+
+        reconnect = (
+            handle is not None
+            and handle is self._active
+            and reason == speechsdk.CancellationReason.Error
+        )
+        recoverable = retryable and (not reconnect or self._opts.reconnect)
 
         error = llm.RealtimeModelError(
             timestamp=time.time(),
             label=self._realtime_model.label,
             error=RuntimeError(details or "Live Interpreter canceled"),
-            recoverable=True,
+            recoverable=recoverable,
         )
         self.emit("error", error)
 
+        if reconnect:
+            # a canceled recognizer does not recover; stop writing into it
+            self._is_running = False
+            if retryable:
+                self._schedule_reconnect()
+
         if self._current_generation:
             self._finalize_generation(interrupted=True)
 
@@ -655,9 +1700,44 @@ class LiveInterpreterSession(llm.RealtimeSession):
             )
             self._pending_generation_fut = None
 
-    def _maybe_finalize_generation(self) -> None:
-        generation = self._current_generation
-        if not generation:
+    def _recognizer_count(self) -> int:
+        """Recognizers holding a connection: the active one and any still draining."""
+        draining = sum(1 for task in self._drain_tasks if not task.done())
+        return draining + (self._active is not None)
+
+    def _generation_metrics(self, generation: _GenerationState) -> models.GenerationMetrics:
+        def since(start: Optional[float], at: Optional[float]) -> Optional[float]:
+            if start is None or at is None:
+                return None
+            return max(0.0, at - start)
+
+        # what the listener gets first: the voice when one is synthesized
+        output_at = (
+            generation.first_audio_at if generation.audio_expected else generation.completed_at
+        )
+
+        return models.GenerationMetrics(
+            request_id=generation.response_id,
+            timestamp=generation.created_at,
+            target_languages=len(self._opts.target_languages),
+            input_audio_duration=generation.input_audio_duration,
+            output_audio_duration=generation.output_audio_duration,
+            speech_end_to_final_text=since(generation.speech_end_at, generation.completed_at),
+            speech_end_to_first_audio=since(generation.speech_end_at, generation.first_audio_at),
+            end_to_end_latency=since(generation.speech_end_at, output_at),
+            lag_behind_live=since(generation.speech_start_at, output_at),
+            decode_time=generation.decode_time,
+            chunk_time=generation.chunk_time,
+        )
+
+    def _on_pacer_done(self, generation: _GenerationState) -> None:
+        if generation.pacer is not None:
+            self._active_pacers.discard(generation.pacer)
+        self._maybe_finalize_generation(generation)
+
+    def _maybe_finalize_generation(self, generation: Optional[_GenerationState] = None) -> None:
+        generation = generation or self._current_generation
+        if not generation or generation.finalized:
             return
 
         if not generation.text_done:
@@ -666,13 +1746,30 @@ class LiveInterpreterSession(llm.RealtimeSession):
         if generation.audio_expected and not generation.audio_done:
             return
 
-        self._finalize_generation(interrupted=False)
+        if generation.pacer is not None and not generation.pacer.done:
+            return
 
-    def _finalize_generation(self, interrupted: bool) -> None:
-        generation = self._current_generation
-        if not generation:
+        self._finalize_generation(interrupted=False, generation=generation)
+
+    def _finalize_generation(
+        self,
+        interrupted: bool,
+        generation: Optional[_GenerationState] = None,
+    ) -> None:
+        generation = generation or self._current_generation
+        if not generation or generation.finalized:
             return
 
+        generation.finalized = True
+        generation.finished.set()
+        if interrupted:
+            # the utterance these belonged to was cut off with the session
+            self._deferred_partials.clear()
+            # subscribers must not keep playing the rest of the generation
+            self._audio_router.interrupt()
+        if generation.pacer is not None and not generation.pacer.done:
+            generation.pacer.interrupt()
+
         if not generation.text_ch.closed:
             generation.text_ch.close()
         if not generation.audio_ch.closed:
@@ -688,17 +1785,18 @@ class LiveInterpreterSession(llm.RealtimeSession):
                 id=generation.response_id,
             )
 
-        created = generation.created_at
-        completed = generation.completed_at or time.time()
-        ttft = (
-            generation.first_token_at - created
-            if generation.first_token_at and generation.first_token_at >= created
-            else -1
+        # from the end of the user's speech when the service located it
+        start = generation.speech_end_at or generation.started_at
+        # the first output after it: partials streamed while the user spoke do not count
+        outputs = [*generation.partial_sent_at, generation.completed_at, generation.first_audio_at]
+        first_output_at = min(
+            (at for at in outputs if at is not None and at >= start), default=None
         )
-        duration = completed - created
+        ttft = first_output_at - start if first_output_at is not None else -1
+        duration = (generation.completed_at or time.monotonic()) - generation.started_at
 
         metrics = RealtimeModelMetrics(
-            timestamp=created,
+            timestamp=generation.created_at,
             request_id=generation.response_id,
             ttft=ttft,
             duration=duration,
@@ -726,23 +1824,26 @@ class LiveInterpreterSession(llm.RealtimeSession):
             ),
         )
         self.emit("metrics_collected", metrics)
+        generation_metrics = self._generation_metrics(generation)
+        if generation_metrics.end_to_end_latency is not None:
+            self._end_to_end.add(generation_metrics.end_to_end_latency)
+        if generation_metrics.lag_behind_live is not None:
+            self._lag_behind_live.add(generation_metrics.lag_behind_live)
+        self.emit("generation_metrics_collected", generation_metrics)
+
+        if generation.span is not None:
+            generation.span.set_attributes(
+                {
+                    "cancelled": interrupted,
+                    "target_languages": len(self._opts.target_languages),
+                    "output_audio_duration": generation_metrics.output_audio_duration,
+                }
+            )
+            if generation_metrics.end_to_end_latency is not None:
+                generation.span.set_attribute(
+                    "end_to_end_latency", generation_metrics.end_to_end_latency
+                )
+            generation.span.end()
 
-        self._current_generation = None
-
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _decode_audio(data: bytes) -> tuple[int, int, bytes]:
-        if not data:
-            return 16000, 1, b""
-
-        if data[:4] != b"RIFF":
-            return 16000, 1, data
-
-        with wave.open(io.BytesIO(data), "rb") as wav:
-            sample_rate = wav.getframerate()
-            num_channels = wav.getnchannels()
-            frames = wav.readframes(wav.getnframes())
-
-        return sample_rate, num_channels, frames
+        if self._current_generation is generation:
+            self._current_generation = None
@@ -0,0 +1,137 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Backoff and circuit breaking for recognizer reconnects"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Literal, Optional
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """
+    Jittered exponential backoff between reconnect attempts.
+
+    The n-th retry waits a random time between ``(1 - jitter)`` and 1 times
+    ``min(max_delay, initial_delay * multiplier ** n)``, so sessions that lost
+    their connection together do not reconnect in lockstep.
+    """
+
+    initial_delay: float = 0.25
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.initial_delay < 0 or self.max_delay < self.initial_delay:
+            raise ValueError("expected 0 <= initial_delay <= max_delay")
+        if self.multiplier < 1.0:
+            raise ValueError("multiplier must be >= 1")
+        if not 0.0 <= self.jitter <= 1.0:
+            raise ValueError("jitter must be between 0 and 1")
+
+    def delay(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.initial_delay * self.multiplier**attempt)
+        spread = (rng or random).random() * self.jitter
+        return ceiling * (1.0 - spread)
+
+
+class CircuitBreaker:
+    """
+    Stops reconnect attempts after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    ``allow`` refuses attempts for ``reset_timeout`` seconds. The first attempt
+    after that runs half-open: success closes the circuit, failure opens it
+    again for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return "closed"
+        if self._half_open or self.retry_after() == 0.0:
+            return "half_open"
+        return "open"
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets an attempt through (0 when it does)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._half_open or self.retry_after() > 0.0:
+            # a single probe at a time while half-open
+            return False
+        self._half_open = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._half_open or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+            self._half_open = False
+
+
+@dataclass(frozen=True)
+class ReconnectStats:
+    """Counters of the reconnect supervisor"""
+
+    reconnects: int
+    """Connections restored after an error"""
+
+    failed_attempts: int
+    """Connection attempts that failed while reconnecting"""
+
+    last_reconnect_latency: Optional[float]
+    """Seconds from the error to the restored connection, for the last reconnect"""
+
+    circuit_state: CircuitState
+    """State of the circuit breaker guarding connection attempts"""
@@ -0,0 +1,107 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Routing of synthesized audio to per-language subscribers"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from livekit.agents import utils
+
+from livekit import rtc
+
+from .pacer import AudioPacer
+
+
+@dataclass
+class _Subscriber:
+    ch: utils.aio.Chan[rtc.AudioFrame]
+    pacer: Optional[AudioPacer] = None
+
+
+class AudioRouter:
+    """
+    Fans synthesized audio frames out to subscribers of each target language.
+
+    The frames are the ones built for the generation's audio stream, shared by
+    every subscriber without another chunking pass or copy. Each subscriber
+    has its own pacer when pacing is enabled, so a slow consumer does not hold
+    back another. Frames for a language nobody subscribed to are dropped.
+
+    Subscriber streams stay open across utterances and are closed by
+    ``unsubscribe`` or ``aclose``; ``interrupt`` only drops what the pacers
+    still hold.
+    """
+
+    def __init__(self, *, jitter_buffer_ms: Optional[int] = None) -> None:
+        self._jitter_buffer_ms = jitter_buffer_ms
+        self._routes: dict[str, list[_Subscriber]] = {}
+
+    def has_subscribers(self, language: str) -> bool:
+        return language in self._routes
+
+    def subscribe(self, language: str) -> utils.aio.Chan[rtc.AudioFrame]:
+        ch = utils.aio.Chan[rtc.AudioFrame]()
+        subscriber = _Subscriber(ch=ch)
+        if self._jitter_buffer_ms is not None:
+            subscriber.pacer = AudioPacer(ch, jitter_buffer_ms=self._jitter_buffer_ms)
+        self._routes.setdefault(language, []).append(subscriber)
+        return ch
+
+    def unsubscribe(self, ch: utils.aio.Chan[rtc.AudioFrame]) -> None:
+        for language, subscribers in list(self._routes.items()):
+            for subscriber in list(subscribers):
+                if subscriber.ch is ch:
+                    subscribers.remove(subscriber)
+                    self._close_subscriber(subscriber)
+            if not subscribers:
+                del self._routes[language]
+
+    def push(self, language: str, frame: rtc.AudioFrame) -> None:
+        """Send a frame synthesized for ``language`` to its subscribers."""
+        subscribers = self._routes.get(language)
+        if subscribers is None:
+            return
+
+        for subscriber in subscribers:
+            if subscriber.pacer is not None:
+                subscriber.pacer.push(frame)
+            elif not subscriber.ch.closed:
+                subscriber.ch.send_nowait(frame)
+
+    def interrupt(self) -> None:
+        """Drop audio the pacers still hold, e.g. the rest of an interrupted generation."""
+        for subscribers in self._routes.values():
+            for subscriber in subscribers:
+                if subscriber.pacer is not None:
+                    subscriber.pacer.clear()
+
+    async def aclose(self) -> None:
+        subscribers = [s for route in self._routes.values() for s in route]
+        self._routes.clear()
+        for subscriber in subscribers:
+            self._close_subscriber(subscriber)
+        await asyncio.gather(
+            *(s.pacer.aclose() for s in subscribers if s.pacer is not None),
+            return_exceptions=True,
+        )
+
+    def _close_subscriber(self, subscriber: _Subscriber) -> None:
+        if subscriber.pacer is not None:
+            subscriber.pacer.interrupt()
+        elif not subscriber.ch.closed:
+            subscriber.ch.close()
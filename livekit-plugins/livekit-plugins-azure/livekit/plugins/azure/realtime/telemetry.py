@@ -0,0 +1,159 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Optional OpenTelemetry instrumentation of Live Interpreter sessions.
+
+Disabled by default: until ``enable`` is called, every hook is a single
+``None`` check. Once enabled, instruments are created on the given (or
+global) meter and tracer providers, so they are exported by whatever reader
+the worker process configured, e.g. OTLP or a Prometheus reader::
+
+    from livekit.plugins.azure.realtime import telemetry
+
+    telemetry.enable()
+"""
+
+from __future__ import annotations
+
+import contextlib
+import weakref
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from ..log import logger
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - opentelemetry-api is optional
+    otel_metrics = None  # type: ignore[assignment]
+    otel_trace = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .realtime_model import LiveInterpreterSession
+
+_SCOPE = "livekit.plugins.azure.live_interpreter"
+
+# sessions are always tracked (once each, on creation) so gauges see sessions
+# created before telemetry was enabled
+_sessions: weakref.WeakSet[LiveInterpreterSession] = weakref.WeakSet()
+_instruments: Optional[Instruments] = None
+
+
+class Instruments:
+    """Counters, histograms, gauges and the tracer used by sessions."""
+
+    def __init__(self, meter: Any, tracer: Any) -> None:
+        self.tracer = tracer
+        self.connect_time = meter.create_histogram(
+            "azure_li.recognizer.connect_time",
+            unit="s",
+            description="Time for a recognizer to connect and start",
+        )
+        self.cancellations = meter.create_counter(
+            "azure_li.cancellations",
+            description="Recognizer cancellations, by reason",
+        )
+        self.utterances = meter.create_counter(
+            "azure_li.utterances",
+            description="Final results, by source language",
+        )
+        self.callback_latency = meter.create_histogram(
+            "azure_li.callback.latency",
+            unit="s",
+            description="Delay between an SDK callback and the event loop handling it",
+        )
+        meter.create_observable_gauge(
+            "azure_li.sessions.active",
+            callbacks=[_observe(lambda s: 1)],
+            description="Open sessions",
+        )
+        meter.create_observable_gauge(
+            "azure_li.recognizers.active",
+            callbacks=[_observe(lambda s: s._recognizer_count())],
+            description="Recognizers running or draining",
+        )
+        meter.create_observable_gauge(
+            "azure_li.input.queued_frames",
+            callbacks=[_observe(lambda s: s.input_stats.pending_frames)],
+            description="Input frames waiting to be sent to the service",
+        )
+        meter.create_observable_gauge(
+            "azure_li.output.buffered_audio",
+            unit="s",
+            callbacks=[_observe(_buffered_output)],
+            description="Synthesized audio held by output pacers",
+        )
+
+
+def enable(meter_provider: Any = None, tracer_provider: Any = None) -> Instruments:
+    """
+    Start recording metrics and spans.
+
+    Args:
+        meter_provider: OpenTelemetry meter provider, the global one by default
+        tracer_provider: OpenTelemetry tracer provider, the global one by default
+
+    Raises:
+        RuntimeError: If ``opentelemetry-api`` is not installed
+    """
+    global _instruments
+    if otel_metrics is None or otel_trace is None:
+        raise RuntimeError("telemetry requires opentelemetry-api to be installed")
+    if _instruments is not None:
+        # instruments are registered once per provider; call disable() first to switch
+        return _instruments
+
+    meter = otel_metrics.get_meter(_SCOPE, meter_provider=meter_provider)
+    tracer = otel_trace.get_tracer(_SCOPE, tracer_provider=tracer_provider)
+    _instruments = Instruments(meter, tracer)
+    logger.debug("Live Interpreter telemetry enabled")
+    return _instruments
+
+
+def disable() -> None:
+    """Stop recording. Observable gauges stay registered but report nothing."""
+    global _instruments
+    _instruments = None
+
+
+def get() -> Optional[Instruments]:
+    """The active instruments, or None while telemetry is disabled."""
+    return _instruments
+
+
+def span(name: str, attributes: Optional[dict[str, Any]] = None) -> Any:
+    """Context manager tracing ``name`` as the current span, a no-op while disabled."""
+    if _instruments is None:
+        return contextlib.nullcontext()
+    return _instruments.tracer.start_as_current_span(name, attributes=attributes)
+
+
+def track_session(session: LiveInterpreterSession) -> None:
+    _sessions.add(session)
+
+
+def _observe(value: Any) -> Any:
+    def callback(options: Any) -> Iterable[Any]:
+        if _instruments is None:
+            return []
+        total = sum(value(s) for s in list(_sessions) if not s._shutdown.is_set())
+        return [otel_metrics.Observation(total)]
+
+    return callback
+
+
+def _buffered_output(session: LiveInterpreterSession) -> float:
+    stats = session.output_stats
+    return stats.buffered_duration if stats is not None else 0.0
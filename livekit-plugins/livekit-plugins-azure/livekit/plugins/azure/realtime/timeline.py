@@ -0,0 +1,117 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Input sample timeline and latency distributions"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+
+class InputClock:
+    """
+    Remembers when each stretch of input audio arrived.
+
+    Positions are absolute byte offsets into the session's input (the pre-roll
+    positions), so audio keeps its arrival time when it is replayed to a new
+    recognizer or held back by the VAD gate. One entry is kept per frame and
+    entries older than ``window_bytes`` behind the newest are dropped.
+    """
+
+    def __init__(self, window_bytes: int) -> None:
+        self._window = window_bytes
+        self._ends: list[int] = []
+        self._times: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def record(self, end: int, at: float) -> None:
+        """Input up to position ``end`` had arrived at monotonic time ``at``."""
+        if self._ends and end <= self._ends[-1]:
+            return
+        self._ends.append(end)
+        self._times.append(at)
+        if len(self._ends) > 1024 and self._ends[0] < end - self._window:
+            self.forget(end - self._window)
+
+    def time_of(self, position: int) -> Optional[float]:
+        """Arrival time of the byte at ``position``, None if it is unknown."""
+        index = bisect.bisect_right(self._ends, position)
+        if index == len(self._ends):
+            return None
+        return self._times[index]
+
+    def forget(self, position: int) -> None:
+        """Drop entries for input entirely before ``position``."""
+        index = bisect.bisect_right(self._ends, position)
+        if index:
+            del self._ends[:index]
+            del self._times[:index]
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Percentiles of recent latency samples, in seconds"""
+
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyDistribution:
+    """Keeps the most recent ``max_samples`` latencies and summarizes them."""
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self._count += 1
+
+    def summary(self) -> Optional[LatencySummary]:
+        if not self._samples:
+            return None
+
+        ordered = sorted(self._samples)
+
+        def percentile(p: float) -> float:
+            # nearest rank
+            return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+        return LatencySummary(
+            count=self._count,
+            p50=percentile(0.50),
+            p90=percentile(0.90),
+            p99=percentile(0.99),
+            max=ordered[-1],
+        )
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Latency distributions of a session's generations"""
+
+    end_to_end: Optional[LatencySummary]
+    """End of speech to the first output the listener gets"""
+
+    lag_behind_live: Optional[LatencySummary]
+    """Start of speech to that output: how far the translation trails the speaker"""
@@ -14,7 +14,8 @@
 
 """Utility functions for Azure Live Interpreter integration with LiveKit"""
 
-from typing import Optional
+import json
+from typing import Iterator, Optional, Union
 
 from livekit.agents import llm
 
@@ -110,6 +111,69 @@ def create_v2_endpoint(region: str) -> str:
     return models.V2_ENDPOINT_TEMPLATE.format(region=region)
 
 
+def stable_prefix(previous: str, current: str) -> str:
+    """
+    Get the part of a partial result that two consecutive hypotheses agree on.
+
+    For text with spaces the prefix is cut back to a word boundary, so a word
+    the recognizer is still revising is not emitted half-way.
+
+    Args:
+        previous: Previous partial hypothesis
+        current: Latest partial hypothesis
+
+    Returns:
+        Common prefix of both hypotheses that is safe to stream
+    """
+    length = 0
+    for a, b in zip(previous, current):
+        if a != b:
+            break
+        length += 1
+
+    if length == len(current) == len(previous):
+        return current
+
+    prefix = current[:length]
+    if " " in current:
+        prefix = prefix[: prefix.rfind(" ") + 1]
+    return prefix
+
+
+def word_span(result_json: str) -> Optional[tuple[int, int]]:
+    """
+    Get the start of the first and the end of the last word of a result.
+
+    Word timestamps are present in the result JSON when word-level timestamps
+    are requested. They bound the speech more tightly than the result's own
+    offset and duration, which include leading and trailing silence.
+
+    Args:
+        result_json: Result JSON reported by the Speech SDK
+
+    Returns:
+        Start and end in 100 ns ticks, or None without word timestamps
+    """
+    try:
+        payload = json.loads(result_json)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    # translation results nest the recognition under SpeechPhrase
+    phrase = payload.get("SpeechPhrase", payload)
+    nbest = phrase.get("NBest") if isinstance(phrase, dict) else None
+    words = nbest[0].get("Words") if nbest and isinstance(nbest[0], dict) else None
+    if not words:
+        return None
+
+    try:
+        return int(words[0]["Offset"]), int(words[-1]["Offset"]) + int(words[-1]["Duration"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def estimate_audio_duration(audio_bytes: bytes, sample_rate: int = 16000) -> float:
     """
     Estimate duration of audio in seconds.
@@ -153,3 +217,92 @@ def chunk_audio(
         chunks.append(chunk)
 
     return chunks
+
+
+class AudioChunker:
+    """
+    Streaming splitter of 16-bit PCM into fixed-duration chunks.
+
+    Whole chunks are yielded as memoryview slices of the pushed buffer, so no
+    per-chunk copy is made. A trailing partial chunk is carried over and
+    completed by the next push instead of being emitted as a short chunk;
+    call ``flush`` at the end of the stream to get whatever is left.
+
+    Args:
+        chunk_duration_ms: Chunk duration in milliseconds
+        sample_rate: Sample rate in Hz
+        num_channels: Number of interleaved channels
+    """
+
+    def __init__(
+        self,
+        chunk_duration_ms: int = 100,
+        sample_rate: int = 16000,
+        num_channels: int = 1,
+    ) -> None:
+        bytes_per_frame = 2 * num_channels  # 16-bit
+        self._chunk_size = int(sample_rate * chunk_duration_ms / 1000) * bytes_per_frame
+        if self._chunk_size <= 0:
+            raise ValueError("chunk_duration_ms is too short for the sample rate")
+
+        self._carry = bytearray(self._chunk_size)
+        self._carry_len = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Chunk size in bytes."""
+        return self._chunk_size
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes carried over, waiting for the next push."""
+        return self._carry_len
+
+    def push(self, audio_bytes: Union[bytes, bytearray, memoryview]) -> Iterator[memoryview]:
+        """
+        Add audio and yield every chunk it completes.
+
+        Args:
+            audio_bytes: Raw audio bytes (16-bit PCM)
+
+        Yields:
+            Chunks of exactly ``chunk_size`` bytes
+        """
+        view = memoryview(audio_bytes).cast("B")
+        size = self._chunk_size
+        offset = 0
+
+        if self._carry_len:
+            offset = min(size - self._carry_len, len(view))
+            self._carry[self._carry_len : self._carry_len + offset] = view[:offset]
+            self._carry_len += offset
+            if self._carry_len < size:
+                return
+            # hand the filled carry buffer over; consumers may keep the view
+            carry, self._carry = self._carry, bytearray(size)
+            self._carry_len = 0
+            yield memoryview(carry)
+
+        end = len(view) - (len(view) - offset) % size
+        for start in range(offset, end, size):
+            yield view[start : start + size]
+
+        tail = len(view) - end
+        if tail:
+            self._carry[:tail] = view[end:]
+            self._carry_len = tail
+
+    def flush(self) -> Optional[memoryview]:
+        """
+        Return the carried-over partial chunk, if any, and reset the chunker.
+
+        Returns:
+            The remaining audio shorter than a chunk, or None
+        """
+        if not self._carry_len:
+            return None
+
+        tail = memoryview(self._carry)[: self._carry_len]
+        self._carry = bytearray(self._chunk_size)
+        self._carry_len = 0
+        return tail
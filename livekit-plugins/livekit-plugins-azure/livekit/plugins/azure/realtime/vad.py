@@ -0,0 +1,164 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Voice activity gating of input audio"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
+
+from . import pcm
+
+
+@runtime_checkable
+class VoiceActivityDetector(Protocol):
+    """Decides whether a buffer of mono 16-bit PCM contains speech."""
+
+    def is_speech(self, data: memoryview, sample_rate: int) -> bool: ...
+
+
+class EnergyVAD:
+    """
+    Energy threshold detector.
+
+    Cheap enough to run on every frame; it separates speech from the silence
+    and low background noise typical of meeting audio, not from loud noise.
+
+    Args:
+        threshold: RMS level (in 16-bit sample units) counted as speech
+    """
+
+    def __init__(self, threshold: int = 500) -> None:
+        self._threshold = threshold
+
+    def is_speech(self, data: memoryview, sample_rate: int) -> bool:
+        return pcm.rms(data) >= self._threshold
+
+
+@dataclass(frozen=True)
+class VADStats:
+    """Counters of an input VAD gate"""
+
+    input_duration: float
+    """Seconds of audio seen by the gate"""
+
+    gated_duration: float
+    """Seconds of audio withheld from the service"""
+
+    cpu_time: float
+    """CPU seconds spent deciding, on the ingest thread"""
+
+    @property
+    def gated_ratio(self) -> float:
+        """Share of the input withheld from the service, between 0 and 1."""
+        return self.gated_duration / self.input_duration if self.input_duration else 0.0
+
+
+class VADGate:
+    """
+    Withholds silence from the service while keeping speech onsets intact.
+
+    While the gate is closed, the last ``preroll_ms`` of audio are kept; when
+    speech starts they are sent ahead of it, so the service hears the onset
+    that the detector needed a few milliseconds to notice. After speech the
+    gate stays open for ``hangover_ms``, which also gives the service the
+    trailing silence it needs to end the utterance.
+    """
+
+    def __init__(
+        self,
+        vad: VoiceActivityDetector,
+        *,
+        sample_rate: int,
+        hangover_ms: int = 600,
+        preroll_ms: int = 300,
+    ) -> None:
+        self._vad = vad
+        self._sample_rate = sample_rate
+        self._bytes_per_second = sample_rate * 2
+        self._hangover_bytes = self._bytes_per_second * hangover_ms // 1000
+        self._preroll_bytes = self._bytes_per_second * preroll_ms // 1000
+
+        self._open = False
+        self._silence = 0  # bytes of silence since the last speech
+        self._preroll: deque[bytes] = deque()
+        self._preroll_size = 0
+
+        self._input = 0
+        self._gated = 0
+        self._cpu_time = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def stats(self) -> VADStats:
+        return VADStats(
+            input_duration=self._input / self._bytes_per_second,
+            gated_duration=self._gated / self._bytes_per_second,
+            cpu_time=self._cpu_time,
+        )
+
+    def process(self, data: pcm.WriteBuffer) -> tuple[list[pcm.WriteBuffer], bool]:
+        """
+        Feed one buffer and get back what should be sent to the service.
+
+        Returns:
+            The buffers to send, in order, and whether the gate reopened, in
+            which case they start with pre-roll audio preceding ``data``
+        """
+        started = time.thread_time()
+        view = memoryview(data).cast("B")
+        size = len(view)
+        self._input += size
+
+        speech = self._vad.is_speech(view, self._sample_rate)
+        if speech:
+            self._silence = 0
+        else:
+            self._silence += size
+
+        if self._open:
+            if not speech and self._silence > self._hangover_bytes:
+                self._open = False
+                self._keep(view)
+                out: list[pcm.WriteBuffer] = []
+            else:
+                out = [data]
+            resumed = False
+        elif speech:
+            self._open = True
+            out = [*self._preroll, data]
+            self._gated -= self._preroll_size
+            self._preroll.clear()
+            self._preroll_size = 0
+            resumed = True
+        else:
+            self._keep(view)
+            out = []
+            resumed = False
+
+        self._cpu_time += time.thread_time() - started
+        return out, resumed
+
+    def _keep(self, view: memoryview) -> None:
+        # input buffers may be reused by the converter, so pre-roll owns copies
+        self._preroll.append(view.tobytes())
+        self._preroll_size += len(view)
+        self._gated += len(view)
+        while self._preroll and self._preroll_size - len(self._preroll[0]) >= self._preroll_bytes:
+            self._preroll_size -= len(self._preroll.popleft())
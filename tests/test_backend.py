@@ -0,0 +1,49 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Speech SDK recognizer backend"""
+
+import azure.cognitiveservices.speech as speechsdk
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure import models
+from livekit.plugins.azure.realtime.backend import AzureSpeechBackend
+
+
+def _language_id_mode(**kwargs):
+    config = models.LiveInterpreterConfig(
+        subscription_key="key", region="eastus", target_languages=["fr"], **kwargs
+    )
+    recognizer, _ = AzureSpeechBackend().create(config)
+    return recognizer.properties.get_property(
+        speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ""),
+        ({"source_language": "en-US"}, ""),
+        ({"source_languages": ["en-US", "de-DE"]}, "Continuous"),
+        ({"source_languages": ["en-US", "de-DE"], "language_id_mode": "at_start"}, "AtStart"),
+    ],
+)
+def test_language_id_mode_set_only_with_candidates(kwargs, expected):
+    """Test that open-range and fixed-language configs leave the service's LanguageIdMode alone"""
+    assert _language_id_mode(**kwargs) == expected
@@ -0,0 +1,60 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Smoke tests for the benchmark scripts, so they keep running as the session changes"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import types
+
+_BENCHMARKS = os.path.join(os.path.dirname(__file__), "..", "benchmarks")
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_BENCHMARKS, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_case_runs_and_has_a_baseline():
+    """Test that each case runs on a tiny workload and has a committed baseline"""
+    suite = _load("bench_suite")
+    cases = suite.cases(scale=0.001)
+
+    with open(suite.BASELINES, encoding="utf-8") as f:
+        baselines = json.load(f)["cases"]
+    assert sorted(cases) == sorted(baselines)
+
+    for name, case in cases.items():
+        if name.startswith("synthesis/") and name != "synthesis/1s":
+            continue  # the same path on longer clips
+        assert asyncio.run(case()) > 0, name
+
+
+def test_load_test_step_reports_sessions():
+    """Test that a short load test step feeds sessions and reports their cost"""
+    load_test = _load("load_test")
+    args = types.SimpleNamespace(
+        seconds=0.5, warmup=0.2, connect_latency=0.0, recognition_latency=0.0, synthesis_latency=0.0
+    )
+
+    result = asyncio.run(load_test._run_step(2, args))
+
+    assert result["sessions"] == 2
+    assert result["dropped_frames"] == 0
+    assert result["cpu_total"] > 0
+    assert result["lag_max"] >= result["lag_p99"] >= result["lag_p50"] >= 0
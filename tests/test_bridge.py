@@ -0,0 +1,85 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the SDK-thread-to-loop event bridge"""
+
+import asyncio
+import threading
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.bridge import LoopBridge
+
+
+@pytest.mark.asyncio
+async def test_burst_is_delivered_in_order_with_one_wakeup():
+    """Test that events posted before the loop runs share a single drain"""
+    bridge = LoopBridge(asyncio.get_running_loop())
+    received = []
+
+    def post_burst():
+        for i in range(100):
+            bridge.post(received.append, i)
+
+    # joined without awaiting, so the loop cannot drain while the burst is posted
+    thread = threading.Thread(target=post_burst)
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0)
+
+    assert received == list(range(100))
+    assert bridge.stats().wakeups == 1
+    assert bridge.stats().delivered == 100
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_drop_the_batch():
+    """Test that an exception in one event does not stop the others"""
+    bridge = LoopBridge(asyncio.get_running_loop())
+    received = []
+
+    bridge.post(lambda: 1 / 0)
+    bridge.post(received.append, "after")
+    await asyncio.sleep(0)
+
+    assert received == ["after"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_posters_lose_nothing():
+    """Test that events from many threads are all delivered"""
+    loop = asyncio.get_running_loop()
+    bridge = LoopBridge.for_loop(loop)
+    assert LoopBridge.for_loop(loop) is bridge
+
+    received = []
+
+    def poster(index):
+        for i in range(500):
+            bridge.post(received.append, (index, i))
+
+    threads = [threading.Thread(target=poster, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        await asyncio.to_thread(thread.join)
+    await asyncio.sleep(0.01)
+
+    assert len(received) == 8 * 500
+    for n in range(8):
+        assert [i for index, i in received if index == n] == list(range(500))
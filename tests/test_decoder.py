@@ -0,0 +1,101 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the incremental synthesized audio decoder"""
+
+import io
+import wave
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.decoder import FALLBACK_SAMPLE_RATE, AudioStreamDecoder
+
+
+def _wav(pcm: bytes, sample_rate: int = 24000, channels: int = 1) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _feed(decoder: AudioStreamDecoder, data: bytes, size: int) -> bytes:
+    return b"".join(bytes(decoder.push(data[i : i + size])) for i in range(0, len(data), size))
+
+
+PCM = bytes(range(256)) * 8
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 44, 45, 1000])
+def test_wav_split_across_payloads(size):
+    """Test that a RIFF stream split at arbitrary points decodes to the original samples"""
+    decoder = AudioStreamDecoder()
+    assert _feed(decoder, _wav(PCM), size) == PCM
+    assert decoder.sample_rate == 24000
+    assert decoder.num_channels == 1
+    assert decoder.pending_bytes == 0
+
+
+def test_odd_byte_counts_carry_over():
+    """Test that half samples are kept until the next payload completes them"""
+    decoder = AudioStreamDecoder(sample_rate=16000)
+    assert bytes(decoder.push(b"\x01\x02\x03")) == b"\x01\x02"
+    assert decoder.pending_bytes == 1
+    assert bytes(decoder.push(b"\x04\x05")) == b"\x03\x04"
+    assert bytes(decoder.push(b"\x06")) == b"\x05\x06"
+
+
+def test_stereo_wav_is_frame_aligned():
+    """Test that stereo output only contains whole sample frames"""
+    decoder = AudioStreamDecoder()
+    out = _feed(decoder, _wav(PCM, 48000, channels=2), 5)
+    assert out == PCM
+    assert decoder.num_channels == 2
+
+
+def test_standalone_wav_per_payload():
+    """Test that consecutive complete WAV payloads each have their header stripped"""
+    decoder = AudioStreamDecoder()
+    first = bytes(decoder.push(_wav(PCM[:100])))
+    second = bytes(decoder.push(_wav(PCM[100:200])))
+    assert first + second == PCM[:200]
+
+
+def test_raw_pcm_passthrough():
+    """Test that raw mode never looks for a container"""
+    decoder = AudioStreamDecoder(sample_rate=48000)
+    payload = b"RIFF" + PCM[:60]
+    assert bytes(decoder.push(payload)) == payload
+    assert decoder.sample_rate == 48000
+
+
+def test_headerless_fallback():
+    """Test that WAV mode falls back to raw PCM when no header is present"""
+    decoder = AudioStreamDecoder()
+    assert bytes(decoder.push(PCM[:10])) == PCM[:10]
+    assert decoder.sample_rate == FALLBACK_SAMPLE_RATE
+
+
+def test_rejects_non_pcm():
+    """Test that non 16-bit PCM containers are reported"""
+    header = bytearray(_wav(PCM[:4]))
+    header[34] = 8  # bits per sample
+    with pytest.raises(ValueError):
+        AudioStreamDecoder().push(bytes(header))
@@ -0,0 +1,69 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Speech SDK executor"""
+
+import asyncio
+import threading
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.executor import SDKExecutor
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_pool_size_queue_and_report_waits():
+    """Test that the pool is bounded and queueing shows up in the stats"""
+    executor = SDKExecutor(max_workers=2)
+    release = threading.Event()
+
+    calls = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    stats = executor.stats()
+    release.set()
+    await asyncio.gather(*calls)
+    assert stats.running == 2
+    assert stats.queued == 3
+
+    stats = executor.stats()
+    assert stats.completed == 5
+    assert stats.running == 0 and stats.queued == 0
+    assert stats.max_queued == 3
+    assert stats.max_wait > 0.03
+
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeouts_are_counted_and_free_the_queue():
+    """Test that timed-out calls raise, are counted and leave no queued entries"""
+    executor = SDKExecutor(max_workers=1, call_timeout=0.05)
+    release = threading.Event()
+
+    busy = asyncio.ensure_future(executor.run(release.wait, timeout=5.0))
+    await asyncio.sleep(0.01)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(lambda: None)  # never leaves the queue
+
+        assert executor.stats().timeouts == 1
+        assert executor.stats().queued == 0
+    finally:
+        release.set()
+        await busy
+        executor.shutdown()
@@ -0,0 +1,179 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the scripted fake recognizer backend"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.plugins.azure.realtime.fake import FakeScript, FakeSpeechBackend, FakeUtterance
+
+from .test_session import _model
+
+_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "fake_conversation.json")
+
+
+def _backend(script=None, **kwargs):
+    kwargs.setdefault("connect_latency", 0.0)
+    kwargs.setdefault("recognition_latency", 0.01)
+    kwargs.setdefault("synthesis_latency", 0.01)
+    return FakeSpeechBackend(script or FakeScript.from_file(_FIXTURE), **kwargs)
+
+
+def _frames(seconds, sample_rate=16000):
+    samples = sample_rate // 100
+    for _ in range(int(seconds * 100)):
+        yield rtc.AudioFrame(b"\x00\x00" * samples, sample_rate, 1, samples)
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_script_loads_from_file():
+    """Test that a JSON script becomes utterances with defaults filled in"""
+    script = FakeScript.from_file(_FIXTURE)
+
+    assert script.loop
+    assert [u.text for u in script.utterances] == ["good morning everyone", "let us get started"]
+    assert script.utterances[0].translations["de"] == "guten Morgen zusammen"
+    assert script.utterances[0].source_language == "en-US"
+
+    with pytest.raises(ValueError):
+        FakeSpeechBackend(FakeScript(utterances=[]))
+
+
+@pytest.mark.asyncio
+async def test_session_plays_script_through_fake_backend():
+    """Test that pushed audio yields scripted results, metrics and audio end to end"""
+    session = _model(use_personal_voice=True, backend=_backend()).session()
+    results, interpreter_metrics, generations, metrics = [], [], [], []
+    session.on("translation_result", results.append)
+    session.on("generation_created", generations.append)
+    session.on("generation_metrics_collected", metrics.append)
+    session.on("interpreter_metrics_collected", interpreter_metrics.append)
+
+    for frame in _frames(0.7):
+        session.push_audio(frame)
+        await asyncio.sleep(0)
+
+    await _wait_for(lambda: len(metrics) == 2)
+
+    assert [r.source_text for r in results] == ["good morning everyone", "let us get started"]
+    assert results[1].translations == {"fr": "commençons", "de": "fangen wir an"}
+    assert [m.source_language for m in interpreter_metrics] == ["en-US", "en-US"]
+    assert metrics[0].input_audio_duration == pytest.approx(0.3)
+    assert metrics[0].output_audio_duration == pytest.approx(0.2)
+    assert metrics[1].end_to_end_latency > 0
+
+    message = await generations[0].message_stream.recv()
+    frames = [frame async for frame in message.audio_stream]
+    assert sum(frame.samples_per_channel for frame in frames) == 24000 * 2 // 10
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scripted_cancellation_reconnects():
+    """Test that a scripted transient error makes the session reconnect to the fake service"""
+    script = FakeScript(
+        utterances=[
+            FakeUtterance(text="one", duration_ms=200, cancel="Error", error_code="ServiceTimeout"),
+            FakeUtterance(text="two", duration_ms=200),
+        ],
+        loop=False,
+    )
+    session = _model(backend=_backend(script)).session()
+    errors = []
+    session.on("error", errors.append)
+
+    for frame in _frames(0.3):
+        session.push_audio(frame)
+        await asyncio.sleep(0)
+
+    await _wait_for(lambda: session.reconnect_stats.reconnects >= 1)
+    assert errors and errors[0].recoverable
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_language_change_mid_utterance_keeps_feeding_old_recognizer():
+    """Test that a recognizer replaced mid-utterance still hears the utterance to its end"""
+    script = FakeScript(
+        utterances=[FakeUtterance(text="one two three four", duration_ms=400, partials=2)],
+        loop=False,
+    )
+    session = _model(backend=_backend(script)).session()
+    results = []
+    session.on("translation_result", results.append)
+    frames = list(_frames(0.7))
+
+    for frame in frames[:25]:
+        session.push_audio(frame)
+        await asyncio.sleep(0)
+    await _wait_for(lambda: session._active is not None and session._active.utterance_open)
+    old = session._active
+
+    session.update_options(target_languages=["es"])
+    await session._swap_task
+    new = session._active
+    assert new is not old and new.held
+    # enough audio after the swap for the new recognizer to emit a fragment if it heard it
+    for frame in frames[25:]:
+        session.push_audio(frame)
+        await asyncio.sleep(0)
+
+    # only the old recognizer heard the whole utterance
+    await _wait_for(lambda: len(results) == 1)
+    assert results[0].source_text == "one two three four"
+    assert results[0].translations == {"fr": "one two three four", "de": "one two three four"}
+    await _wait_for(lambda: not session._drain_tasks)
+    assert session._outgoing == []
+
+    # the new recognizer got exactly the input after the utterance, mapped to it
+    assert not new.held
+    assert new.stream_bytes == 30 * 320
+    assert session._input_position(new, 0) == 40 * 320
+    await asyncio.sleep(0.1)
+    assert len(results) == 1
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_first_connect_drops_no_input():
+    """Test that audio arriving while the first recognizer connects is queued, not dropped"""
+    session = _model(backend=_backend(connect_latency=0.5)).session()
+
+    for frame in _frames(2.5):
+        session.push_audio(frame)
+        await asyncio.sleep(0)
+
+    await _wait_for(lambda: session._is_running)
+    await _wait_for(lambda: session.input_stats.pending_frames == 0)
+    assert session.input_stats.dropped_frames == 0
+    # every frame reached the recognizer, through the replay or directly
+    assert session._active.stream_bytes == 250 * 320
+
+    await session.aclose()
@@ -0,0 +1,99 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the input audio ingest queue"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.plugins.azure.realtime.ingest import AudioIngestQueue
+
+
+def _frame(marker: int) -> rtc.AudioFrame:
+    frame = rtc.AudioFrame.create(16000, 1, 160)
+    frame.data[0] = marker
+    return frame
+
+
+async def _drain(queue: AudioIngestQueue) -> list[int]:
+    markers = []
+    while queue.qsize():
+        frame = await queue.get()
+        markers.append(frame.data[0])
+    return markers
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    """Test that a full queue discards the oldest frame"""
+    queue = AudioIngestQueue(maxsize=3, overflow="drop_oldest")
+    for i in range(5):
+        assert queue.put_nowait(_frame(i)) is True
+
+    assert await _drain(queue) == [2, 3, 4]
+    assert queue.dropped_frames == 2
+    assert queue.queued_frames == 5
+
+
+@pytest.mark.asyncio
+async def test_drop_newest():
+    """Test that a full queue rejects the incoming frame"""
+    queue = AudioIngestQueue(maxsize=3, overflow="drop_newest")
+    accepted = [queue.put_nowait(_frame(i)) for i in range(5)]
+
+    assert accepted == [True, True, True, False, False]
+    assert await _drain(queue) == [0, 1, 2]
+    assert queue.stats().dropped_frames == 2
+
+
+@pytest.mark.asyncio
+async def test_block_keeps_order():
+    """Test that the block policy never drops and preserves ordering"""
+    queue = AudioIngestQueue(maxsize=2, overflow="block")
+    for i in range(6):
+        queue.put_nowait(_frame(i))
+
+    assert queue.qsize() == 6
+    first = await queue.get()
+    queue.put_nowait(_frame(6))
+
+    assert [first.data[0]] + await _drain(queue) == [0, 1, 2, 3, 4, 5, 6]
+    assert queue.dropped_frames == 0
+
+
+@pytest.mark.asyncio
+async def test_block_backlog_is_bounded():
+    """Test that the block policy drops incoming frames once the backlog is full"""
+    queue = AudioIngestQueue(maxsize=2, overflow="block", max_backlog=3)
+    accepted = [queue.put_nowait(_frame(i)) for i in range(7)]
+
+    assert accepted == [True] * 5 + [False, False]
+    assert queue.stats().dropped_frames == 2
+    assert await _drain(queue) == [0, 1, 2, 3, 4]
+
+
+def test_invalid_maxsize():
+    """Test that the queue requires a positive capacity"""
+    with pytest.raises(ValueError):
+        AudioIngestQueue(maxsize=0)
+
+
+def test_invalid_overflow_policy():
+    """Test that a misspelled overflow policy is rejected"""
+    with pytest.raises(ValueError):
+        AudioIngestQueue(maxsize=10, overflow="drop-oldest")
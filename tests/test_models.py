@@ -73,3 +73,23 @@ def test_live_interpreter_config():
     assert config.speaker_profile_id is None
     assert config.enable_word_level_timestamps is False
     assert config.profanity_option == "masked"
+
+
+def test_synthesis_output_formats():
+    """Test raw PCM synthesis formats cover the supported playout rates"""
+    assert sorted(models.SYNTHESIS_OUTPUT_FORMATS) == [16000, 24000, 48000]
+    for rate, name in models.SYNTHESIS_OUTPUT_FORMATS.items():
+        assert name.startswith("Raw")
+        assert name.endswith("16BitMonoPcm")
+        assert str(rate // 1000) in name
+
+
+def test_latency_profiles():
+    """Test that latency profiles order segmentation silence from fastest to slowest"""
+    profiles = models.LATENCY_PROFILES
+    assert profiles["default"] == models.LatencyProfile()
+    assert (
+        profiles["low-latency"].segmentation_silence_timeout_ms
+        < profiles["conference"].segmentation_silence_timeout_ms
+        < profiles["dictation"].segmentation_silence_timeout_ms
+    )
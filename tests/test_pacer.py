@@ -0,0 +1,79 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the real-time output pacer"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.agents import utils
+from livekit.plugins.azure.realtime.pacer import AudioPacer
+
+
+def _frames(count: int, ms: int = 10) -> list:
+    return [rtc.AudioFrame.create(16000, 1, 16 * ms) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_burst_is_released_in_real_time():
+    """Test that a burst is held back and released at playout speed"""
+    out_ch = utils.aio.Chan[rtc.AudioFrame]()
+    done = asyncio.Event()
+    pacer = AudioPacer(out_ch, jitter_buffer_ms=50, on_done=done.set)
+
+    for frame in _frames(30):
+        pacer.push(frame)
+    pacer.end_input()
+    assert pacer.buffered_duration == pytest.approx(0.3)
+
+    start = time.monotonic()
+    received = []
+    async for frame in out_ch:
+        received.append((time.monotonic() - start, frame))
+
+    assert len(received) == 30
+    # the jitter buffer goes out right away, the remainder follows the clock
+    assert received[4][0] < 0.03
+    assert received[-1][0] == pytest.approx(0.3 - 0.05, abs=0.05)
+    assert done.is_set()
+
+    stats = pacer.stats()
+    assert stats.buffered_duration == 0
+    assert stats.max_buffered_duration == pytest.approx(0.3)
+    assert stats.released_duration == pytest.approx(0.3)
+
+
+@pytest.mark.asyncio
+async def test_interrupt_drops_buffered_audio():
+    """Test that interrupting discards held frames and closes the output"""
+    out_ch = utils.aio.Chan[rtc.AudioFrame]()
+    pacer = AudioPacer(out_ch, jitter_buffer_ms=20)
+
+    for frame in _frames(50):
+        pacer.push(frame)
+    await asyncio.sleep(0.01)
+    pacer.interrupt()
+
+    received = [frame async for frame in out_ch]
+    assert len(received) < 10
+    assert pacer.done
+    assert pacer.buffered_duration == 0
+    await pacer.aclose()
@@ -0,0 +1,165 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the PCM DSP helpers"""
+
+import math
+import random
+import warnings
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime import pcm
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+requires_audioop = pytest.mark.skipif(audioop is None, reason="audioop reference not available")
+
+# (numpy, pure-python) pairs must stay interchangeable
+DOWNMIX = [pcm._downmix_np, pcm._downmix_py]
+GAIN = [pcm._apply_gain_np, pcm._apply_gain_py]
+TO_INT16 = [pcm._to_int16_np, pcm._to_int16_py]
+RMS = [pcm._rms_np, pcm._rms_py]
+
+
+def _pcm(num_samples: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    values = [rng.randint(-32768, 32767) for _ in range(num_samples)]
+    values[:4] = [-32768, 32767, -1, 1]
+    return b"".join(v.to_bytes(2, "little", signed=True) for v in values)
+
+
+@requires_audioop
+@pytest.mark.parametrize("downmix", DOWNMIX)
+def test_downmix_matches_audioop(downmix):
+    """Test that stereo downmix is bit-exact with audioop.tomono"""
+    data = _pcm(4800)
+    expected = audioop.tomono(data, 2, 0.5, 0.5)
+    assert bytes(downmix(data, 2)) == expected
+
+
+@requires_audioop
+@pytest.mark.parametrize("apply_gain", GAIN)
+@pytest.mark.parametrize("gain", [0.0, 0.3, 1.0, 1.7, -2.5])
+def test_apply_gain_matches_audioop(apply_gain, gain):
+    """Test that gain is bit-exact with audioop.mul, including saturation"""
+    data = _pcm(2000, seed=1)
+    assert bytes(apply_gain(data, gain)) == audioop.mul(data, 2, gain)
+
+
+@requires_audioop
+@pytest.mark.parametrize("rms", RMS)
+def test_rms_matches_audioop(rms):
+    """Test that RMS levels match audioop.rms, including silence and empty input"""
+    data = _pcm(1600, seed=2)
+    assert rms(data) == audioop.rms(data, 2)
+    assert rms(bytes(320)) == 0
+    assert rms(b"") == 0
+
+
+@pytest.mark.parametrize("downmix", DOWNMIX)
+def test_downmix_multichannel(downmix):
+    """Test that more than two channels are averaged with floor rounding"""
+    frame = [-7, 2, 3, 100, 200, 301]
+    data = b"".join(v.to_bytes(2, "little", signed=True) for v in frame)
+    mono = downmix(data, 3).cast("h").tolist()
+    assert mono == [(-7 + 2 + 3) // 3, (100 + 200 + 301) // 3]
+
+
+@pytest.mark.parametrize("downmix", DOWNMIX)
+def test_downmix_into_preallocated_buffer(downmix):
+    """Test that downmix writes into a caller-provided buffer"""
+    out = bytearray(8)
+    view = downmix(_pcm(8), 2, out=out)
+    assert view.obj is out
+    assert len(view) == 8
+
+
+@pytest.mark.parametrize("to_int16", TO_INT16)
+def test_to_int16_saturates(to_int16):
+    """Test float to int16 conversion with clipping and floor rounding"""
+    values = [0.0, 0.5, -0.5, 1.0, -1.0, 2.0, -2.0]
+    result = to_int16(values, scale=32768).cast("h").tolist()
+    assert result == [0, 16384, -16384, 32767, -32768, 32767, -32768]
+    assert to_int16([1.9, -1.1]).cast("h").tolist() == [1, -2]
+
+
+def _tone(frequency: float, num_samples: int, sample_rate: int = 48000) -> bytes:
+    step = 2 * math.pi * frequency / sample_rate
+    values = [int(10000 * math.sin(step * n)) for n in range(num_samples)]
+    return b"".join(v.to_bytes(2, "little", signed=True) for v in values for _ in range(2))
+
+
+def _level(data: memoryview) -> float:
+    # RMS of the output once the filter has settled
+    samples = data.cast("h").tolist()[200:]
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def test_resampler_identity():
+    """Test that equal rates reduce the fused resampler to a plain downmix"""
+    data = _pcm(960, seed=2)
+    resampler = pcm.DownmixResampler(48000, 48000, num_channels=2)
+    assert bytes(resampler.push(data)) == bytes(pcm.downmix(data, 2))
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_resampler_chunking_is_stable(use_numpy):
+    """Test that chunk boundaries do not change the resampled output"""
+    data = _pcm(4800, seed=3)
+
+    whole = pcm.DownmixResampler(48000, 16000, num_channels=2)
+    chunked = pcm.DownmixResampler(48000, 16000, num_channels=2)
+    push_whole = whole._push_np if use_numpy else whole._push_py
+    push_chunked = chunked._push_np if use_numpy else chunked._push_py
+
+    expected = bytes(push_whole(data))
+    pieces = [data[i : i + 372] for i in range(0, len(data), 372)]
+    assert b"".join(bytes(push_chunked(p)) for p in pieces) == expected
+    # output lags by the filter half width, 48 input samples for 3:1 decimation
+    assert len(expected) // 2 == (2400 - 48) // 3
+
+
+@pytest.mark.parametrize("rates", [(24000, 16000), (44100, 16000), (16000, 48000)])
+def test_resampler_implementations_agree(rates):
+    """Test that the NumPy and pure-Python resamplers agree to within one LSB"""
+    data = _pcm(3000, seed=4)
+    fast = pcm.DownmixResampler(*rates, num_channels=1)
+    slow = pcm.DownmixResampler(*rates, num_channels=1)
+    a = fast._push_np(data).cast("h").tolist()
+    b = slow._push_py(data).cast("h").tolist()
+    assert len(a) == len(b)
+    assert max(abs(x - y) for x, y in zip(a, b)) <= 1
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_resampler_filters_aliases(use_numpy):
+    """Test that decimation passes speech-band tones and removes frequencies above Nyquist"""
+    passed = pcm.DownmixResampler(48000, 16000, num_channels=2)
+    aliased = pcm.DownmixResampler(48000, 16000, num_channels=2)
+    push_passed = passed._push_np if use_numpy else passed._push_py
+    push_aliased = aliased._push_np if use_numpy else aliased._push_py
+
+    # 12 kHz would fold onto 4 kHz without the low-pass filter
+    assert _level(push_passed(_tone(1000, 4800))) > 0.95 * 10000 / math.sqrt(2)
+    assert _level(push_aliased(_tone(12000, 4800))) < 10
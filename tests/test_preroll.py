@@ -0,0 +1,92 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the input pre-roll ring buffer"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.preroll import PreRollBuffer
+
+
+def _samples(start: int, count: int) -> bytes:
+    return b"".join((v % 30000).to_bytes(2, "little", signed=True) for v in range(start, start + count))
+
+
+def _pending(ring, **kwargs) -> bytes:
+    return b"".join(bytes(view) for _, view in ring.pending(**kwargs))
+
+
+def test_ring_keeps_newest_audio_across_wrap():
+    """Test that the ring keeps the newest bytes in order after wrapping"""
+    ring = PreRollBuffer(sample_rate=1000, duration_ms=100)  # 100 samples
+    assert ring.capacity == 200
+
+    data = _samples(0, 160)
+    ring.write(data[:240])
+    ring.write(data[240:])
+
+    assert ring.head == 320
+    assert _pending(ring) == data[-200:]
+    assert [position for position, _ in ring.pending()] == [120, 200]
+
+
+def test_ring_release_and_memory_cap():
+    """Test that released audio is not replayed and max_bytes bounds the ring"""
+    ring = PreRollBuffer(sample_rate=16000, duration_ms=1000, max_bytes=1001)
+    assert ring.capacity == 1000
+
+    data = _samples(0, 300)
+    ring.write(data)
+    ring.release(400)
+    assert ring.pending_bytes == 200
+    assert _pending(ring) == data[400:]
+
+    ring.clear()
+    assert ring.pending_bytes == 0
+
+
+def test_ring_trims_long_silence():
+    """Test that silent stretches are shortened to one block when trimming"""
+    ring = PreRollBuffer(sample_rate=16000, duration_ms=1000)
+    block = 640  # 20 ms
+    speech = b"\x00\x10" * (block // 2)
+    ring.write(speech + bytes(block * 5) + speech)
+
+    assert _pending(ring) == speech + bytes(block * 5) + speech
+    assert _pending(ring, trim_silence=True) == speech + bytes(block) + speech
+
+    spans = list(ring.pending(trim_silence=True))
+    assert spans[-1][0] == block * 6
+
+
+def test_disabled_ring_holds_nothing():
+    """Test that a zero duration disables buffering"""
+    ring = PreRollBuffer(sample_rate=16000, duration_ms=0)
+    ring.write(_samples(0, 10))
+    assert ring.capacity == 0
+    assert _pending(ring) == b""
+
+
+def test_disabled_ring_still_counts_positions():
+    """Test that a zero-capacity ring keeps no audio but advances its head"""
+    ring = PreRollBuffer(sample_rate=16000, duration_ms=0)
+    ring.write(_samples(0, 100))
+
+    assert ring.capacity == 0
+    assert ring.head == 200
+    assert ring.pending_bytes == 0
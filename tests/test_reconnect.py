@@ -0,0 +1,65 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for reconnect backoff and circuit breaking"""
+
+import random
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.reconnect import BackoffPolicy, CircuitBreaker
+
+
+def test_backoff_grows_and_is_capped():
+    """Test that delays grow exponentially, stay jittered and respect max_delay"""
+    policy = BackoffPolicy(initial_delay=0.5, max_delay=4.0, multiplier=2.0, jitter=0.5)
+    rng = random.Random(0)
+
+    for attempt, ceiling in enumerate([0.5, 1.0, 2.0, 4.0, 4.0, 4.0]):
+        delay = policy.delay(attempt, rng)
+        assert ceiling * 0.5 <= delay <= ceiling
+
+    assert BackoffPolicy(jitter=0.0).delay(2) == 1.0
+
+    with pytest.raises(ValueError):
+        BackoffPolicy(jitter=1.5)
+
+
+def test_circuit_opens_and_probes_after_timeout():
+    """Test the closed -> open -> half-open -> closed cycle"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0, clock=lambda: now[0])
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10.0
+
+    now[0] = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.consecutive_failures == 0
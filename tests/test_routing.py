@@ -0,0 +1,100 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for per-language synthesized audio routing"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit import rtc
+from livekit.plugins.azure.realtime.routing import AudioRouter
+
+
+def _frame(samples: int = 320) -> rtc.AudioFrame:
+    return rtc.AudioFrame(bytes(samples * 2), 16000, 1, samples)
+
+
+def _drain(ch) -> list:
+    frames = []
+    while True:
+        try:
+            frames.append(ch.recv_nowait())
+        except Exception:
+            return frames
+
+
+@pytest.mark.asyncio
+async def test_frames_reach_only_subscribers_of_the_language():
+    """Test that each subscriber of a language gets the same frames and others get none"""
+    router = AudioRouter()
+    first = router.subscribe("fr")
+    second = router.subscribe("fr")
+    german = router.subscribe("de")
+    frames = [_frame(), _frame(160)]
+
+    for frame in frames:
+        router.push("fr", frame)
+        router.push("es", frame)  # nobody listens: dropped
+
+    # the frames are shared, not rebuilt per subscriber
+    assert _drain(first) == frames
+    assert all(a is b for a, b in zip(_drain(second), frames))
+    assert _drain(german) == []
+    assert not router.has_subscribers("es")
+
+    await router.aclose()
+    assert first.closed and german.closed
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_closes_stream_and_drops_empty_route():
+    """Test that the last unsubscribe removes the language route"""
+    router = AudioRouter(jitter_buffer_ms=100)
+    ch = router.subscribe("fr")
+    router.push("fr", _frame())
+
+    router.unsubscribe(ch)
+
+    assert ch.closed
+    assert not router.has_subscribers("fr")
+    await router.aclose()
+
+
+@pytest.mark.asyncio
+async def test_interrupt_flushes_paced_audio_and_keeps_streams_open():
+    """Test that after an interrupt no held frame is emitted, while later frames still are"""
+    router = AudioRouter(jitter_buffer_ms=20)
+    ch = router.subscribe("fr")
+    for _ in range(10):
+        router.push("fr", _frame())  # 200 ms burst of 20 ms frames
+    await asyncio.sleep(0.05)
+    assert 0 < len(_drain(ch)) < 10
+
+    router.interrupt()
+    await asyncio.sleep(0.2)
+    assert _drain(ch) == []
+    assert not ch.closed
+
+    # the next generation still reaches the subscriber
+    frame = _frame()
+    router.push("fr", frame)
+    await asyncio.sleep(0.01)
+    assert _drain(ch) == [frame]
+
+    await router.aclose()
@@ -0,0 +1,591 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Live Interpreter session, without connecting to Azure"""
+
+import asyncio
+import types
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+import azure.cognitiveservices.speech as speechsdk
+from livekit import rtc
+from livekit.plugins.azure import realtime
+from livekit.plugins.azure.realtime import realtime_model
+from livekit.plugins.azure.realtime.reconnect import BackoffPolicy
+
+
+def _model(**kwargs):
+    kwargs.setdefault("target_languages", ["fr", "de"])
+    kwargs.setdefault("use_personal_voice", False)
+    return realtime.LiveInterpreterModel(subscription_key="key", region="eastus", **kwargs)
+
+
+class _FakeSignal:
+    def connect(self, callback):
+        pass
+
+    def disconnect_all(self):
+        pass
+
+
+class _FakeRecognizer:
+    def __init__(self):
+        self.stopped = False
+        for name in (
+            "recognizing",
+            "recognized",
+            "synthesizing",
+            "canceled",
+            "session_started",
+            "session_stopped",
+        ):
+            setattr(self, name, _FakeSignal())
+
+    def stop_continuous_recognition(self):
+        self.stopped = True
+
+
+class _FakeStream:
+    def __init__(self):
+        self.written = 0
+        self.closed = False
+
+    def write(self, data):
+        self.written += len(data)
+
+    def close(self):
+        self.closed = True
+
+
+def _fake_connect(handles):
+    async def connect(self):
+        handle = realtime_model._RecognizerHandle(
+            recognizer=_FakeRecognizer(),
+            audio_stream=_FakeStream(),
+            settings=self._recognizer_settings(),
+        )
+        handles.append(handle)
+        return handle
+
+    return connect
+
+
+def test_prewarm_marks_process(monkeypatch):
+    """Test that the worker prewarm helper runs without credentials"""
+    monkeypatch.delenv("AZURE_SPEECH_REGION", raising=False)
+    proc = types.SimpleNamespace(userdata={})
+
+    realtime.prewarm(proc)
+
+    assert proc.userdata["azure_live_interpreter_prewarmed"] is True
+
+
+@pytest.mark.asyncio
+async def test_connect_on_session_shares_start(monkeypatch):
+    """Test that an eager start is shared with the first audio frame"""
+    started = []
+
+    async def fake_start(self):
+        started.append(True)
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_start_recognition", fake_start)
+    session = _model(connect_on_session=True).session()
+    assert session._start_task is not None
+
+    await asyncio.gather(session._ensure_started(), session._ensure_started())
+    assert started == [True]
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_partial_translations_reconcile_with_final():
+    """Test that streamed partials and the final result form one caption"""
+    session = _model(stream_partial_translations=True).session()
+
+    session._handle_partial_translation("fr", "bonjour le")
+    session._handle_partial_translation("fr", "bonjour le monde")
+    generation = session._current_generation
+    session._handle_final_translation(
+        "en", "hello world", {"fr": "bonjour le monde", "de": "hallo Welt"}
+    )
+
+    chunks = [chunk async for chunk in generation.text_ch]
+    assert chunks[0] == "[fr] bonjour "
+    assert "".join(chunks) == "[fr] bonjour le monde\n[en] hello world\n[de] hallo Welt"
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_partials_of_next_utterance_wait_for_previous_audio():
+    """Test that partials arriving while the previous generation still speaks are not dropped"""
+    session = _model(
+        target_languages=["fr"],
+        use_personal_voice=True,
+        synthesis_sample_rate=16000,
+        stream_partial_translations=True,
+        text_output="primary",
+    ).session()
+    generations = []
+    session.on("generation_created", generations.append)
+
+    session._handle_final_translation("en", "hello", {"fr": "bonjour"})
+    session._handle_audio_chunk(b"\x00\x00" * 320)
+    # the next utterance is recognized before the first one's audio is complete
+    session._handle_partial_translation("fr", "au revoir")
+    session._handle_partial_translation("fr", "au revoir tout")
+    assert len(generations) == 1
+
+    session._handle_audio_chunk(b"")
+    assert len(generations) == 2
+    generation = session._current_generation
+    session._handle_final_translation("en", "goodbye everyone", {"fr": "au revoir tout le monde"})
+
+    chunks = [chunk async for chunk in generation.text_ch]
+    assert chunks[0] == "au "
+    assert "".join(chunks) == "au revoir tout le monde"
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hot_swap_moves_audio_before_stopping_old_recognizer(monkeypatch):
+    """Test that update_options connects a new recognizer before draining the old one"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model().session()
+    frame = rtc.AudioFrame(b"\x00\x00" * 160, 16000, 1, 160)
+
+    await session._push_audio_async(frame)
+    await session._start_task
+    old = handles[0]
+    assert old.audio_stream.written == 320
+
+    session.update_options(target_languages=["es"])
+    await session._swap_task
+    new = handles[1]
+    assert session._active is new
+    assert new.settings[0] == ("es",)
+
+    await session._push_audio_async(frame)
+    assert new.audio_stream.written == 320
+    assert old.audio_stream.written == 320
+
+    # the old stream is ended, but the recognizer is stopped only once it reports it is done
+    await asyncio.sleep(0)
+    assert old.audio_stream.closed and not old.recognizer.stopped
+    session._handle_session_stopped(old)
+    await asyncio.gather(*session._drain_tasks)
+    assert old.recognizer.stopped
+    assert session._is_running
+
+    await session.aclose()
+    assert new.recognizer.stopped
+
+
+@pytest.mark.asyncio
+async def test_audio_is_replayed_after_failed_start(monkeypatch):
+    """Test that frames pushed while the service is unreachable reach the next recognizer"""
+    handles = []
+    connect = _fake_connect(handles)
+    attempts = []
+
+    async def flaky_connect(self):
+        attempts.append(True)
+        if len(attempts) == 1:
+            raise realtime_model.APIConnectionError("unreachable")
+        return await connect(self)
+
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", flaky_connect)
+    session = _model(reconnect=False).session()
+    frame = rtc.AudioFrame(b"\x01\x00" * 160, 16000, 1, 160)
+
+    # the start runs in the background, the frame waits in the pre-roll
+    await session._push_audio_async(frame)
+    with pytest.raises(realtime_model.APIConnectionError):
+        await session._start_task
+    await session._push_audio_async(frame)
+    await session._start_task
+    assert handles[0].audio_stream.written == 640
+
+    # a final result covering the first frame keeps it out of later replays
+    session._release_input(handles[0], end_ticks=100_000)  # 10 ms
+    assert session._preroll.pending_bytes == 320
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancellation_reconnects_with_backoff_and_replays(monkeypatch):
+    """Test that an injected cancellation is followed by a backed-off reconnect"""
+    handles = []
+    connect = _fake_connect(handles)
+    failures = [True]
+
+    async def connect_after_outage(self):
+        if len(handles) == 1 and failures:
+            failures.pop()
+            raise realtime_model.APIConnectionError("still down")
+        return await connect(self)
+
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", connect_after_outage)
+    session = _model(reconnect_backoff=BackoffPolicy(initial_delay=0.01, max_delay=0.02)).session()
+    errors = []
+    session.on("error", errors.append)
+    frame = rtc.AudioFrame(b"\x01\x00" * 160, 16000, 1, 160)
+
+    await session._push_audio_async(frame)
+    await session._start_task
+    session._handle_cancellation(
+        speechsdk.CancellationReason.Error, "connection reset", handles[0]
+    )
+    assert errors[0].recoverable
+    assert not session._is_running
+
+    # frames pushed during the outage only go to the pre-roll
+    await session._push_audio_async(frame)
+    assert handles[0].audio_stream.written == 320
+
+    await asyncio.wait_for(session._reconnect_task, 1.0)
+    stats = session.reconnect_stats
+    assert stats.reconnects == 1 and stats.failed_attempts == 1
+    assert stats.last_reconnect_latency > 0
+    assert stats.circuit_state == "closed"
+    assert session._active is handles[1]
+    assert handles[1].audio_stream.written == 640
+    assert handles[0].recognizer.stopped
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fatal_cancellation_does_not_reconnect(monkeypatch):
+    """Test that errors a reconnect cannot fix are reported as unrecoverable"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model().session()
+    errors = []
+    session.on("error", errors.append)
+
+    await session._push_audio_async(rtc.AudioFrame(b"\x00\x00" * 160, 16000, 1, 160))
+    await session._start_task
+    session._handle_cancellation(
+        speechsdk.CancellationReason.Error, "invalid key", handles[0], retryable=False
+    )
+
+    assert not errors[0].recoverable
+    assert session._reconnect_task is None
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_per_language_subscriptions_and_typed_results():
+    """Test that subscribers get plain text in their language only"""
+    session = _model(text_output="primary").session()
+    results = []
+    session.on("translation_result", results.append)
+    german = session.subscribe_text("de")
+
+    with pytest.raises(ValueError):
+        session.subscribe_text("ja")
+
+    generation = session._ensure_generation()
+    session._handle_final_translation("en", "hello", {"fr": "bonjour", "de": "hallo"})
+
+    assert await german.recv() == "hallo"
+    assert [chunk async for chunk in generation.text_ch] == ["bonjour"]
+    assert results[0].source_language == "en"
+    assert results[0].translations == {"fr": "bonjour", "de": "hallo"}
+
+    await session.aclose()
+    assert german.closed
+
+
+@pytest.mark.asyncio
+async def test_audio_subscription_carries_generation_frames():
+    """Test that only the voiced language can be subscribed and gets the generation's frames"""
+    session = _model(use_personal_voice=True, synthesis_sample_rate=16000).session()
+    assert session.voiced_language == "fr"
+    with pytest.raises(ValueError):
+        session.subscribe_audio("de")
+    french = session.subscribe_audio("fr")
+
+    generation = session._ensure_generation()
+    session._handle_audio_chunk(b"\x00\x00" * 480)  # one 20 ms chunk and a 10 ms tail
+    session._handle_audio_chunk(b"")
+
+    frames = [frame async for frame in generation.audio_ch]
+    assert [f.samples_per_channel for f in frames] == [320, 160]
+    assert [french.recv_nowait() for _ in frames] == frames
+
+    await session.aclose()
+    assert french.closed
+
+
+@pytest.mark.asyncio
+async def test_interrupted_generation_flushes_subscriber_audio():
+    """Test that subscribers stop receiving a generation's audio once it is interrupted"""
+    session = _model(
+        use_personal_voice=True, synthesis_sample_rate=16000, output_jitter_buffer_ms=20
+    ).session()
+    french = session.subscribe_audio("fr")
+
+    session._ensure_generation()
+    session._handle_audio_chunk(b"\x00\x00" * 3200)  # 200 ms burst
+    await asyncio.sleep(0.05)
+    while not french.empty():
+        french.recv_nowait()
+
+    session._finalize_generation(interrupted=True)
+    await asyncio.sleep(0.2)
+    assert french.empty() and not french.closed
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_vad_gate_withholds_silence_and_maps_offsets(monkeypatch):
+    """Test that gated silence is not streamed and results still release the right input"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model(input_vad="energy", vad_hangover_ms=20, vad_preroll_ms=10).session()
+    speech = rtc.AudioFrame((2000).to_bytes(2, "little", signed=True) * 160, 16000, 1, 160)
+    silence = rtc.AudioFrame(b"\x00\x00" * 160, 16000, 1, 160)
+
+    await session._push_audio_async(silence)
+    await session._start_task
+    for frame in (silence, silence, silence, speech, silence, silence, silence):
+        await session._push_audio_async(frame)
+
+    # replayed first frame, 10 ms pre-roll with the onset and two frames of hangover
+    assert handles[0].audio_stream.written == 1600
+    stats = session.vad_stats
+    assert stats.gated_duration == pytest.approx(0.03)
+    assert stats.gated_ratio == pytest.approx(3 / 7)  # the replayed frame bypasses the gate
+
+    # a result ending at the speech onset, 20 ms into the stream
+    session._release_input(handles[0], end_ticks=200_000)
+    assert session._preroll.pending_bytes == 1280
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_vad_option_validation():
+    """Test that unknown VAD values are rejected"""
+    with pytest.raises(ValueError):
+        _model(input_vad="webrtc")
+    session = _model().session()
+    assert session.vad_stats is None
+    await session.aclose()
+
+
+def test_input_overflow_validation():
+    """Test that the model rejects unknown input_overflow policies up front"""
+    with pytest.raises(ValueError):
+        _model(input_overflow="drop-oldest")
+    assert _model(input_overflow="block")._opts.input_overflow == "block"
+
+
+def test_source_language_validation():
+    """Test that source language options are checked against the language ID mode"""
+    with pytest.raises(ValueError):
+        _model(source_language="en-US", source_languages=["en-US", "de-DE"])
+    with pytest.raises(ValueError):
+        _model(source_languages=["en-US", "de-DE", "fr-FR", "es-ES", "it-IT"], language_id_mode="at_start")
+    with pytest.raises(ValueError):
+        _model(language_id_mode="sometimes")
+    _model(source_languages=["en-US", "de-DE", "fr-FR", "es-ES", "it-IT"], language_id_mode="continuous")
+
+
+def test_language_id_mode_requires_candidates():
+    """Test that a language ID mode is rejected unless source_languages candidates are given"""
+    with pytest.raises(ValueError):
+        _model(language_id_mode="at_start")
+    with pytest.raises(ValueError):
+        _model(source_language="en-US", language_id_mode="continuous")
+
+    assert _model()._opts.language_id_mode is None
+    assert _model(source_languages=["en-US", "de-DE"])._opts.language_id_mode == "continuous"
+
+
+def _result(reason, language, offset_ms, duration_ms, text="hello"):
+    properties = {}
+    if language is not None:
+        properties[speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult] = language
+    return types.SimpleNamespace(
+        reason=reason,
+        properties=properties,
+        offset=offset_ms * 10_000,
+        duration=duration_ms * 10_000,
+        text=text,
+        translations={"fr": "bonjour", "de": "hallo"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_language_detection_latency_in_metrics(monkeypatch):
+    """Test that the first partial naming a language sets the utterance's detection latency"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model(source_languages=["en-US", "de-DE"]).session()
+    await session._ensure_started()
+    handle = handles[0]
+    collected = []
+    session.on("interpreter_metrics_collected", collected.append)
+
+    partial = speechsdk.ResultReason.TranslatingSpeech
+    final = speechsdk.ResultReason.TranslatedSpeech
+    handle.stream_bytes = 32000  # 1 s streamed
+    session._on_recognizing(handle, types.SimpleNamespace(result=_result(partial, None, 200, 300)))
+    handle.stream_bytes = 48000
+    session._on_recognizing(handle, types.SimpleNamespace(result=_result(partial, "en-US", 200, 900)))
+    handle.stream_bytes = 64000
+    session._on_recognized(handle, types.SimpleNamespace(result=_result(final, "en-US", 200, 1500)))
+    await asyncio.sleep(0)
+
+    assert len(collected) == 1
+    metrics = collected[0]
+    assert metrics.source_language == "en-US"
+    assert metrics.language_id_mode == "continuous"
+    assert metrics.language_detection_latency == pytest.approx(1.3)
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fixed_source_language_skips_detection():
+    """Test that a fixed source language is reported without a detection latency"""
+    session = _model(source_language="de-DE").session()
+    collected = []
+    session.on("interpreter_metrics_collected", collected.append)
+    handle = realtime_model._RecognizerHandle(
+        recognizer=_FakeRecognizer(), audio_stream=_FakeStream(), settings=()
+    )
+
+    result = _result(speechsdk.ResultReason.TranslatedSpeech, None, 0, 500)
+    session._on_recognized(handle, types.SimpleNamespace(result=result))
+    await asyncio.sleep(0)
+
+    assert collected[0].source_language == "de-DE"
+    assert collected[0].language_id_mode == "fixed"
+    assert collected[0].language_detection_latency is None
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_latency_profile_update_replaces_recognizer(monkeypatch):
+    """Test that switching latency profile swaps the recognizer and shows in metrics"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model(latency_profile="conference").session()
+    collected = []
+    session.on("interpreter_metrics_collected", collected.append)
+    await session._ensure_started()
+
+    with pytest.raises(ValueError):
+        session.update_options(latency_profile="instant")
+    assert session._swap_task is None
+
+    session.update_options(latency_profile="low-latency")
+    await session._swap_task
+    assert len(handles) == 2
+    assert "low-latency" in session._active.settings
+
+    session._handle_final_translation("en", "hello", {"fr": "bonjour"})
+    assert collected[0].latency_profile == "low-latency"
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_generation_metrics_measure_from_input_arrival(monkeypatch):
+    """Test that generation metrics map results back to when their input arrived"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model(use_personal_voice=True).session()
+    await session._ensure_started()
+    realtime_metrics, generation_metrics = [], []
+    session.on("metrics_collected", realtime_metrics.append)
+    session.on("generation_metrics_collected", generation_metrics.append)
+
+    # the first 100 ms arrived 1.4 s ago, the rest up to 1 s of input 0.5 s ago
+    now = realtime_model.time.monotonic()
+    session._input_clock.record(3200, now - 1.4)
+    session._input_clock.record(32000, now - 0.5)
+    timing = realtime_model._UtteranceTiming(
+        handle=handles[0], start_ticks=0, end_ticks=10_000_000, audio_duration=1.0
+    )
+    session._handle_final_translation("en", "hello", {"fr": "bonjour", "de": "hallo"}, timing)
+    session._handle_audio_chunk(b"\x00\x00" * 2400)  # 100 ms at 24 kHz
+    session._handle_audio_chunk(b"")
+
+    assert len(realtime_metrics) == len(generation_metrics) == 1
+    metrics = generation_metrics[0]
+    assert metrics.request_id == realtime_metrics[0].request_id
+    assert metrics.target_languages == 2
+    assert metrics.input_audio_duration == pytest.approx(1.0)
+    assert metrics.output_audio_duration == pytest.approx(0.1)
+    assert 0.5 <= metrics.speech_end_to_final_text <= metrics.speech_end_to_first_audio < 1.0
+    assert metrics.end_to_end_latency == metrics.speech_end_to_first_audio
+    assert metrics.lag_behind_live == pytest.approx(metrics.end_to_end_latency + 0.9)
+    assert metrics.decode_time > 0 and metrics.chunk_time > 0
+    assert realtime_metrics[0].ttft == pytest.approx(metrics.speech_end_to_final_text)
+
+    stats = session.latency_stats
+    assert stats.end_to_end.count == 1
+    assert stats.lag_behind_live.p50 == metrics.lag_behind_live
+
+    await session.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ttft_ignores_partials_streamed_before_speech_end(monkeypatch):
+    """Test that with partial translations on, ttft runs to the first output after speech ends"""
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model(stream_partial_translations=True).session()
+    await session._ensure_started()
+    realtime_metrics, generation_metrics = [], []
+    session.on("metrics_collected", realtime_metrics.append)
+    session.on("generation_metrics_collected", generation_metrics.append)
+
+    # partials streamed while the user is still speaking
+    session._handle_partial_translation("fr", "bonjour le")
+    session._handle_partial_translation("fr", "bonjour le monde")
+    assert session._current_generation.partial_sent_at
+
+    await asyncio.sleep(0.05)
+    now = realtime_model.time.monotonic()
+    session._input_clock.record(3200, now - 0.9)
+    session._input_clock.record(32000, now)
+    timing = realtime_model._UtteranceTiming(
+        handle=handles[0], start_ticks=0, end_ticks=10_000_000, audio_duration=1.0
+    )
+    session._handle_final_translation("en", "hello world", {"fr": "bonjour le monde"}, timing)
+
+    ttft = realtime_metrics[0].ttft
+    assert ttft >= 0
+    assert ttft == pytest.approx(generation_metrics[0].speech_end_to_final_text)
+
+    await session.aclose()
@@ -0,0 +1,95 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the optional OpenTelemetry instrumentation"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+import azure.cognitiveservices.speech as speechsdk
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from livekit.plugins.azure import realtime
+from livekit.plugins.azure.realtime import realtime_model, telemetry
+
+from .test_session import _fake_connect, _model
+
+
+@pytest.fixture
+def otel():
+    reader = InMemoryMetricReader()
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    telemetry.enable(meter_provider=MeterProvider(metric_readers=[reader]), tracer_provider=tracer_provider)
+    try:
+        yield reader, exporter
+    finally:
+        telemetry.disable()
+
+
+def _points(reader):
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                points[metric.name] = list(metric.data.data_points)
+    return points
+
+
+def test_disabled_by_default():
+    """Test that hooks are no-ops until telemetry is enabled"""
+    assert telemetry.get() is None
+    assert isinstance(telemetry.span("azure_li.test"), contextlib.nullcontext)
+
+
+@pytest.mark.asyncio
+async def test_session_metrics_and_spans(monkeypatch, otel):
+    """Test that a session reports gauges, counters and spans once enabled"""
+    reader, exporter = otel
+    handles = []
+    monkeypatch.setattr(realtime.LiveInterpreterSession, "_connect_recognizer", _fake_connect(handles))
+    session = _model().session()
+    await session._ensure_started()
+
+    session._handle_final_translation("en-US", "hello", {"fr": "bonjour", "de": "hallo"})
+    session._handle_cancellation(speechsdk.CancellationReason.Error, "boom", retryable=False)
+    session._bridge.post(lambda: None)
+    await asyncio.sleep(0)
+
+    points = _points(reader)
+    # sessions of other tests may still be alive
+    active = points["azure_li.sessions.active"][0].value
+    assert active >= 1
+    assert points["azure_li.recognizers.active"][0].value >= 1
+    assert points["azure_li.utterances"][0].attributes == {"source_language": "en-US"}
+    assert points["azure_li.cancellations"][0].attributes["reason"] == "Error"
+    assert points["azure_li.callback.latency"][0].count >= 1
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert "azure_li.start_recognition" in spans
+    assert spans["azure_li.generation"].attributes["cancelled"] is False
+
+    await session.aclose()
+    assert _points(reader)["azure_li.sessions.active"][0].value == active - 1
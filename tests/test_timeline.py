@@ -0,0 +1,67 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the input timeline and latency distributions"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.timeline import InputClock, LatencyDistribution
+
+
+def test_input_clock_maps_positions_to_arrival():
+    """Test that each byte maps to the arrival time of the frame holding it"""
+    clock = InputClock(window_bytes=10_000)
+    clock.record(320, 1.0)
+    clock.record(640, 1.01)
+    clock.record(640, 5.0)  # nothing new arrived
+
+    assert clock.time_of(0) == 1.0
+    assert clock.time_of(319) == 1.0
+    assert clock.time_of(320) == 1.01
+    assert clock.time_of(640) is None
+
+    clock.forget(320)
+    assert len(clock) == 1
+    assert clock.time_of(400) == 1.01
+
+
+def test_input_clock_window_bounds_memory():
+    """Test that entries far behind the newest input are dropped"""
+    clock = InputClock(window_bytes=320 * 100)
+    for i in range(1, 5000):
+        clock.record(i * 320, float(i))
+
+    assert len(clock) < 1200
+    assert clock.time_of(4998 * 320) == 4999.0
+
+
+def test_latency_distribution_percentiles():
+    """Test nearest-rank percentiles over the retained samples"""
+    distribution = LatencyDistribution(max_samples=100)
+    assert distribution.summary() is None
+
+    for value in range(1, 201):
+        distribution.add(value / 100)
+
+    summary = distribution.summary()
+    assert summary.count == 200
+    # only the latest 100 samples (1.01 to 2.00) are kept
+    assert summary.p50 == pytest.approx(1.50)
+    assert summary.p90 == pytest.approx(1.90)
+    assert summary.p99 == pytest.approx(1.99)
+    assert summary.max == pytest.approx(2.00)
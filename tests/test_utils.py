@@ -14,6 +14,8 @@
 
 """Tests for utility functions"""
 
+import json
+
 import pytest
 
 import sys
@@ -102,3 +104,53 @@ def test_create_translation_chat_message():
     assert "Bonjour le monde" in message.content
     assert "es" in message.content
     assert "Hola mundo" in message.content
+
+
+def test_audio_chunker_carries_partial_chunks():
+    """Test streaming chunking across pushes that do not align with chunk boundaries"""
+    audio_bytes = bytes(range(256)) * 25  # 6400 bytes = 200ms at 16kHz
+    chunker = utils.AudioChunker(chunk_duration_ms=20, sample_rate=16000)
+    assert chunker.chunk_size == 640
+
+    chunks = []
+    for i in range(0, len(audio_bytes), 1000):
+        chunks.extend(bytes(c) for c in chunker.push(audio_bytes[i : i + 1000]))
+
+    # every emitted chunk is full-sized; nothing is left over for 200ms of audio
+    assert all(len(c) == 640 for c in chunks)
+    assert b"".join(chunks) == audio_bytes
+    assert chunker.flush() is None
+
+
+def test_audio_chunker_flush_and_zero_copy():
+    """Test that whole chunks are views of the input and the tail is flushed"""
+    audio_bytes = b"\x01\x00" * 500
+    chunker = utils.AudioChunker(chunk_duration_ms=20, sample_rate=16000)
+
+    chunks = list(chunker.push(audio_bytes))
+    assert len(chunks) == 1
+    assert chunks[0].obj is audio_bytes
+    assert chunker.pending_bytes == 1000 - 640
+
+    tail = chunker.flush()
+    assert bytes(tail) == audio_bytes[640:]
+    assert chunker.pending_bytes == 0
+
+
+def test_stable_prefix():
+    """Test that only text agreed on by consecutive partials is streamed"""
+    assert utils.stable_prefix("", "hello") == ""
+    assert utils.stable_prefix("hello wor", "hello world") == "hello "
+    assert utils.stable_prefix("hello world", "hello world") == "hello world"
+    assert utils.stable_prefix("hello there", "help me") == ""
+    # no word boundaries to respect in text written without spaces
+    assert utils.stable_prefix("你好世", "你好世界") == "你好世"
+
+
+def test_word_span():
+    """Test that word timestamps are read from recognition and translation result JSON"""
+    words = [{"Word": "hello", "Offset": 500, "Duration": 300}, {"Word": "there", "Offset": 900, "Duration": 400}]
+    assert utils.word_span('{"NBest": [{"Words": %s}]}' % json.dumps(words)) == (500, 1300)
+    assert utils.word_span('{"SpeechPhrase": {"NBest": [{"Words": %s}]}}' % json.dumps(words)) == (500, 1300)
+    assert utils.word_span('{"NBest": [{"Display": "hello"}]}') is None
+    assert utils.word_span("") is None
@@ -0,0 +1,90 @@
+# Copyright 2024 LiveKit, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for voice activity gating of input audio"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "livekit-plugins", "livekit-plugins-azure"))
+
+from livekit.plugins.azure.realtime.vad import EnergyVAD, VADGate, VoiceActivityDetector
+
+# 10 ms frames at 16 kHz
+_SILENCE = b"\x00\x00" * 160
+_SPEECH = (2000).to_bytes(2, "little", signed=True) * 160
+
+
+def _gate(**kwargs):
+    kwargs.setdefault("hangover_ms", 20)
+    kwargs.setdefault("preroll_ms", 20)
+    return VADGate(EnergyVAD(), sample_rate=16000, **kwargs)
+
+
+def test_energy_vad_threshold():
+    """Test that the energy detector separates loud frames from silence"""
+    vad = EnergyVAD(threshold=500)
+    assert isinstance(vad, VoiceActivityDetector)
+    assert vad.is_speech(memoryview(_SPEECH), 16000)
+    assert not vad.is_speech(memoryview(_SILENCE), 16000)
+
+
+def test_gate_sends_preroll_before_onset():
+    """Test that silence is withheld and the latest pre-roll precedes speech"""
+    gate = _gate()
+    marked = [i.to_bytes(2, "little") * 160 for i in range(3)]  # quiet frames told apart by content
+
+    for frame in marked:
+        assert gate.process(frame) == ([], False)
+    assert not gate.is_open
+
+    out, resumed = gate.process(_SPEECH)
+    assert resumed
+    assert out == [marked[1], marked[2], _SPEECH]
+
+    stats = gate.stats()
+    assert stats.input_duration == pytest.approx(0.04)
+    assert stats.gated_duration == pytest.approx(0.01)
+    assert stats.gated_ratio == pytest.approx(0.25)
+    assert stats.cpu_time >= 0.0
+
+
+def test_gate_hangover_keeps_trailing_silence():
+    """Test that the gate stays open for the hangover after speech"""
+    gate = _gate(hangover_ms=20)
+    gate.process(_SPEECH)
+
+    assert gate.process(_SILENCE) == ([_SILENCE], False)
+    assert gate.process(_SILENCE) == ([_SILENCE], False)
+    assert gate.process(_SILENCE) == ([], False)
+    assert not gate.is_open
+
+    # speech inside the hangover restarts it
+    gate.process(_SPEECH)
+    gate.process(_SILENCE)
+    assert gate.process(_SPEECH) == ([_SPEECH], False)
+    assert gate.is_open
+
+
+def test_gate_accepts_custom_detector():
+    """Test that any object with is_speech can drive the gate"""
+
+    class Always:
+        def is_speech(self, data, sample_rate):
+            return True
+
+    gate = VADGate(Always(), sample_rate=16000)
+    assert gate.process(_SILENCE) == ([_SILENCE], True)
+    assert gate.stats().gated_ratio == 0.0